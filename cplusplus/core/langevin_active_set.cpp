@@ -0,0 +1,213 @@
+/**
+ * @file langevin_active_set.cpp
+ * @brief Methods to track the grid blocks that need integrating.
+ */
+
+#include <algorithm>
+#include "langevin_types.hpp"
+#include "langevin_active_set.hpp"
+#include "langevin_base.hpp"
+
+//! Wire each block to the distinct other blocks containing neighbors
+//! of its cells, and record which blocks contain boundary cells
+void ActiveSet::build(
+    const grid_wiring_t& grid_wiring, const int_vec_t& boundary_cells
+)
+{
+    n_cells = grid_wiring.size();
+    n_blocks = (n_cells+block_size-1)/block_size;
+    index_vec_t neighbor_blocks;
+    auto wire_blocks = [&]()
+    {
+        for (auto i_block=0; i_block<n_blocks; i_block++)
+        {
+            neighbor_blocks.clear();
+            for (auto i=block_begin(i_block); i<block_end(i_block); i++)
+            {
+                for (auto j=grid_wiring.begin(i); j<grid_wiring.end(i); j++)
+                {
+                    const int j_block = *j/block_size;
+                    if (j_block!=i_block) { neighbor_blocks.push_back(j_block); }
+                }
+            }
+            std::sort(neighbor_blocks.begin(), neighbor_blocks.end());
+            const auto end = std::unique(
+                neighbor_blocks.begin(), neighbor_blocks.end()
+            );
+            for (auto j_block=neighbor_blocks.begin(); j_block<end; j_block++)
+            {
+                block_wiring.connect(i_block, *j_block);
+            }
+        }
+    };
+    block_wiring.start(n_blocks);
+    wire_blocks();
+    block_wiring.allocate();
+    wire_blocks();
+    block_wiring.finish();
+
+    boundary_blocks.clear();
+    for (const auto& i : boundary_cells)
+    {
+        boundary_blocks.push_back(i/block_size);
+    }
+    std::sort(boundary_blocks.begin(), boundary_blocks.end());
+    boundary_blocks.erase(
+        std::unique(boundary_blocks.begin(), boundary_blocks.end()),
+        boundary_blocks.end()
+    );
+    active_blocks.clear();
+    ranges.clear();
+    visit_stamps.assign(n_blocks, 0);
+    stamp = 0;
+    is_stale = true;
+}
+
+//! Nonzero density can only lie in blocks that were active over the last
+//! step, or in blocks where boundary conditions have since set values;
+//! so only these blocks need checking, unless the set is stale.
+void ActiveSet::update(
+    const grid_t& grid, const int n_hops, index_vec_t& deactivated_blocks
+)
+{
+    if (stamp>=UINT32_MAX-2)
+    {
+        std::fill(visit_stamps.begin(), visit_stamps.end(), 0);
+        stamp = 0;
+    }
+    const std::uint32_t checked_stamp = ++stamp;
+    const std::uint32_t active_stamp = ++stamp;
+    index_vec_t frontier;
+    auto check_block = [&](const int i_block)
+    {
+        if (visit_stamps[i_block]==checked_stamp
+            or visit_stamps[i_block]==active_stamp) { return; }
+        visit_stamps[i_block] = checked_stamp;
+        for (auto i=block_begin(i_block); i<block_end(i_block); i++)
+        {
+            if (grid[i]!=0.0)
+            {
+                visit_stamps[i_block] = active_stamp;
+                frontier.push_back(i_block);
+                return;
+            }
+        }
+    };
+    index_vec_t previous_blocks;
+    if (is_stale)
+    {
+        previous_blocks.resize(n_blocks);
+        for (auto i_block=0; i_block<n_blocks; i_block++)
+        {
+            previous_blocks[i_block] = i_block;
+        }
+        is_stale = false;
+    }
+    else
+    {
+        previous_blocks.swap(active_blocks);
+    }
+    for (const auto& i_block : previous_blocks) { check_block(i_block); }
+    for (const auto& i_block : boundary_blocks) { check_block(i_block); }
+
+    // Dilate the nonzero blocks breadth-first
+    active_blocks = frontier;
+    index_vec_t next_frontier;
+    for (auto i_hop=0; i_hop<n_hops; i_hop++)
+    {
+        next_frontier.clear();
+        for (const auto& i_block : frontier)
+        {
+            for (
+                auto j=block_wiring.begin(i_block);
+                j<block_wiring.end(i_block);
+                j++
+            )
+            {
+                if (visit_stamps[*j]==active_stamp) { continue; }
+                visit_stamps[*j] = active_stamp;
+                next_frontier.push_back(*j);
+            }
+        }
+        active_blocks.insert(
+            active_blocks.end(), next_frontier.begin(), next_frontier.end()
+        );
+        frontier.swap(next_frontier);
+    }
+    std::sort(active_blocks.begin(), active_blocks.end());
+
+    deactivated_blocks.clear();
+    for (const auto& i_block : previous_blocks)
+    {
+        if (visit_stamps[i_block]!=active_stamp)
+        {
+            deactivated_blocks.push_back(i_block);
+        }
+    }
+
+    // Merge runs of consecutive active blocks into cell-index ranges
+    ranges.clear();
+    for (const auto& i_block : active_blocks)
+    {
+        if (not ranges.empty() and ranges.back()==block_begin(i_block))
+        {
+            ranges.back() = block_end(i_block);
+        }
+        else
+        {
+            ranges.push_back(block_begin(i_block));
+            ranges.push_back(block_end(i_block));
+        }
+    }
+}
+
+//! If requested, wire up the grid blocks for active-set tracking, noting
+//! which blocks boundary conditions may set to nonzero values;
+//! otherwise, treat the whole grid as a single active range
+void BaseLangevin::prepare_active_set(const Parameters p)
+{
+    do_active_set = p.do_active_set;
+    if (not do_active_set)
+    {
+        active_set.n_cells = n_cells;
+        active_set.ranges = {0, n_cells};
+        return;
+    }
+    int_vec_t boundary_cells;
+    if (has_boundary_source(p))
+    {
+        auto i_from_xy = [&](int x, int y) -> int { return x + y*p.n_x; };
+        for (auto x=0; x<p.n_x; x++)
+        {
+            boundary_cells.push_back(i_from_xy(x, 0));
+            boundary_cells.push_back(i_from_xy(x, p.n_y-1));
+        }
+        for (auto y=0; y<p.n_y; y++)
+        {
+            boundary_cells.push_back(i_from_xy(0, y));
+            boundary_cells.push_back(i_from_xy(p.n_x-1, y));
+        }
+    }
+    active_set.build(grid_wiring, boundary_cells);
+}
+
+//! Find the grid blocks to integrate over the coming step, and zero 
+//! the intermediate Runge-Kutta grids in blocks no longer integrated, 
+//! since neighbor sums of active cells may read them
+void BaseLangevin::update_active_set(const int n_hops)
+{
+    if (not do_active_set) { return; }
+    active_set.update(density_grid, n_hops, deactivated_blocks);
+    for (const auto& i_block : deactivated_blocks)
+    {
+        for (
+            auto i=active_set.block_begin(i_block);
+            i<active_set.block_end(i_block);
+            i++
+        )
+        {
+            aux_grid1[i] = 0.0;
+            aux_grid2[i] = 0.0;
+        }
+    }
+}
@@ -0,0 +1,72 @@
+/**
+ * @file langevin_active_set.hpp
+ * @brief Tracking of the grid blocks that need integrating.
+ *
+ * DP has an absorbing state: a cell whose density and whose neighbors'
+ * densities are all exactly zero has a zero deterministic RHS and a zero
+ * Poisson mean, and so stays exactly zero over an integration step without
+ * consuming any random numbers. Near or below criticality most of the grid
+ * is in this state, and only cells near nonzero density need visiting.
+ *
+ * The grid is divided into blocks of `block_size` consecutive cells,
+ * and the block-level neighbor topology is derived from the grid wiring.
+ * Before each integration step, the blocks holding nonzero density are found
+ * and dilated by as many block-neighbor hops as the integration scheme
+ * spreads density over cell-neighbor hops (one per RHS evaluation).
+ * Only the resulting active blocks are integrated, which gives results
+ * identical to integrating the whole grid.
+ */
+
+#ifndef ACTIVE_SET_HPP
+#define ACTIVE_SET_HPP
+
+#include <algorithm>
+#include <cstdint>
+#include <vector>
+#include "langevin_types.hpp"
+
+/**
+ * @brief Set of grid blocks that may hold nonzero density after a step.
+ */
+struct ActiveSet
+{
+    //! Number of consecutive grid cells per block
+    static const int block_size = 32;
+    //! Total number of grid cells
+    int n_cells = 0;
+    //! Total number of blocks
+    int n_blocks = 0;
+    //! Neighbor topology of the blocks
+    GridWiring block_wiring;
+    //! Blocks containing grid-edge cells which boundary conditions may set
+    index_vec_t boundary_blocks;
+    //! Sorted indexes of the active blocks
+    index_vec_t active_blocks;
+    //! Active cell-index ranges as [begin, end) pairs, sorted and disjoint
+    int_vec_t ranges;
+    //! Flag whether the whole grid must be rescanned (e.g. after initialization)
+    bool is_stale = true;
+
+    //! Derive block topology from the grid wiring; note boundary-cell blocks
+    void build(const grid_wiring_t& grid_wiring, const int_vec_t& boundary_cells);
+    //! Find the nonzero blocks of `grid`, dilate them by `n_hops` block hops,
+    //! and list the blocks thereby deactivated in `deactivated_blocks`
+    void update(
+        const grid_t& grid, const int n_hops, index_vec_t& deactivated_blocks
+    );
+    //! Index of first cell in a block
+    int block_begin(const int i_block) const { return i_block*block_size; }
+    //! Index past last cell in a block
+    int block_end(const int i_block) const
+    {
+        return std::min((i_block+1)*block_size, n_cells);
+    }
+
+private:
+    //! Per-block marker of the latest update to have visited a block
+    std::vector<std::uint32_t> visit_stamps;
+    //! Stamp for the current update
+    std::uint32_t stamp = 0;
+};
+
+#endif
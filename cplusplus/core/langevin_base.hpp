@@ -8,6 +8,22 @@
 
 #include "langevin_coefficients.hpp"
 #include "langevin_parameters.hpp"
+#include "langevin_active_set.hpp"
+#include "langevin_moments.hpp"
+
+/**
+ * @brief Evolving state of a Langevin integrator, read from a checkpoint
+ * but not yet adopted.
+ */
+struct IntegratorState
+{
+    //! Density field grid
+    grid_t density_grid;
+    //! Mean density of the grid
+    double mean_density = 0.0;
+    //! RNG streams of grid chunks #1 onwards
+    std::vector<rng_t> chunk_rngs;
+};
 
 /**
  * @brief Base class for Langevin equation integrator.
@@ -17,6 +33,30 @@ class BaseLangevin
 protected:
     //! Total number of cells in n-D grid
     int n_cells;
+    //! Dimension of the grid, used to choose a stencil
+    GridDimension grid_dimension;
+    //! Number of cells along x
+    int n_x;
+    //! Number of cells along y
+    int n_y;
+    //! Number of threads used to integrate; 1 means serial integration
+    int n_threads = 1;
+    //! Cell-index bounds of the contiguous grid chunks integrated in parallel
+    int_vec_t chunk_bounds;
+    //! Independent RNG streams for chunks #1 onwards (chunk #0 uses main RNG)
+    std::vector<rng_t> chunk_rngs;
+    //! Flag whether to integrate only the active set of grid blocks
+    bool do_active_set = false;
+    //! Grid blocks, and cell ranges, to integrate; whole grid if not tracked
+    ActiveSet active_set;
+    //! Blocks deactivated by the latest active-set update
+    index_vec_t deactivated_blocks;
+    //! Choice of RNG for the stochastic step: sequential or counter-based
+    RandomGenerator random_generator = RandomGenerator::MERSENNE_TWISTER;
+    //! RNG seed, used as the key of the counter-based RNG
+    std::uint32_t random_seed = 0;
+    //! Index of the epoch being integrated, used as a counter-based RNG key
+    std::uint64_t i_epoch = 0;
     //! Density field grid
     grid_t density_grid;
      //! Neighorhood topology for all grid cells
@@ -28,11 +68,22 @@ protected:
     double dx;
     //! Grid-average of density field
     double mean_density;
+    //! Flag whether to compute grid moments beyond the mean at every step
+    bool do_moments = false;
+    //! Moments of the density field after the latest step
+    GridMoments grid_moments;
+    //! Partial sums of density over aligned blocks of grid cells
+    dbl_vec_t block_sums;
+    //! Partial sums of squared density over aligned blocks of grid cells
+    dbl_vec_t block_sum_sqs;
+    //! Partial sums of density × squared seed distance over grid blocks
+    dbl_vec_t block_sum_r2s;
+    //! Scratch space for the pairwise summation of block partial sums
+    dbl_vec_t pairwise_scratch;
+    //! Squared distance of each grid cell from the seed, allowing for 
+    //! periodic wrapping: empty unless spreading is tracked
+    dbl_vec_t seed_squared_distances;
 
-    //! Function generating Poisson variates
-    poisson_dist_t poisson_sampler;
-    //! Function generating gamma variates
-    gamma_dist_t gamma_sampler;
     //! Function generating normal variates
     gaussian_dist_t gaussian_sampler;
 
@@ -56,6 +107,39 @@ protected:
     //! Temporary density grid used to perform an integration step
     grid_t aux_grid2;
 
+    //! Split the grid into per-thread chunks, each with its own RNG stream
+    void partition_grid(const Parameters parameters);
+    //! Set up tracking of the active grid blocks, if requested
+    void prepare_active_set(const Parameters parameters);
+    //! Update the active grid blocks before a step spreading `n_hops` cells
+    void update_active_set(const int n_hops);
+    //! Apply `f(i_chunk, i_begin, i_end)` to every active range of every 
+    //! grid chunk, in parallel over chunks
+    template <class F>
+    void for_each_chunk(F f) const;
+    //! Dornic stochastic step applied to a grid + grid-mean density update
+    void stochastic_step(grid_t& grid, rng_t& rng);
+    //! Sum a block of grid cells directly, as a stochastic step would
+    GridMoments sum_block(const grid_t& grid, const int i_block) const;
+    //! Add up the block partial sums pairwise into the grid moments
+    void reduce_block_sums();
+    //! Runge-Kutta kernel specialized by neighbor-sum stencil & RHS functor
+    template <class Stencil, class RHS>
+    void integrate_rungekutta_kernel(
+        const Stencil& stencil, const RHS& rhs, rng_t& rng
+    );
+    //! Explicit-Euler kernel specialized by neighbor-sum stencil & RHS functor
+    template <class Stencil, class RHS>
+    void integrate_euler_kernel(
+        const Stencil& stencil, const RHS& rhs, rng_t& rng
+    );
+    //! Runge-Kutta integration using the lattice stencil matching the grid
+    template <class RHS>
+    void integrate_rungekutta_stencil(const RHS& rhs, rng_t& rng);
+    //! Explicit-Euler integration using the lattice stencil matching the grid
+    template <class RHS>
+    void integrate_euler_stencil(const RHS& rhs, rng_t& rng);
+
 public:
     //! Default constructor
     BaseLangevin() = default;
@@ -71,13 +155,36 @@ public:
     void prepare(const Coefficients& coefficients);
     //! Check we have 2N boundary conditions for an N-dimensional grid
     bool check_boundary_conditions(const Parameters parameters);
+    //! Check whether boundary conditions can reinject density into the grid
+    bool has_boundary_source(const Parameters parameters) const;
     //! Set density field values only the grid edges per bc specs
     void apply_boundary_conditions(const Parameters parameters, int i_epoch);
     //! Runge-Kutta + stochastic integration + grid update
-    void integrate_rungekutta(rng_t& rng);
+    virtual void integrate_rungekutta(rng_t& rng);
     //! Explicit Euler + stochastic integration + grid update
-    void integrate_euler(rng_t& rng);
+    virtual void integrate_euler(rng_t& rng);
+    //! Set the index of the epoch about to be integrated
+    void set_epoch(const int i_epoch);
+    //! Choose whether to compute grid moments beyond the mean at every step
+    void set_do_moments(const bool do_moments);
+    //! Precompute the squared distances of all grid cells from the seed
+    bool prepare_seed_distances(const Parameters p);
+    //! Compute the grid moments of the current density field from scratch
+    void measure_grid_moments();
+    //! Expose the grid moments of the density field
+    const GridMoments& get_grid_moments() const;
+    //! Write the evolving state of the integrator to a binary stream
+    void save_state(std::ostream& stream) const;
+    //! Read the evolving state of an integrator with parameters `p` 
+    //! from a binary stream, without adopting it
+    static bool read_state(
+        std::istream& stream, const Parameters p, IntegratorState& state
+    );
+    //! Adopt an evolving state read by `read_state`
+    void adopt_state(IntegratorState& state);
     double get_density_grid_value(const int) const;
+    //! Expose the density field grid buffer
+    const grid_t& get_density_grid() const;
     //! Expose mean density
     double get_mean_density() const;
     //! Compute Poisson RNG mean
@@ -22,6 +22,25 @@ bool BaseLangevin::check_boundary_conditions(const Parameters p)
     }
 }
 
+//! Check whether any boundary condition can set a grid-edge cell to a
+//! nonzero density, and thus lift the grid out of the absorbing state:
+//! only positive fixed values or positive fluxes can; and, since 
+//! boundary conditions are only applied to 2d grids so far, only in 2d
+bool BaseLangevin::has_boundary_source(const Parameters p) const
+{
+    if (p.grid_dimension!=GridDimension::D2) { return false; }
+    for (auto i_edge=0; i_edge<p.boundary_conditions.size(); i_edge++)
+    {
+        const auto bc = p.boundary_conditions.at(i_edge);
+        if (
+            (bc==BoundaryCondition::FIXED_VALUE 
+                or bc==BoundaryCondition::FIXED_FLUX)
+            and p.bc_values.at(i_edge)>0
+        ) { return true; }
+    }
+    return false;
+}
+
 //! Apply boundary conditions along each edge in turn 
 void BaseLangevin::apply_boundary_conditions(const Parameters p, int i_epoch)
 {
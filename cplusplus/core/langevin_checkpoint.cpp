@@ -0,0 +1,66 @@
+/**
+ * @file langevin_checkpoint.cpp
+ * @brief Save & restore the evolving state of the Langevin integrator.
+ */
+
+#include <algorithm>
+#include "langevin_types.hpp"
+#include "langevin_base.hpp"
+#include "langevin_checkpoint.hpp"
+
+//! Write the state that carries over from one integration step to the next:
+//! the density grid, its mean, and the RNG streams of grid chunks #1 onwards
+//! (the main RNG, which chunk #0 draws from, is owned by the caller).
+//! The Runge-Kutta grids need not be saved, being rewritten on every step
+//! wherever they are read.
+void BaseLangevin::save_state(std::ostream& stream) const
+{
+    write_vector(stream, density_grid);
+    write_value(stream, mean_density);
+    write_value(stream, static_cast<std::uint64_t>(chunk_rngs.size()));
+    for (const auto& chunk_rng : chunk_rngs) { write_rng(stream, chunk_rng); }
+}
+
+//! Read the state written by `save_state`, provided it is that of a grid 
+//! of the size given by parameters `p`, partitioned into as many chunks 
+//! (one per thread). Nothing is adopted, so the state can be read and 
+//! checked before the integrator to adopt it is even set up.
+bool BaseLangevin::read_state(
+    std::istream& stream, const Parameters p, IntegratorState& state
+)
+{
+    state.density_grid.assign(p.n_cells, 0.0);
+    std::uint64_t n_chunk_rngs;
+    if (
+        not read_vector(stream, state.density_grid)
+        or not read_value(stream, state.mean_density)
+        or not read_value(stream, n_chunk_rngs) 
+        or n_chunk_rngs!=static_cast<std::uint64_t>(std::max(p.n_threads, 1)-1)
+    ) 
+    { 
+        return false; 
+    }
+    state.chunk_rngs.assign(n_chunk_rngs, rng_t());
+    for (auto& chunk_rng : state.chunk_rngs)
+    {
+        if (not read_rng(stream, chunk_rng)) { return false; }
+    }
+    return true;
+}
+
+//! Adopt a state read by `read_state` for a grid of the same size, 
+//! partitioned into the same number of chunks. The grid is overwritten 
+//! in place, so views of it stay valid.
+//! The active set, if tracked, is marked stale, so that the next update 
+//! rescans the whole grid: it then finds the same active blocks as 
+//! in the uninterrupted integration.
+void BaseLangevin::adopt_state(IntegratorState& state)
+{
+    std::copy(
+        state.density_grid.begin(), state.density_grid.end(), 
+        density_grid.begin()
+    );
+    mean_density = state.mean_density;
+    chunk_rngs = std::move(state.chunk_rngs);
+    active_set.is_stale = true;
+}
@@ -0,0 +1,87 @@
+/**
+ * @file langevin_checkpoint.hpp
+ * @brief Binary (de)serialization of integrator and simulation state.
+ *
+ * The state of a simulation is written as a flat binary record:
+ * scalars and grids as raw bytes, each vector preceded by its length, and
+ * Mersenne Twister RNG states in their standard text form, also preceded
+ * by their length. Values are written in native byte order, so
+ * a checkpoint is meant to be restored on the same kind of machine.
+ */
+
+#ifndef CHECKPOINT_HPP
+#define CHECKPOINT_HPP
+
+#include <cstdint>
+#include <istream>
+#include <ostream>
+#include <sstream>
+#include <string>
+#include "langevin_types.hpp"
+
+//! Tag at the head of every checkpoint record
+const std::string checkpoint_magic = "DPLVNCKP";
+//! Version of the checkpoint record layout
+const int checkpoint_format = 2;
+
+//! Write a scalar as raw bytes
+template <class T>
+inline void write_value(std::ostream& stream, const T& value)
+{
+    stream.write(reinterpret_cast<const char*>(&value), sizeof(T));
+}
+
+//! Read a scalar written by `write_value`
+template <class T>
+inline bool read_value(std::istream& stream, T& value)
+{
+    stream.read(reinterpret_cast<char*>(&value), sizeof(T));
+    return static_cast<bool>(stream);
+}
+
+//! Write a vector of doubles, preceded by its length
+inline void write_vector(std::ostream& stream, const dbl_vec_t& vector)
+{
+    write_value(stream, static_cast<std::uint64_t>(vector.size()));
+    stream.write(
+        reinterpret_cast<const char*>(vector.data()),
+        vector.size()*sizeof(double)
+    );
+}
+
+//! Read a vector of doubles written by `write_vector` into `vector`,
+//! in place, provided its length is unchanged: so that views of the vector
+//! buffer stay valid
+inline bool read_vector(std::istream& stream, dbl_vec_t& vector)
+{
+    std::uint64_t size;
+    if (not read_value(stream, size) or size!=vector.size()) { return false; }
+    stream.read(
+        reinterpret_cast<char*>(vector.data()), vector.size()*sizeof(double)
+    );
+    return static_cast<bool>(stream);
+}
+
+//! Write the state of an RNG, preceded by its length
+inline void write_rng(std::ostream& stream, const rng_t& rng)
+{
+    std::ostringstream rng_stream;
+    rng_stream << rng;
+    const std::string rng_state = rng_stream.str();
+    write_value(stream, static_cast<std::uint64_t>(rng_state.size()));
+    stream.write(rng_state.data(), rng_state.size());
+}
+
+//! Read the state of an RNG written by `write_rng`
+inline bool read_rng(std::istream& stream, rng_t& rng)
+{
+    std::uint64_t size;
+    if (not read_value(stream, size)) { return false; }
+    std::string rng_state(size, '\0');
+    if (not stream.read(rng_state.data(), size)) { return false; }
+    std::istringstream rng_stream(rng_state);
+    rng_stream >> rng;
+    return not rng_stream.fail();
+}
+
+#endif
@@ -3,20 +3,116 @@
  * @brief Wrapper around 1D or 2D grid construction methods.
  */
 
+#include <cstdlib>
 #include "langevin_types.hpp"
 #include "langevin_base.hpp"
 
 bool BaseLangevin::construct_grid(const Parameters p)
 {
+    bool did_construct;
     switch (p.grid_dimension)
     {
         case (GridDimension::D1):
-            return construct_1D_grid(p);
+            did_construct = construct_1D_grid(p);
+            break;
         case (GridDimension::D2):
-            return construct_2D_grid(p);
+            did_construct = construct_2D_grid(p);
+            break;
         case (GridDimension::D3):
             return false; // NYI
         default:
             return false;
     }    
-}
\ No newline at end of file
+    if (did_construct) 
+    { 
+        partition_grid(p);
+        prepare_active_set(p);
+    }
+    return did_construct;
+}
+
+//! Split the grid into one chunk of whole rows per thread, 
+//! and seed an independent RNG stream for each chunk after the first.
+//! Chunk #0 draws from the main RNG, so that serial integration is unchanged.
+//! Chunks, not threads, own the RNG streams: results are reproducible 
+//! for a given seed and thread count however the chunks are scheduled.
+//! Also allocate the block partial sums used to reduce the grid moments.
+void BaseLangevin::partition_grid(const Parameters p)
+{
+    n_threads = std::max(p.n_threads, 1);
+    const int row_length = (p.grid_dimension==GridDimension::D1) ? 1 : n_x;
+    const int n_rows = n_cells / row_length;
+    chunk_bounds = int_vec_t(n_threads+1, 0);
+    for (auto i_chunk=0; i_chunk<=n_threads; i_chunk++)
+    {
+        chunk_bounds[i_chunk] = (i_chunk*n_rows/n_threads)*row_length;
+    }
+    random_generator = p.random_generator;
+    random_seed = static_cast<std::uint32_t>(p.random_seed);
+    chunk_rngs.clear();
+    for (auto i_chunk=1; i_chunk<n_threads; i_chunk++)
+    {
+        std::seed_seq seed_sequence{p.random_seed, i_chunk};
+        chunk_rngs.emplace_back(seed_sequence);
+    }
+    const int n_blocks = (n_cells+moments_block_size-1)/moments_block_size;
+    block_sums.assign(n_blocks, 0.0);
+    block_sum_sqs.assign(n_blocks, 0.0);
+    block_sum_r2s.assign(n_blocks, 0.0);
+    seed_squared_distances.clear();
+}
+
+//! Precompute the squared distance of every grid cell from the single seed
+//! of the initial condition, so that the stochastic step can sum the mean
+//! squared radius of spreading at little cost. Distances are in units of Δx 
+//! scaled to real length, and are measured the short way around periodic
+//! axes, so that a cloud spreading across a periodic edge is not taken to be
+//! a grid-length wide. Returns false unless the initial condition is a
+//! single seed on a 1d or 2d grid.
+bool BaseLangevin::prepare_seed_distances(const Parameters p)
+{
+    if (p.initial_condition!=InitialCondition::SINGLE_SEED) { return false; }
+    // Distance along one axis, the short way round if periodic
+    auto axis_distance = [&](
+        const int x, const int x_seed, const int n, const GridTopology topology
+    )
+    {
+        const int distance = std::abs(x-x_seed);
+        return (topology==GridTopology::PERIODIC) 
+            ? std::min(distance, n-distance) : distance;
+    };
+    seed_squared_distances.assign(n_cells, 0.0);
+    const double dx_sq = p.dx*p.dx;
+    const int x_seed = static_cast<int>(p.ic_values.at(1));
+    if (p.grid_dimension==GridDimension::D1)
+    {
+        for (auto x=0; x<p.n_x; x++)
+        {
+            const int r_x = axis_distance(
+                x, x_seed, p.n_x, p.grid_topologies.at(0)
+            );
+            seed_squared_distances[x] = r_x*r_x*dx_sq;
+        }
+        return true;
+    }
+    else if (p.grid_dimension==GridDimension::D2)
+    {
+        const int y_seed = static_cast<int>(p.ic_values.at(2));
+        for (auto y=0; y<p.n_y; y++)
+        {
+            const int r_y = axis_distance(
+                y, y_seed, p.n_y, p.grid_topologies.at(1)
+            );
+            for (auto x=0; x<p.n_x; x++)
+            {
+                const int r_x = axis_distance(
+                    x, x_seed, p.n_x, p.grid_topologies.at(0)
+                );
+                seed_squared_distances[x + y*p.n_x] = (r_x*r_x+r_y*r_y)*dx_sq;
+            }
+        }
+        return true;
+    }
+    seed_squared_distances.clear();
+    return false;
+}
@@ -10,34 +10,56 @@
 bool BaseLangevin::construct_1D_grid(const Parameters p)
 {
     const auto n_x = p.n_x;
-    grid_wiring = grid_wiring_t(n_x, neighborhood_t(2));
+    grid_dimension = p.grid_dimension;
+    this->n_x = n_x;
+    this->n_y = 1;
 
-    // Everywhere except the grid ends
-    for (auto i=1; i<n_x-1; i++)
-    {
-        // Each cell has a L and R neighbor whose indexes are specified here
-        grid_wiring[i][0] = i-1;
-        grid_wiring[i][1] = i+1;
-    }
+    const auto grid_topology = p.grid_topologies.at(0);
+    if (
+        grid_topology!=GridTopology::PERIODIC 
+        and grid_topology!=GridTopology::BOUNDED
+    ) { return false; }
 
-    // Grid ends
-    switch (p.grid_topologies.at(0))
+    auto wire_cells = [&]()
     {
-        case GridTopology::PERIODIC:
+        // Left grid end
+        if (grid_topology==GridTopology::PERIODIC)
+        {
             // Each end cell neighbor is the other end cell, so wrap the indexes
-            grid_wiring[0][0] = n_x-1;      // left-end left
-            grid_wiring[0][1] = 1;          // left-end right
-            grid_wiring[n_x-1][0] = n_x-2;  // right-end left VMB: [n_x-1][0] = n_x-2;
-            grid_wiring[n_x-1][1] = 0;      // right-end right
-            return true;
-            
-        case GridTopology::BOUNDED:
+            grid_wiring.connect(0, n_x-1);      // left-end left
+            grid_wiring.connect(0, 1);          // left-end right
+        }
+        else
+        {
             // Link each end cell to its adjacent cell only
-            grid_wiring[0] = neighborhood_t(1, 1);
-            grid_wiring[n_x-1] = neighborhood_t(1, n_x-2);
-            return true;
+            grid_wiring.connect(0, 1);
+        }
+
+        // Everywhere except the grid ends
+        for (auto i=1; i<n_x-1; i++)
+        {
+            // Each cell has a L and R neighbor whose indexes are specified here
+            grid_wiring.connect(i, i-1);
+            grid_wiring.connect(i, i+1);
+        }
+
+        // Right grid end
+        if (grid_topology==GridTopology::PERIODIC)
+        {
+            grid_wiring.connect(n_x-1, n_x-2);  // right-end left
+            grid_wiring.connect(n_x-1, 0);      // right-end right
+        }
+        else
+        {
+            grid_wiring.connect(n_x-1, n_x-2);
+        }
+    };
 
-        default:
-            return false;
-    }
-}
\ No newline at end of file
+    // Count neighbors, then fill in the CSR wiring table
+    grid_wiring.start(n_x);
+    wire_cells();
+    grid_wiring.allocate();
+    wire_cells();
+    grid_wiring.finish();
+    return true;
+}
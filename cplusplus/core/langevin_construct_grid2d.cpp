@@ -28,20 +28,23 @@ bool BaseLangevin::construct_2D_grid(const Parameters p)
     // Shorthand
     const auto n_x = p.n_x;
     const auto n_y = p.n_y;
+    grid_dimension = p.grid_dimension;
+    this->n_x = n_x;
+    this->n_y = n_y;
 
-    // Flattened grid vector each with a vector of connection elements.
+    // Flattened grid of cells each with a list of connection elements,
+    // stored contiguously in a CSR table.
     // Each connection element will link to between 2 and 4 neighbor locations.
     // At central grid cell, there will be 4 connections.
     // Along periodic edges there will be 3 connection elements.
     // Along bounded edges there will be 2 connection elements.
     // At corners these sets will be reduced to 2-3 elements.
-    grid_wiring = grid_wiring_t(n_x*n_y, neighborhood_t(0));
 
     // Compute flattened grid vector index from coordinate
     auto i_from_xy = [&](int x, int y) -> int { return x + y*n_x; };
     
     // Connect two neighbor cells
-    auto connect_cells = [&](int i, int j){ grid_wiring.at(i).push_back(j); };
+    auto connect_cells = [&](int i, int j){ grid_wiring.connect(i, j); };
 
     // Central grid cells
     auto wire_central_cell = [&](int x, int y)
@@ -237,13 +240,24 @@ bool BaseLangevin::construct_2D_grid(const Parameters p)
         wire_corners(is_periodic_x_edge, is_periodic_y_edge);
     };
 
-    /////////////////////////////////////////////
+    // All grid cells
+    auto wire_cells = [&]()
+    {
+        // Step 1: Wire all the non-edge grid cells
+        wire_central_cells();
+        // Step 2: Wire grid edge cells according to topology specs
+        wire_edge_cells(p.grid_topologies);
+    };
 
-    // Step 1: Wire all the non-edge grid cells
-    wire_central_cells();
+    /////////////////////////////////////////////
 
-    // Step 2: Wire grid edge cells according to topology specs
-    wire_edge_cells(p.grid_topologies);
+    // Pass 1: count the neighbors of each cell
+    grid_wiring.start(n_x*n_y);
+    wire_cells();
+    // Pass 2: fill in the contiguous CSR neighbor table
+    grid_wiring.allocate();
+    wire_cells();
+    grid_wiring.finish();
 
     /////////////////////////////////////////////
 
@@ -60,4 +60,22 @@ enum class IntegrationMethod
     RUNGE_KUTTA = 2
 };
 
+//! Random number generator for the stochastic step: default is a sequential Mersenne Twister; can be counter-based Philox keyed on (seed, epoch, cell)
+enum class RandomGenerator
+{
+    MERSENNE_TWISTER = 1,
+    PHILOX = 2
+};
+
+//! Grid observable to record at every epoch, alongside the grid-mean density: mean squared density ⟨ρ²⟩; fraction of cells with ρ>0; survival (1 if ρ>0 anywhere, else 0); maximum density; total mass N=Σρ Δx^d; or mean squared radius R²=Σρr²/Σρ about the seed of a SINGLE_SEED sim
+enum class Observable
+{
+    MEAN_SQUARED_DENSITY = 1,
+    ACTIVE_FRACTION = 2,
+    SURVIVAL = 3,
+    MAX_DENSITY = 4,
+    TOTAL_MASS = 5,
+    SQUARED_RADIUS = 6
+};
+
 #endif
\ No newline at end of file
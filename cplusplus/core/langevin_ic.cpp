@@ -3,11 +3,15 @@
  * @brief Methods for setting up the initial condition of the Langevin model.
  */
 
+#include <algorithm>
 #include "langevin_types.hpp"
 #include "langevin_base.hpp"
 
 bool BaseLangevin::initialize_grid(const Parameters p, rng_t& rng)
 {
+    // Any active-set tracking must start with a scan of the whole grid
+    active_set.is_stale = true;
+
     // Set grid cells to have uniformly random values 
     // between min_value and max_value
     auto ic_random_uniform = [&](
@@ -45,9 +49,10 @@ bool BaseLangevin::initialize_grid(const Parameters p, rng_t& rng)
     };
 
     // Set all the grid cells to have same value
+    // (in place, so as not to invalidate any view of the grid buffer)
     auto ic_constant_value = [&](const double density_value)
     {
-        density_grid = grid_t(n_cells, density_value);
+        std::fill(density_grid.begin(), density_grid.end(), density_value);
         mean_density = density_value;
     };
 
@@ -0,0 +1,128 @@
+/**
+ * @file langevin_integrate_stochastic.cpp
+ * @brief Method to carry out the Dornic-type stochastic integration step.
+ */ 
+
+#include "langevin_types.hpp"
+#include "langevin_base.hpp"
+#include "langevin_kernels.hpp"
+#include "langevin_philox.hpp"
+#include "langevin_sampler.hpp"
+
+//! Replace each cell value by a Poisson-gamma variate (the Dornic stochastic
+//! step), and incrementally compute the grid-mean density, along with
+//! the other grid moments if requested.
+//! With the Mersenne Twister RNG, each grid chunk draws from its own RNG 
+//! stream; with the Philox RNG, each cell draws from a stream keyed on 
+//! (seed, epoch, cell), which makes the result independent of the number 
+//! of threads. 
+//! Each block of cells (see `langevin_moments.hpp`) is summed as soon as its
+//! densities are drawn, while it is still in cache, and the block sums are 
+//! then added pairwise. A block straddling two chunks is summed once both 
+//! chunks are done. Every block is summed by the same (out-of-line) 
+//! `sum_block`, so the block sums, and hence the mean, depend only on the 
+//! cell densities: they are deterministic for a given thread count, and 
+//! with the Philox RNG, independent of it. 
+void BaseLangevin::stochastic_step(grid_t& grid, rng_t& rng)
+{
+    const DornicSampler poisson_gamma(lambda_on_explcdt, lambda);
+    const int n_chunks = chunk_bounds.size()-1;
+    // Moments of the blocks swept whole by each chunk
+    std::vector<GridMoments> chunk_moments(n_chunks);
+    // Blocks only partly swept by each chunk
+    std::vector<int_vec_t> chunk_split_blocks(n_chunks);
+    // Blocks outside the active set, which aren't swept, hold zero density
+    std::fill(block_sums.begin(), block_sums.end(), 0.0);
+    std::fill(block_sum_sqs.begin(), block_sum_sqs.end(), 0.0);
+    std::fill(block_sum_r2s.begin(), block_sum_r2s.end(), 0.0);
+    auto sweep = [&](
+        auto draw, const int i_chunk, const int i_begin, const int i_end
+    )
+    {
+        // Carry on this chunk's running moments across its active ranges
+        // (in a local copy, so chunks don't share cache lines)
+        GridMoments moments = chunk_moments[i_chunk];
+        for (
+            auto i_block=i_begin/moments_block_size; 
+            i_block*moments_block_size<i_end; 
+            i_block++
+        )
+        {
+            const int block_begin = i_block*moments_block_size;
+            const int block_end 
+                = std::min(block_begin+moments_block_size, n_cells);
+            const int i_first = std::max(block_begin, i_begin);
+            const int i_last = std::min(block_end, i_end);
+            for (auto i=i_first; i<i_last; i++) { grid[i] = draw(i); }
+            if (i_first==block_begin and i_last==block_end)
+            {
+                const GridMoments block = sum_block(grid, i_block);
+                block_sums[i_block] = block.sum;
+                block_sum_sqs[i_block] = block.sum_sq;
+                block_sum_r2s[i_block] = block.sum_r2;
+                moments.n_active += block.n_active;
+                moments.max = std::max(moments.max, block.max);
+            }
+            else
+            {
+                chunk_split_blocks[i_chunk].push_back(i_block);
+            }
+        }
+        chunk_moments[i_chunk] = moments;
+    };
+    for_each_chunk(
+        [&](const int i_chunk, const int i_begin, const int i_end)
+        {
+            if (random_generator==RandomGenerator::PHILOX)
+            {
+                sweep(
+                    [&](const int i)
+                    {
+                        PhiloxStream cell_rng(random_seed, i_epoch, i);
+                        return poisson_gamma(grid[i], cell_rng);
+                    },
+                    i_chunk, i_begin, i_end
+                );
+            }
+            else
+            {
+                rng_t& chunk_rng = (i_chunk==0) ? rng : chunk_rngs[i_chunk-1];
+                sweep(
+                    [&](const int i) { return poisson_gamma(grid[i], chunk_rng); },
+                    i_chunk, i_begin, i_end
+                );
+            }
+        }
+    );
+    grid_moments = GridMoments();
+    for (const auto& moments : chunk_moments) 
+    { 
+        grid_moments.n_active += moments.n_active;
+        grid_moments.max = std::max(grid_moments.max, moments.max);
+    }
+    // A block may be split between chunks, or between active ranges:
+    // sum each such block just once
+    int_vec_t split_blocks;
+    for (const auto& chunk_split_blocks_ : chunk_split_blocks)
+    {
+        split_blocks.insert(
+            split_blocks.end(), 
+            chunk_split_blocks_.begin(), chunk_split_blocks_.end()
+        );
+    }
+    std::sort(split_blocks.begin(), split_blocks.end());
+    split_blocks.erase(
+        std::unique(split_blocks.begin(), split_blocks.end()), 
+        split_blocks.end()
+    );
+    for (const auto& i_block : split_blocks)
+    {
+        const GridMoments block = sum_block(grid, i_block);
+        block_sums[i_block] = block.sum;
+        block_sum_sqs[i_block] = block.sum_sq;
+        block_sum_r2s[i_block] = block.sum_r2;
+        grid_moments.n_active += block.n_active;
+        grid_moments.max = std::max(grid_moments.max, block.max);
+    }
+    reduce_block_sums();
+}
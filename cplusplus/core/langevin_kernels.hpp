@@ -0,0 +1,213 @@
+/**
+ * @file langevin_kernels.hpp
+ * @brief Templated Runge-Kutta & Euler integration kernels.
+ *
+ * The kernels are templated on a neighbor-sum stencil and on a functor
+ * giving the local nonlinear RHS of the Langevin equation,
+ * `rhs(grid, i_cell, neighbor_sum, n_neighbors)`,
+ * so that no virtual call or wiring walk is needed per cell on a regular
+ * lattice, and the deterministic updates can be inlined and vectorized.
+ */
+
+#ifndef KERNELS_HPP
+#define KERNELS_HPP
+
+#include "langevin_types.hpp"
+#include "langevin_stencils.hpp"
+#include "langevin_base.hpp"
+
+/**
+ * @brief Adaptor to integrate via the virtual `nonlinear_rhs` method.
+ */
+struct VirtualRHS
+{
+    const BaseLangevin& langevin;
+
+    VirtualRHS(const BaseLangevin& langevin) : langevin(langevin) {}
+
+    double operator()(
+        const grid_t& grid, const int i_cell, const double, const int
+    ) const
+    {
+        return langevin.nonlinear_rhs(i_cell, grid);
+    }
+};
+
+//! Apply `f(i_chunk, i_begin, i_end)` to the active cell ranges of every 
+//! grid chunk, clipped to the chunk and in index order within each chunk:
+//! in parallel using OpenMP if available and more than one thread is requested
+template <class F>
+void BaseLangevin::for_each_chunk(F f) const
+{
+    const int n_chunks = chunk_bounds.size()-1;
+    const int_vec_t& ranges = active_set.ranges;
+    const int n_ranges = ranges.size()/2;
+#ifdef _OPENMP
+    #pragma omp parallel for num_threads(n_threads) schedule(static, 1) if (n_chunks>1)
+#endif
+    for (auto i_chunk=0; i_chunk<n_chunks; i_chunk++)
+    {
+        const int chunk_begin = chunk_bounds[i_chunk];
+        const int chunk_end = chunk_bounds[i_chunk+1];
+        // Bisect for the first range ending after the chunk begins
+        int i_range = 0;
+        int i_range_end = n_ranges;
+        while (i_range<i_range_end)
+        {
+            const int i_mid = (i_range+i_range_end)/2;
+            if (ranges[2*i_mid+1]<=chunk_begin) { i_range = i_mid+1; }
+            else { i_range_end = i_mid; }
+        }
+        // Visit, in order, the parts of ranges overlapping the chunk
+        for (; i_range<n_ranges and ranges[2*i_range]<chunk_end; i_range++)
+        {
+            f(
+                i_chunk, 
+                std::max(ranges[2*i_range], chunk_begin),
+                std::min(ranges[2*i_range+1], chunk_end)
+            );
+        }
+    }
+}
+
+//! Runge-Kutta integration of the nonlinear and diffusion terms,
+//! followed by the stochastic step, using the given stencil and RHS
+template <class Stencil, class RHS>
+void BaseLangevin::integrate_rungekutta_kernel(
+    const Stencil& stencil, const RHS& rhs, rng_t& rng
+)
+{
+    auto step1 = [&](grid_t& aux_grid, grid_t& k1_grid, const double dtf)
+    {
+        for_each_chunk([&](const int, const int i_begin, const int i_end)
+        {
+            stencil.sweep(density_grid,
+                [&](const int i, const double neighbor_sum, const int n_neighbors)
+                {
+                    k1_grid[i] = rhs(density_grid, i, neighbor_sum, n_neighbors);
+                    aux_grid[i] = density_grid[i] + k1_grid[i]*dtf;
+                },
+                i_begin, i_end
+            );
+        });
+    };
+    auto step2or3 = [&](
+        const grid_t& aux_grid_in, grid_t& aux_grid_out, grid_t& k23_grid,
+        const double dtf)
+    {
+        for_each_chunk([&](const int, const int i_begin, const int i_end)
+        {
+            stencil.sweep(aux_grid_in,
+                [&](const int i, const double neighbor_sum, const int n_neighbors)
+                {
+                    k23_grid[i] = rhs(aux_grid_in, i, neighbor_sum, n_neighbors);
+                    aux_grid_out[i] = density_grid[i] + k23_grid[i]*dtf;
+                },
+                i_begin, i_end
+            );
+        });
+    };
+    auto step4 = [&](
+        const grid_t& aux_grid, const grid_t& k1_grid, const grid_t& k2_grid,
+        const grid_t& k3_grid, const double dtf)
+    {
+        // Runge-Kutta 4th step
+        for_each_chunk([&](const int, const int i_begin, const int i_end)
+        {
+            stencil.sweep(aux_grid,
+                [&](const int i, const double neighbor_sum, const int n_neighbors)
+                {
+                    const auto k4 = rhs(aux_grid, i, neighbor_sum, n_neighbors);
+                    density_grid[i]
+                        += (k1_grid[i] + 2*(k2_grid[i]+k3_grid[i]) +k4)*dtf;
+                },
+                i_begin, i_end
+            );
+        });
+    };
+
+    // Density can spread by one cell per RHS evaluation
+    update_active_set(4);
+    step1(aux_grid1, k1_grid, dt/2);
+    step2or3(aux_grid1, aux_grid2, k2_grid, dt/2);
+    step2or3(aux_grid2, aux_grid1, k3_grid, dt);
+    step4(aux_grid1, k1_grid, k2_grid, k3_grid, dt/6);
+    stochastic_step(density_grid, rng);
+}
+
+//! Explicit-Euler integration of the nonlinear and diffusion terms,
+//! followed by the stochastic step, using the given stencil and RHS
+template <class Stencil, class RHS>
+void BaseLangevin::integrate_euler_kernel(
+    const Stencil& stencil, const RHS& rhs, rng_t& rng
+)
+{
+    update_active_set(1);
+    for_each_chunk([&](const int, const int i_begin, const int i_end)
+    {
+        stencil.sweep(density_grid,
+            [&](const int i, const double neighbor_sum, const int n_neighbors)
+            {
+                const double f = rhs(density_grid, i, neighbor_sum, n_neighbors);
+                aux_grid1[i] = density_grid[i] + f*dt;
+            },
+            i_begin, i_end
+        );
+    });
+    stochastic_step(aux_grid1, rng);
+    // Update density field grid with result of integration
+    // (a copy, not a swap, since aux_grid1 is only up to date where active)
+    for_each_chunk([&](const int, const int i_begin, const int i_end)
+    {
+        std::copy(
+            aux_grid1.begin()+i_begin, aux_grid1.begin()+i_end, 
+            density_grid.begin()+i_begin
+        );
+    });
+}
+
+//! Choose the stencil best suited to the grid, then integrate by Runge-Kutta
+template <class RHS>
+void BaseLangevin::integrate_rungekutta_stencil(const RHS& rhs, rng_t& rng)
+{
+    switch (grid_dimension)
+    {
+        case (GridDimension::D1):
+            integrate_rungekutta_kernel(
+                Lattice1DStencil(n_x, grid_wiring), rhs, rng
+            );
+            break;
+        case (GridDimension::D2):
+            integrate_rungekutta_kernel(
+                Lattice2DStencil(n_x, n_y, grid_wiring), rhs, rng
+            );
+            break;
+        default:
+            integrate_rungekutta_kernel(WiredStencil(grid_wiring), rhs, rng);
+            break;
+    }
+}
+
+//! Choose the stencil best suited to the grid, then integrate by Euler
+template <class RHS>
+void BaseLangevin::integrate_euler_stencil(const RHS& rhs, rng_t& rng)
+{
+    switch (grid_dimension)
+    {
+        case (GridDimension::D1):
+            integrate_euler_kernel(
+                Lattice1DStencil(n_x, grid_wiring), rhs, rng
+            );
+            break;
+        case (GridDimension::D2):
+            integrate_euler_kernel(
+                Lattice2DStencil(n_x, n_y, grid_wiring), rhs, rng
+            );
+            break;
+        default:
+            integrate_euler_kernel(WiredStencil(grid_wiring), rhs, rng);
+            break;
+    }
+}
+
+#endif
@@ -0,0 +1,90 @@
+/**
+ * @file langevin_moments.hpp
+ * @brief Running moments of the density field over grid cells.
+ *
+ * The grid-mean density is summed as the stochastic step sweeps the grid.
+ * If per-epoch observables are wanted, the same sweep also sums the squared
+ * densities, counts the active (ρ>0) cells and finds the maximum density,
+ * so that no further pass over the grid is needed. For spreading runs from
+ * a single seed, it can also sum the densities weighted by their squared 
+ * distance from the seed, for the mean squared radius of the spreading cloud.
+ *
+ * Sums over millions of small densities lose precision if accumulated
+ * naively, one cell after another. So cell densities are summed directly
+ * only within blocks of `moments_block_size` consecutive cells, aligned on
+ * the grid; the block partial sums are then added up pairwise, along
+ * a binary tree fixed by the number of blocks. The rounding error then 
+ * grows only as the log of the number of cells. Since neither the blocks 
+ * nor the tree depend on how the grid is split between threads, neither 
+ * does the result, given the cell densities. Unlike compensated (Kahan)
+ * summation, this scheme survives the reassociation of floating-point 
+ * arithmetic allowed by `-Ofast`.
+ */
+
+#ifndef MOMENTS_HPP
+#define MOMENTS_HPP
+
+#include <algorithm>
+#include "langevin_types.hpp"
+#include "langevin_active_set.hpp"
+
+//! Number of consecutive grid cells summed directly into a block partial sum:
+//! the same as the active-set block size, so active ranges are whole blocks
+const int moments_block_size = ActiveSet::block_size;
+
+/**
+ * @brief Running moments of the density field over grid cells.
+ */
+struct GridMoments
+{
+    //! Sum of densities
+    double sum = 0.0;
+    //! Sum of squared densities
+    double sum_sq = 0.0;
+    //! Number of cells with nonzero (positive) density
+    int n_active = 0;
+    //! Maximum density
+    double max = 0.0;
+    //! Sum of densities weighted by squared distance from the seed
+    double sum_r2 = 0.0;
+
+    //! Fold in the density of a cell
+    void add(const double value)
+    {
+        sum += value;
+        sum_sq += value*value;
+        n_active += (value>0.0);
+        max = std::max(max, value);
+    }
+    //! Fold in the moments of another set of cells
+    void merge(const GridMoments& other)
+    {
+        sum += other.sum;
+        sum_sq += other.sum_sq;
+        n_active += other.n_active;
+        max = std::max(max, other.max);
+        sum_r2 += other.sum_r2;
+    }
+};
+
+//! Sum partial sums pairwise, adjacent pairs first, using `scratch` space
+inline double pairwise_sum(const dbl_vec_t& partials, dbl_vec_t& scratch)
+{
+    if (partials.empty()) { return 0.0; }
+    scratch.assign(partials.begin(), partials.end());
+    std::size_t n = scratch.size();
+    while (n>1)
+    {
+        const std::size_t n_pairs = n/2;
+        for (std::size_t i=0; i<n_pairs; i++)
+        {
+            scratch[i] = scratch[2*i] + scratch[2*i+1];
+        }
+        // An odd one out is carried up to the next level as it is
+        if (n%2==1) { scratch[n_pairs] = scratch[n-1]; }
+        n = n_pairs + n%2;
+    }
+    return scratch[0];
+}
+
+#endif
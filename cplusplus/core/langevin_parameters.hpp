@@ -36,6 +36,9 @@ public:
     const InitialCondition initial_condition=InitialCondition::RANDOM_UNIFORM;
     const dbl_vec_t ic_values={};
     const IntegrationMethod integration_method=IntegrationMethod::RUNGE_KUTTA;
+    const RandomGenerator random_generator=RandomGenerator::MERSENNE_TWISTER;
+    const int n_threads=1;
+    const bool do_active_set=false;
 
     Parameters() = default;
     Parameters(
@@ -49,7 +52,10 @@ public:
         const dbl_vec_t bcv,
         const InitialCondition ic,
         const dbl_vec_t icv,
-        const IntegrationMethod im
+        const IntegrationMethod im,
+        const RandomGenerator rg,
+        const int nt,
+        const bool das
     ) : 
         t_final(t_final), 
         dx(dx), dt(dt), 
@@ -61,7 +67,10 @@ public:
         bc_values(bcv),
         initial_condition(ic), 
         ic_values(icv),
-        integration_method(im)
+        integration_method(im),
+        random_generator(rg),
+        n_threads(nt),
+        do_active_set(das)
     {
         n_x = gs.at(0);
         n_y = (gs.size()>1) ? gs.at(1) : 1;
@@ -152,6 +161,14 @@ public:
             default: return "Unknown";
         }
     }
+    std::string report(RandomGenerator rg) 
+    {
+        switch (rg) {
+            case RandomGenerator::MERSENNE_TWISTER: return "Mersenne Twister";
+            case RandomGenerator::PHILOX: return "Philox";
+            default: return "Unknown";
+        }
+    }
 
     void print() 
     {
@@ -180,6 +197,10 @@ public:
             std::cout << std::endl;        
         std::cout << "integration_method: "  
             << report(integration_method) << std::endl;
+        std::cout << "rng: "  
+            << report(random_generator) << std::endl;
+        std::cout << "n_threads: " << n_threads << std::endl;
+        std::cout << "do_active_set: " << do_active_set << std::endl;
         std::cout << std::endl;        
     }
 };
@@ -0,0 +1,101 @@
+/**
+ * @file langevin_philox.hpp
+ * @brief Counter-based Philox4x32-10 random number generator.
+ *
+ * Philox (Salmon et al., 2011, "Parallel random numbers: as easy as 1, 2, 3")
+ * maps a 128-bit counter and a 64-bit key to 128 random bits by a fixed 
+ * number of cheap bijective rounds. It has no internal state to carry 
+ * from one draw to the next, so the random numbers needed for any grid cell 
+ * at any epoch can be generated directly from (seed, epoch, cell), 
+ * in any order, on any thread.
+ */
+
+#ifndef PHILOX_HPP
+#define PHILOX_HPP
+
+#include <array>
+#include <cstdint>
+#include <limits>
+
+/**
+ * @brief Philox4x32 block function with 10 rounds.
+ */
+struct Philox4x32
+{
+    typedef std::array<std::uint32_t, 4> counter_t;
+    typedef std::array<std::uint32_t, 2> key_t;
+
+    //! Encrypt a counter with a key to give four 32-bit random words
+    static counter_t block(counter_t counter, key_t key)
+    {
+        for (auto i_round=0; i_round<10; i_round++)
+        {
+            if (i_round>0)
+            {
+                key[0] += 0x9E3779B9;
+                key[1] += 0xBB67AE85;
+            }
+            const std::uint64_t product0 
+                = static_cast<std::uint64_t>(0xD2511F53)*counter[0];
+            const std::uint64_t product1 
+                = static_cast<std::uint64_t>(0xCD9E8D57)*counter[2];
+            counter = {
+                static_cast<std::uint32_t>(product1>>32) ^ counter[1] ^ key[0],
+                static_cast<std::uint32_t>(product1),
+                static_cast<std::uint32_t>(product0>>32) ^ counter[3] ^ key[1],
+                static_cast<std::uint32_t>(product0)
+            };
+        }
+        return counter;
+    }
+};
+
+/**
+ * @brief Stream of random bits for one grid cell at one epoch.
+ *
+ * Satisfies the standard UniformRandomBitGenerator requirements, so that 
+ * it can drive the `<random>` distributions. The key is the RNG seed; 
+ * the counter is (cell, epoch low word, epoch high word, block number),
+ * so distinct (seed, epoch, cell) give independent streams.
+ */
+class PhiloxStream
+{
+public:
+    typedef std::uint32_t result_type;
+
+    PhiloxStream(
+        const std::uint32_t seed, 
+        const std::uint64_t i_epoch, 
+        const std::uint32_t i_cell
+    ) : key{seed, 0},
+        counter{
+            i_cell, 
+            static_cast<std::uint32_t>(i_epoch), 
+            static_cast<std::uint32_t>(i_epoch>>32), 
+            0
+        } {}
+
+    static constexpr result_type min() { return 0; }
+    static constexpr result_type max() 
+        { return std::numeric_limits<result_type>::max(); }
+
+    //! Next 32 random bits: generate a fresh block every four words
+    result_type operator()()
+    {
+        if (i_word==4)
+        {
+            words = Philox4x32::block(counter, key);
+            counter[3]++;
+            i_word = 0;
+        }
+        return words[i_word++];
+    }
+
+private:
+    Philox4x32::key_t key;
+    Philox4x32::counter_t counter;
+    Philox4x32::counter_t words = {};
+    int i_word = 4;
+};
+
+#endif
@@ -0,0 +1,166 @@
+/**
+ * @file langevin_sampler.hpp
+ * @brief Fast Poisson-gamma sampler for the Dornic stochastic step.
+ *
+ * The stochastic step replaces each cell density ρ by a Gamma(n, 1/λ) variate
+ * where n ~ Poisson(λρ exp(at)). The Poisson mean changes from cell to cell
+ * and from step to step, so the `<random>` distribution objects, which
+ * do their (costly) setup per parameter value, have to be rebuilt per cell.
+ * Instead, the samplers here need no setup at all:
+ *   - Poisson, small mean: inversion by sequential search from k=0,
+ *     costing on average μ+1 multiply-adds and one uniform variate;
+ *   - Poisson, large mean: Hörmann's (1993) transformed rejection with
+ *     squeeze ("PTRS"), costing about one pair of uniforms per variate;
+ *   - Gamma, integer shape n: exponential for n=1, else Marsaglia & Tsang's
+ *     (2000) squeeze-rejection method.
+ * A zero Poisson variate, the commonest outcome near criticality, needs no
+ * gamma draw at all.
+ *
+ * All samplers are templated on a UniformRandomBitGenerator returning
+ * 32-bit words, i.e. either `rng_t` or `PhiloxStream`, and hold no state
+ * between draws.
+ */
+
+#ifndef SAMPLER_HPP
+#define SAMPLER_HPP
+
+#include <cmath>
+#include <cstdint>
+
+//! Poisson mean above which transformed rejection replaces inversion
+const double poisson_ptrs_threshold = 10.0;
+
+//! Uniform variate in the open interval (0,1) with 53 random bits
+template <class URBG>
+inline double uniform_open01(URBG& urbg)
+{
+    const std::uint64_t high = static_cast<std::uint32_t>(urbg()) >> 5;
+    const std::uint64_t low = static_cast<std::uint32_t>(urbg()) >> 6;
+    // 2^-53 * (integer in [0, 2^53)), shifted by half a step off zero
+    return ((high<<26 | low) + 0.5) * (1.0/9007199254740992.0);
+}
+
+//! Standard normal variate by Marsaglia's polar method
+template <class URBG>
+inline double standard_normal(URBG& urbg)
+{
+    double u, v, s;
+    do {
+        u = 2*uniform_open01(urbg) - 1;
+        v = 2*uniform_open01(urbg) - 1;
+        s = u*u + v*v;
+    } while (s>=1.0);
+    return u * std::sqrt(-2*std::log(s)/s);
+}
+
+//! Log of k!, tabulated for small k, by Stirling series otherwise
+//! (unlike `std::lgamma`, this is thread-safe: no `signgam` side effect)
+inline double log_factorial(const double k)
+{
+    static const double log_factorials[10] = {
+        0.0, 0.0,
+        0.693147180559945, 1.7917594692280554,
+        3.178053830347945, 4.787491742782047,
+        6.579251212010102, 8.525161361065415,
+        10.604602902745249, 12.801827480081467
+    };
+    if (k<10) { return log_factorials[static_cast<int>(k)]; }
+    const double x = k+1;
+    const double x2 = x*x;
+    return (x-0.5)*std::log(x) - x + 0.91893853320467274178
+        + (1.0/12 - (1.0/360 - 1.0/(1260*x2))/x2)/x;
+}
+
+//! Poisson variate with mean `mu`
+template <class URBG>
+inline int sample_poisson(const double mu, URBG& urbg)
+{
+    if (not (mu>0.0)) { return 0; }
+    if (mu<poisson_ptrs_threshold)
+    {
+        // Inversion: walk up the CDF until it exceeds a uniform variate
+        const double u = uniform_open01(urbg);
+        double p = std::exp(-mu);
+        double cdf = p;
+        int k = 0;
+        while (u>cdf)
+        {
+            k++;
+            p *= mu/k;
+            cdf += p;
+            // Guard against round-off leaving the CDF just short of 1
+            if (p<1e-18*cdf) { break; }
+        }
+        return k;
+    }
+    // PTRS: Hörmann, W. (1993) Insurance: Mathematics and Economics 12, 39-45
+    const double sqrt_mu = std::sqrt(mu);
+    const double log_mu = std::log(mu);
+    const double b = 0.931 + 2.53*sqrt_mu;
+    const double a = -0.059 + 0.02483*b;
+    const double inv_alpha = 1.1239 + 1.1328/(b-3.4);
+    const double v_r = 0.9277 - 3.6224/(b-2);
+    while (true)
+    {
+        const double u = uniform_open01(urbg) - 0.5;
+        const double v = uniform_open01(urbg);
+        const double us = 0.5 - std::abs(u);
+        const double k = std::floor((2*a/us + b)*u + mu + 0.43);
+        if (us>=0.07 and v<=v_r) { return static_cast<int>(k); }
+        if (k<0 or (us<0.013 and v>us)) { continue; }
+        if (
+            std::log(v) + std::log(inv_alpha) - std::log(a/(us*us) + b)
+            <= -mu + k*log_mu - log_factorial(k)
+        )
+        {
+            return static_cast<int>(k);
+        }
+    }
+}
+
+//! Gamma variate with positive integer shape `n` and unit scale
+template <class URBG>
+inline double sample_gamma(const int n, URBG& urbg)
+{
+    if (n==1) { return -std::log(uniform_open01(urbg)); }
+    // Marsaglia, G. & Tsang, W.W. (2000) ACM Trans. Math. Softw. 26, 363-372
+    const double d = n - 1.0/3.0;
+    const double c = 1.0/std::sqrt(9*d);
+    while (true)
+    {
+        double x, v;
+        do {
+            x = standard_normal(urbg);
+            v = 1 + c*x;
+        } while (v<=0);
+        v = v*v*v;
+        const double u = uniform_open01(urbg);
+        const double x2 = x*x;
+        if (u<1 - 0.0331*x2*x2) { return d*v; }
+        if (std::log(u)<0.5*x2 + d*(1 - v + std::log(v))) { return d*v; }
+    }
+}
+
+/**
+ * @brief Composite Poisson-gamma sampler of the Dornic stochastic step.
+ */
+struct DornicSampler
+{
+    //! Factor λ exp(at) converting density into Poisson mean
+    const double poisson_factor;
+    //! Gamma-variate scale 1/λ
+    const double gamma_scale;
+
+    DornicSampler(const double lambda_on_explcdt, const double lambda)
+        : poisson_factor(lambda_on_explcdt), gamma_scale(1/lambda) {}
+
+    //! Draw the post-step density of a cell with pre-step `density`
+    template <class URBG>
+    double operator()(const double density, URBG& urbg) const
+    {
+        const int n = sample_poisson(poisson_factor*density, urbg);
+        return (n==0) ? 0.0 : sample_gamma(n, urbg)*gamma_scale;
+    }
+};
+
+#endif
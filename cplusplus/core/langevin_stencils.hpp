@@ -0,0 +1,166 @@
+/**
+ * @file langevin_stencils.hpp
+ * @brief Neighbor-sum stencils used by the templated integration kernels.
+ *
+ * Each stencil provides a `sweep` method that visits the grid cells in a
+ * contiguous index range [i_begin, i_end) in order, and hands a functor 
+ * `op(i_cell, neighbor_sum, n_neighbors)` the sum of the density values 
+ * of the cell's neighbors. Disjoint ranges may be swept concurrently.
+ * Regular 1D and 2D lattices use direct index arithmetic for interior cells,
+ * which lets the compiler inline and vectorize the stencil; only edge cells
+ * (and any irregular topology) fall back on the per-cell grid wiring.
+ * Neighbors are summed in the same order as they are wired, so that
+ * all stencils give bit-identical results.
+ */
+
+#ifndef STENCILS_HPP
+#define STENCILS_HPP
+
+#include <algorithm>
+#include "langevin_types.hpp"
+
+//! Sum the grid values of the neighbors of a cell by walking its wiring
+inline double wired_neighbor_sum(
+    const grid_wiring_t& grid_wiring, const int i_cell, const grid_t& grid
+)
+{
+    double neighbor_sum = 0.0;
+    const cell_index_t* end = grid_wiring.end(i_cell);
+    for (auto j=grid_wiring.begin(i_cell); j<end; j++)
+    {
+        neighbor_sum += grid[*j];
+    }
+    return neighbor_sum;
+}
+
+/**
+ * @brief Stencil that leaves all neighbor lookups to the RHS functor.
+ *
+ * Used by the generic (virtual) `nonlinear_rhs` integration path.
+ */
+struct PointwiseStencil
+{
+    const int n_cells;
+
+    PointwiseStencil(const int n_cells) : n_cells(n_cells) {}
+
+    template <class Op>
+    void sweep(const grid_t& grid, Op op, const int i_begin, const int i_end)
+        const
+    {
+        for (auto i=i_begin; i<i_end; i++) { op(i, 0.0, 0); }
+    }
+};
+
+/**
+ * @brief Stencil for an arbitrary topology, using the per-cell wiring.
+ */
+struct WiredStencil
+{
+    const grid_wiring_t& grid_wiring;
+
+    WiredStencil(const grid_wiring_t& grid_wiring) : grid_wiring(grid_wiring) {}
+
+    template <class Op>
+    void sweep(const grid_t& grid, Op op, const int i_begin, const int i_end)
+        const
+    {
+        for (auto i=i_begin; i<i_end; i++)
+        {
+            op(i, wired_neighbor_sum(grid_wiring, i, grid),
+                grid_wiring.n_neighbors(i));
+        }
+    }
+};
+
+/**
+ * @brief Stencil for a 1D lattice: interior cells have L and R neighbors.
+ *
+ * Grid-end cells, whose wiring depends on the topology, use the wiring.
+ */
+struct Lattice1DStencil
+{
+    const int n_x;
+    const grid_wiring_t& grid_wiring;
+
+    Lattice1DStencil(const int n_x, const grid_wiring_t& grid_wiring)
+        : n_x(n_x), grid_wiring(grid_wiring) {}
+
+    template <class Op>
+    void sweep(const grid_t& grid, Op op, const int i_begin, const int i_end)
+        const
+    {
+        const double* g = grid.data();
+        auto wired = [&](const int i)
+        {
+            op(i, wired_neighbor_sum(grid_wiring, i, grid),
+                grid_wiring.n_neighbors(i));
+        };
+        // Interior cells lie in [1, n_x-1)
+        const int i_interior_begin = std::max(i_begin, 1);
+        const int i_interior_end = std::min(i_end, n_x-1);
+        if (i_interior_begin>=i_interior_end)
+        {
+            for (auto i=i_begin; i<i_end; i++) { wired(i); }
+            return;
+        }
+        if (i_begin==0) { wired(0); }
+        for (auto i=i_interior_begin; i<i_interior_end; i++)
+        {
+            op(i, g[i-1] + g[i+1], 2);
+        }
+        if (i_end==n_x) { wired(n_x-1); }
+    }
+};
+
+/**
+ * @brief Stencil for a 2D lattice: interior cells have 4 neighbors.
+ *
+ * Cells are indexed as i = x + y*n_x. Edge rows and edge columns, whose
+ * wiring depends on the mixed bounded/periodic topology, use the wiring.
+ */
+struct Lattice2DStencil
+{
+    const int n_x;
+    const int n_y;
+    const grid_wiring_t& grid_wiring;
+
+    Lattice2DStencil(
+        const int n_x, const int n_y, const grid_wiring_t& grid_wiring
+    ) : n_x(n_x), n_y(n_y), grid_wiring(grid_wiring) {}
+
+    template <class Op>
+    void sweep(const grid_t& grid, Op op, const int i_begin, const int i_end)
+        const
+    {
+        if (i_begin>=i_end) { return; }
+        const double* g = grid.data();
+        auto wired = [&](const int i)
+        {
+            op(i, wired_neighbor_sum(grid_wiring, i, grid),
+                grid_wiring.n_neighbors(i));
+        };
+        for (auto y=i_begin/n_x; y<=(i_end-1)/n_x; y++)
+        {
+            // Clip this row to the range to be swept
+            const int row = y*n_x;
+            const int x_begin = std::max(i_begin, row) - row;
+            const int x_end = std::min(i_end, row+n_x) - row;
+            if (y==0 or y==n_y-1 or n_x<3)
+            {
+                for (auto x=x_begin; x<x_end; x++) { wired(row+x); }
+                continue;
+            }
+            if (x_begin==0) { wired(row); }
+            // Up, down, right, left: same order as the wiring
+            const int i_interior_end = row + std::min(x_end, n_x-1);
+            for (auto i=row+std::max(x_begin, 1); i<i_interior_end; i++)
+            {
+                op(i, g[i+n_x] + g[i-n_x] + g[i+1] + g[i-1], 4);
+            }
+            if (x_end==n_x) { wired(row+n_x-1); }
+        }
+    }
+};
+
+#endif
@@ -12,6 +12,13 @@ double BaseLangevin::get_density_grid_value(const int i) const
     return density_grid[i];
 }
 
+//! Return the Langevin density field grid itself, e.g., to be viewed 
+//! from Python without copying
+const grid_t& BaseLangevin::get_density_grid() const
+{
+    return density_grid;
+}
+
 //! Return the grid-averaged Langevin field mean value
 double BaseLangevin::get_mean_density() const
 {
@@ -23,4 +30,84 @@ double BaseLangevin::get_mean_density() const
 double BaseLangevin::get_poisson_mean() const
 {
     return lambda_on_explcdt * mean_density;
-}
\ No newline at end of file
+}
+//! Record the index of the epoch about to be integrated, which together with
+//! the seed and cell index keys the counter-based RNG
+void BaseLangevin::set_epoch(const int i_epoch)
+{
+    this->i_epoch = static_cast<std::uint64_t>(i_epoch);
+}
+
+//! Choose whether the stochastic step, besides summing the grid-mean density,
+//! computes the other grid moments (needed for per-epoch observables)
+void BaseLangevin::set_do_moments(const bool do_moments)
+{
+    this->do_moments = do_moments;
+}
+
+//! Sum the densities (and their moments, if requested) of a block of cells, 
+//! in cell order. Every block sum is computed here, rather than inline,
+//! so that the same code, and thus the same rounding, applies to every block
+GridMoments BaseLangevin::sum_block(const grid_t& grid, const int i_block) 
+    const
+{
+    const int block_begin = i_block*moments_block_size;
+    const int block_end = std::min(block_begin+moments_block_size, n_cells);
+    GridMoments block;
+    // The same summation loop whether or not the other moments are wanted,
+    // so that the mean density doesn't depend on it
+    for (auto i=block_begin; i<block_end; i++) { block.sum += grid[i]; }
+    if (do_moments)
+    {
+        for (auto i=block_begin; i<block_end; i++)
+        {
+            const double value = grid[i];
+            block.sum_sq += value*value;
+            block.n_active += (value>0.0);
+            block.max = std::max(block.max, value);
+        }
+        if (not seed_squared_distances.empty())
+        {
+            for (auto i=block_begin; i<block_end; i++)
+            {
+                block.sum_r2 += grid[i]*seed_squared_distances[i];
+            }
+        }
+    }
+    return block;
+}
+
+//! Add up the block partial sums pairwise, and update the grid-mean density
+void BaseLangevin::reduce_block_sums()
+{
+    grid_moments.sum = pairwise_sum(block_sums, pairwise_scratch);
+    if (do_moments)
+    {
+        grid_moments.sum_sq = pairwise_sum(block_sum_sqs, pairwise_scratch);
+        grid_moments.sum_r2 = pairwise_sum(block_sum_r2s, pairwise_scratch);
+    }
+    mean_density = grid_moments.sum / static_cast<double>(n_cells);
+}
+
+//! Sweep the whole grid to compute its moments, e.g. at epoch#0, 
+//! before any stochastic step has done so, summing as the stochastic
+//! step does: block by block, then pairwise
+void BaseLangevin::measure_grid_moments()
+{
+    grid_moments = GridMoments();
+    for (auto i_block=0; i_block<block_sums.size(); i_block++)
+    {
+        const GridMoments block = sum_block(density_grid, i_block);
+        block_sums[i_block] = block.sum;
+        block_sum_sqs[i_block] = block.sum_sq;
+        block_sum_r2s[i_block] = block.sum_r2;
+        grid_moments.n_active += block.n_active;
+        grid_moments.max = std::max(grid_moments.max, block.max);
+    }
+    reduce_block_sums();
+}
+
+const GridMoments& BaseLangevin::get_grid_moments() const
+{
+    return grid_moments;
+}
@@ -0,0 +1,125 @@
+/**
+ * @file langevin_wiring.hpp
+ * @brief Compressed-sparse-row (CSR) table of grid-cell neighbors.
+ */
+
+#ifndef WIRING_HPP
+#define WIRING_HPP
+
+#include <cstdint>
+#include <cstddef>
+#include <new>
+#include <vector>
+
+//! Cache line size in bytes, used to align the wiring arrays
+const std::size_t cache_line_size = 64;
+
+/**
+ * @brief Minimal allocator returning memory aligned to `Alignment` bytes.
+ */
+template <typename T, std::size_t Alignment>
+struct aligned_allocator
+{
+    typedef T value_type;
+    template <typename U> struct rebind
+        { typedef aligned_allocator<U, Alignment> other; };
+
+    aligned_allocator() = default;
+    template <typename U>
+    aligned_allocator(const aligned_allocator<U, Alignment>&) {}
+
+    T* allocate(const std::size_t n)
+    {
+        return static_cast<T*>(
+            ::operator new(n*sizeof(T), std::align_val_t(Alignment))
+        );
+    }
+    void deallocate(T* pointer, const std::size_t)
+    {
+        ::operator delete(pointer, std::align_val_t(Alignment));
+    }
+    template <typename U>
+    bool operator==(const aligned_allocator<U, Alignment>&) const
+        { return true; }
+    template <typename U>
+    bool operator!=(const aligned_allocator<U, Alignment>&) const
+        { return false; }
+};
+
+//! Type for grid-cell indexes in the wiring table
+typedef std::int32_t cell_index_t;
+//! Type for cache-aligned vectors of grid-cell indexes
+typedef std::vector<cell_index_t, aligned_allocator<cell_index_t, cache_line_size>>
+    index_vec_t;
+
+/**
+ * @brief Neighborhood topology of all grid cells in CSR layout.
+ *
+ * The neighbors of cell i are `neighbors[offsets[i]]` up to (but excluding)
+ * `neighbors[offsets[i+1]]`, in the order in which they were connected.
+ *
+ * The table is built in two passes over the same sequence of `connect` calls:
+ * the first pass (after `start`) only counts neighbors per cell;
+ * `allocate` then sizes the contiguous neighbor array, and the second pass
+ * fills it; `finish` restores the offsets.
+ * This avoids any per-cell heap allocation.
+ */
+struct GridWiring
+{
+    //! Start of each cell's neighbor list; size n_cells+1
+    index_vec_t offsets;
+    //! Neighbor cell indexes, concatenated cell by cell
+    index_vec_t neighbors;
+
+    //! Number of cells wired
+    int size() const
+    {
+        return (offsets.empty()) ? 0 : static_cast<int>(offsets.size()-1);
+    }
+    //! Number of neighbors of cell i
+    int n_neighbors(const int i) const { return offsets[i+1]-offsets[i]; }
+    //! Pointer to first neighbor of cell i
+    const cell_index_t* begin(const int i) const
+        { return neighbors.data() + offsets[i]; }
+    //! Pointer past the last neighbor of cell i
+    const cell_index_t* end(const int i) const
+        { return neighbors.data() + offsets[i+1]; }
+
+    //! Begin the counting pass for a grid of `n_cells`
+    void start(const int n_cells)
+    {
+        offsets.assign(n_cells+1, 0);
+        neighbors.clear();
+        is_counting = true;
+    }
+    //! Connect cell i to neighbor cell j (count or fill, depending on pass)
+    void connect(const int i, const int j)
+    {
+        if (is_counting) { offsets[i+1]++; }
+        else { neighbors[offsets[i]++] = j; }
+    }
+    //! End the counting pass and begin the filling pass
+    void allocate()
+    {
+        // Prefix sum, after which offsets[i] is the start (fill cursor) 
+        // of cell i and offsets[n_cells] is the total number of neighbors
+        const int n_cells = size();
+        for (auto i=0; i<n_cells; i++) { offsets[i+1] += offsets[i]; }
+        neighbors.resize(offsets[n_cells]);
+        is_counting = false;
+    }
+    //! End the filling pass: cursors now point to each cell's end,
+    //! so shift them back to point to each cell's start
+    void finish()
+    {
+        const int n_cells = size();
+        for (auto i=n_cells; i>0; i--) { offsets[i] = offsets[i-1]; }
+        offsets[0] = 0;
+    }
+
+private:
+    //! Flag whether connections are being counted or filled in
+    bool is_counting = true;
+};
+
+#endif
@@ -1,11 +1,13 @@
 /**
  * @file dplangevin.cpp
- * @brief Redefinition of BaseLangevin constructor; implementation of stub methods.
+ * @brief Redefinition of BaseLangevin constructor; implementation of stub methods
+ * and of the DP-specialized integration kernels.
  */
 
 #include <pybind11/numpy.h>
 #include <string>
 #include "dplangevin.hpp"
+#include "../core/langevin_kernels.hpp"
 
 /**
  * @brief Redefinition of BaseLangevin class constructor
@@ -38,22 +40,26 @@ void DPLangevin::set_nonlinear_coefficients(const Coefficients& coefficients)
 //! for deterministic integration step
 double DPLangevin::nonlinear_rhs(const int i_cell, const grid_t& grid) const
 {
-    // Non-linear term, which is quadratic in the DP Langevin equation
-    const double quadratic_term 
-        = -quadratic_coefficient*grid[i_cell]*grid[i_cell];
+    const DPLangevinRHS rhs(quadratic_coefficient, diffusion_coefficient);
+    return rhs(
+        grid, i_cell, 
+        wired_neighbor_sum(grid_wiring, i_cell, grid), 
+        grid_wiring.n_neighbors(i_cell)
+    );
+}
 
-    // For integration of diffusion
-    double diffusion_sum = 0.0;
-    const neighborhood_t& cell_wiring = grid_wiring[i_cell];
-    for (auto j_wire=0; j_wire<cell_wiring.size(); j_wire++)
-    {
-        const auto j_neighbor_cell = cell_wiring[j_wire];
-        diffusion_sum += grid[j_neighbor_cell];
-    }
-    const auto diffusion_term = (
-        diffusion_coefficient*(diffusion_sum 
-            - cell_wiring.size()*grid[i_cell])
+//! Runge-Kutta integration with the DP RHS inlined into the stencil kernel
+void DPLangevin::integrate_rungekutta(rng_t& rng)
+{
+    integrate_rungekutta_stencil(
+        DPLangevinRHS(quadratic_coefficient, diffusion_coefficient), rng
+    );
+}
+
+//! Explicit-Euler integration with the DP RHS inlined into the stencil kernel
+void DPLangevin::integrate_euler(rng_t& rng)
+{
+    integrate_euler_stencil(
+        DPLangevinRHS(quadratic_coefficient, diffusion_coefficient), rng
     );
-    // Combine terms
-    return diffusion_term + quadratic_term;
 }
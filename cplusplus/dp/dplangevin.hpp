@@ -9,6 +9,40 @@
 #include "../core/langevin_types.hpp"
 #include "../core/langevin_base.hpp"
 
+/**
+ * @brief Local nonlinear RHS of the DP Langevin equation: D∇²ρ - bρ².
+ *
+ * Inlined by the templated integration kernels, given the sum of the 
+ * neighbor-cell densities supplied by a stencil.
+ */
+struct DPLangevinRHS
+{
+    //! Coefficient in nonlinear term -bρ²
+    const double quadratic_coefficient;
+    //! Diffusion coefficient D already divided by Δx²
+    const double diffusion_coefficient;
+
+    DPLangevinRHS(
+        const double quadratic_coefficient, const double diffusion_coefficient
+    ) : quadratic_coefficient(quadratic_coefficient),
+        diffusion_coefficient(diffusion_coefficient) {}
+
+    double operator()(
+        const grid_t& grid, const int i_cell, 
+        const double neighbor_sum, const int n_neighbors
+    ) const
+    {
+        const double rho = grid[i_cell];
+        // Non-linear term, which is quadratic in the DP Langevin equation
+        const double quadratic_term = -quadratic_coefficient*rho*rho;
+        // Discretized diffusion term
+        const double diffusion_term 
+            = diffusion_coefficient*(neighbor_sum - n_neighbors*rho);
+        // Combine terms
+        return diffusion_term + quadratic_term;
+    }
+};
+
 /**
  * @brief DPLangevin model application of BaseLangevin class integrator.
  */
@@ -29,6 +63,10 @@ public:
     void set_nonlinear_coefficients(const Coefficients& coefficients);
     //! Method to set nonlinear RHS of Langevin equation for deterministic integration step
     double nonlinear_rhs(const int i_cell, const grid_t& density) const;
+    //! Runge-Kutta integration using the DP-specialized stencil kernel
+    void integrate_rungekutta(rng_t& rng);
+    //! Explicit-Euler integration using the DP-specialized stencil kernel
+    void integrate_euler(rng_t& rng);
 };
 
 #endif
@@ -0,0 +1,278 @@
+/**
+ * @file dplangevin_batch.cpp
+ * @brief Methods of the DPLangevin integrator for a batch of replicas.
+ */
+
+#include <algorithm>
+#include "dplangevin_batch.hpp"
+#include "../core/langevin_philox.hpp"
+
+/**
+ * @brief Constructor for a batch of replicas, one per RNG seed
+ */
+DPLangevinBatch::DPLangevinBatch(Parameters p, const int_vec_t& random_seeds)
+    : DPLangevin(p), n_replicas(random_seeds.size()), replica_seeds(random_seeds)
+{
+    const int n_batch_cells = n_cells*n_replicas;
+    batch_density_grid = grid_t(n_batch_cells, 0.0);
+    batch_aux_grid1 = grid_t(n_batch_cells, 0.0);
+    batch_aux_grid2 = grid_t(n_batch_cells, 0.0);
+    batch_k1_grid = grid_t(n_batch_cells, 0.0);
+    batch_k2_grid = grid_t(n_batch_cells, 0.0);
+    batch_k3_grid = grid_t(n_batch_cells, 0.0);
+    neighbor_sums = dbl_vec_t(n_replicas, 0.0);
+    replica_mean_densities = dbl_vec_t(n_replicas, 0.0);
+}
+
+//! Generate each replica's initial condition in the (single-replica)
+//! density grid, drawing from the replica's own freshly seeded RNG stream,
+//! and copy it into the replica's slots of the interleaved grid
+bool DPLangevinBatch::initialize_batch_grid(const Parameters p)
+{
+    replica_rngs.clear();
+    for (auto r=0; r<n_replicas; r++)
+    {
+        replica_rngs.emplace_back(replica_seeds[r]);
+        if (not initialize_grid(p, replica_rngs[r])) { return false; }
+        for (auto i=0; i<n_cells; i++)
+        {
+            batch_density_grid[i*n_replicas+r] = density_grid[i];
+        }
+        replica_mean_densities[r] = mean_density;
+    }
+    return true;
+}
+
+//! Set the Langevin equation coefficients shared by all the replicas,
+//! and the Dornic stochastic-step sampler of each replica
+void DPLangevinBatch::prepare_batch(
+    const Coefficients& coefficients, const dbl_vec_t& linears
+)
+{
+    replica_samplers.clear();
+    for (auto r=0; r<n_replicas; r++)
+    {
+        prepare(Coefficients(
+            linears[r], coefficients.quadratic,
+            coefficients.diffusion, coefficients.noise
+        ));
+        replica_samplers.emplace_back(lambda_on_explcdt, lambda);
+    }
+}
+
+//! Apply boundary conditions along each edge in turn, to every replica,
+//! in the same way as `BaseLangevin::apply_boundary_conditions` (2d only)
+void DPLangevinBatch::apply_batch_boundary_conditions(
+    const Parameters p, int i_epoch
+)
+{
+    if (p.grid_dimension!=GridDimension::D2) { return; }
+    auto apply_bc_to_cell = [&](
+        const int x, const int y, const BoundaryCondition bc, const double value
+    )
+    {
+        double* cell = batch_density_grid.data() + (x + y*p.n_x)*n_replicas;
+        if (bc==BoundaryCondition::FIXED_VALUE)
+        {
+            for (auto r=0; r<n_replicas; r++) { cell[r] = value; }
+        }
+        // Don't "add flux" if we're at epoch#0
+        else if (bc==BoundaryCondition::FIXED_FLUX and i_epoch>0)
+        {
+            for (auto r=0; r<n_replicas; r++)
+            {
+                cell[r] = fmax(cell[r] + value*p.dt, 0.0);
+            }
+        }
+    };
+    auto apply_bc_to_edge_2d = [&](
+        const GridEdge grid_edge, const BoundaryCondition bc, const double value
+    )
+    {
+        switch (grid_edge)
+        {
+            case (GridEdge::lx):
+                for (auto x=0; x<p.n_x; x++){
+                    apply_bc_to_cell(x, 0, bc, value);
+                }
+                break;
+            case (GridEdge::ux):
+                for (auto x=0; x<p.n_x; x++){
+                    apply_bc_to_cell(x, p.n_y-1, bc, value);
+                }
+                break;
+            case (GridEdge::ly):
+                for (auto y=0; y<p.n_y; y++){
+                    apply_bc_to_cell(0, y, bc, value);
+                }
+                break;
+            case (GridEdge::uy):
+                for (auto y=0; y<p.n_y; y++){
+                    apply_bc_to_cell(p.n_x-1, y, bc, value);
+                }
+                break;
+        }
+    };
+    apply_bc_to_edge_2d(
+        GridEdge::lx, p.boundary_conditions.at(0), p.bc_values.at(0)
+    );
+    apply_bc_to_edge_2d(
+        GridEdge::ux, p.boundary_conditions.at(1), p.bc_values.at(1)
+    );
+    apply_bc_to_edge_2d(
+        GridEdge::ly, p.boundary_conditions.at(2), p.bc_values.at(2)
+    );
+    apply_bc_to_edge_2d(
+        GridEdge::uy, p.boundary_conditions.at(3), p.bc_values.at(3)
+    );
+}
+
+//! Sum neighbor densities of all the replicas of each cell at once:
+//! neighbors are summed in wiring order, as by the single-replica stencils,
+//! and the innermost loops run over the contiguous replica values
+template <class Op>
+void DPLangevinBatch::sweep_batch(const grid_t& grid, Op op)
+{
+    double* sums = neighbor_sums.data();
+    for (auto i=0; i<n_cells; i++)
+    {
+        std::fill(sums, sums+n_replicas, 0.0);
+        for (auto j=grid_wiring.begin(i); j<grid_wiring.end(i); j++)
+        {
+            const double* neighbor = grid.data() + (*j)*n_replicas;
+            for (auto r=0; r<n_replicas; r++) { sums[r] += neighbor[r]; }
+        }
+        op(i*n_replicas, sums, grid_wiring.n_neighbors(i));
+    }
+}
+
+//! Replace each replica's cell values by Poisson-gamma variates drawn
+//! from the replica's own RNG stream (or, with Philox, from a stream keyed on
+//! the replica's seed), summing each replica's mean density in cell order
+void DPLangevinBatch::batch_stochastic_step(grid_t& grid)
+{
+    std::fill(
+        replica_mean_densities.begin(), replica_mean_densities.end(), 0.0
+    );
+    for (auto i=0; i<n_cells; i++)
+    {
+        double* cell = grid.data() + i*n_replicas;
+        if (random_generator==RandomGenerator::PHILOX)
+        {
+            for (auto r=0; r<n_replicas; r++)
+            {
+                PhiloxStream cell_rng(
+                    static_cast<std::uint32_t>(replica_seeds[r]), i_epoch, i
+                );
+                cell[r] = replica_samplers[r](cell[r], cell_rng);
+            }
+        }
+        else
+        {
+            for (auto r=0; r<n_replicas; r++)
+            {
+                cell[r] = replica_samplers[r](cell[r], replica_rngs[r]);
+            }
+        }
+        for (auto r=0; r<n_replicas; r++)
+        {
+            replica_mean_densities[r] += cell[r];
+        }
+    }
+    for (auto& replica_mean_density : replica_mean_densities)
+    {
+        replica_mean_density /= static_cast<double>(n_cells);
+    }
+}
+
+//! Runge-Kutta integration of the nonlinear and diffusion terms of every
+//! replica, followed by the stochastic step
+void DPLangevinBatch::integrate_batch_rungekutta()
+{
+    const DPLangevinRHS rhs(quadratic_coefficient, diffusion_coefficient);
+    grid_t& density = batch_density_grid;
+    auto step1 = [&](grid_t& aux_grid, grid_t& k1_grid, const double dtf)
+    {
+        sweep_batch(density,
+            [&](const int i0, const double* sums, const int n_neighbors)
+            {
+                for (auto i=i0; i<i0+n_replicas; i++)
+                {
+                    k1_grid[i] = rhs(density, i, sums[i-i0], n_neighbors);
+                    aux_grid[i] = density[i] + k1_grid[i]*dtf;
+                }
+            }
+        );
+    };
+    auto step2or3 = [&](
+        const grid_t& aux_grid_in, grid_t& aux_grid_out, grid_t& k23_grid,
+        const double dtf)
+    {
+        sweep_batch(aux_grid_in,
+            [&](const int i0, const double* sums, const int n_neighbors)
+            {
+                for (auto i=i0; i<i0+n_replicas; i++)
+                {
+                    k23_grid[i] = rhs(aux_grid_in, i, sums[i-i0], n_neighbors);
+                    aux_grid_out[i] = density[i] + k23_grid[i]*dtf;
+                }
+            }
+        );
+    };
+    auto step4 = [&](
+        const grid_t& aux_grid, const grid_t& k1_grid, const grid_t& k2_grid,
+        const grid_t& k3_grid, const double dtf)
+    {
+        sweep_batch(aux_grid,
+            [&](const int i0, const double* sums, const int n_neighbors)
+            {
+                for (auto i=i0; i<i0+n_replicas; i++)
+                {
+                    const auto k4 = rhs(aux_grid, i, sums[i-i0], n_neighbors);
+                    density[i]
+                        += (k1_grid[i] + 2*(k2_grid[i]+k3_grid[i]) +k4)*dtf;
+                }
+            }
+        );
+    };
+
+    step1(batch_aux_grid1, batch_k1_grid, dt/2);
+    step2or3(batch_aux_grid1, batch_aux_grid2, batch_k2_grid, dt/2);
+    step2or3(batch_aux_grid2, batch_aux_grid1, batch_k3_grid, dt);
+    step4(batch_aux_grid1, batch_k1_grid, batch_k2_grid, batch_k3_grid, dt/6);
+    batch_stochastic_step(density);
+}
+
+//! Explicit-Euler integration of the nonlinear and diffusion terms of every
+//! replica, followed by the stochastic step
+void DPLangevinBatch::integrate_batch_euler()
+{
+    const DPLangevinRHS rhs(quadratic_coefficient, diffusion_coefficient);
+    grid_t& density = batch_density_grid;
+    sweep_batch(density,
+        [&](const int i0, const double* sums, const int n_neighbors)
+        {
+            for (auto i=i0; i<i0+n_replicas; i++)
+            {
+                const double f = rhs(density, i, sums[i-i0], n_neighbors);
+                batch_aux_grid1[i] = density[i] + f*dt;
+            }
+        }
+    );
+    batch_stochastic_step(batch_aux_grid1);
+    // Update density field grids with result of integration
+    // (a copy, not a swap, so that views of the density buffer stay valid)
+    std::copy(batch_aux_grid1.begin(), batch_aux_grid1.end(), density.begin());
+}
+
+int DPLangevinBatch::get_n_replicas() const { return n_replicas; }
+
+double DPLangevinBatch::get_replica_mean_density(const int r) const
+{
+    return replica_mean_densities[r];
+}
+
+const grid_t& DPLangevinBatch::get_batch_density_grid() const
+{
+    return batch_density_grid;
+}
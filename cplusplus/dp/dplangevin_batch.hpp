@@ -0,0 +1,91 @@
+/**
+ * @file dplangevin_batch.hpp
+ * @brief DPLangevin integrator for a batch of independent replicas.
+ *
+ * On small grids, the cost of one simulation is dominated by per-simulation
+ * overheads rather than by integration. So a batch of R replicas of the same
+ * grid, each with its own RNG seed and (optionally) its own linear
+ * coefficient, is integrated here in one go. The replica density fields
+ * are interleaved in a structure-of-arrays grid: the density of replica r
+ * in cell i is held at `i*n_replicas + r`. The neighbor-sum stencil then
+ * walks the grid wiring once per cell for all the replicas, and its
+ * innermost loop runs over contiguous replica values, which the compiler
+ * can vectorize.
+ *
+ * Each replica draws from its own RNG stream, and its arithmetic is the same
+ * as that of a serial `DPLangevin` integration: replica r gives a density
+ * field identical to that of a `SimDP` run with the same seed and linear
+ * coefficient (and grid-mean densities equal up to summation round-off).
+ */
+
+#ifndef DPLANGEVIN_BATCH_HPP
+#define DPLANGEVIN_BATCH_HPP
+
+#include "dplangevin.hpp"
+#include "../core/langevin_sampler.hpp"
+
+/**
+ * @brief DPLangevin integrator for a batch of independent replicas.
+ */
+class DPLangevinBatch : public DPLangevin
+{
+private:
+    //! Number of replicas R integrated together
+    int n_replicas;
+    //! Interleaved density field grids of all the replicas
+    grid_t batch_density_grid;
+    //! Interleaved Runge-Kutta variable grid #1
+    grid_t batch_k1_grid;
+    //! Interleaved Runge-Kutta variable grid #2
+    grid_t batch_k2_grid;
+    //! Interleaved Runge-Kutta variable grid #3
+    grid_t batch_k3_grid;
+    //! Interleaved temporary density grid used to perform an integration step
+    grid_t batch_aux_grid1;
+    //! Interleaved temporary density grid used to perform an integration step
+    grid_t batch_aux_grid2;
+    //! Per-replica sums of neighbor densities of the cell being swept
+    dbl_vec_t neighbor_sums;
+    //! Per-replica RNG seeds
+    int_vec_t replica_seeds;
+    //! Per-replica Mersenne Twister RNG streams
+    std::vector<rng_t> replica_rngs;
+    //! Per-replica Dornic stochastic-step samplers
+    std::vector<DornicSampler> replica_samplers;
+    //! Per-replica grid-average of density field
+    dbl_vec_t replica_mean_densities;
+
+    //! Visit every cell in order, handing `op(i_batch, neighbor_sums, n_neighbors)`
+    //! the index of the cell's first replica value and its neighbor sums
+    template <class Op>
+    void sweep_batch(const grid_t& grid, Op op);
+    //! Dornic stochastic step applied to every replica + mean density update
+    void batch_stochastic_step(grid_t& grid);
+
+public:
+    //! Constructor for a batch of replicas, one per RNG seed
+    DPLangevinBatch(Parameters p, const int_vec_t& random_seeds);
+
+    //! Set each replica's initial condition using its own RNG stream
+    bool initialize_batch_grid(const Parameters parameters);
+    //! Set the shared nonlinear coefficients and each replica's linear one
+    void prepare_batch(
+        const Coefficients& coefficients, const dbl_vec_t& linears
+    );
+    //! Set density field values on the grid edges of every replica
+    void apply_batch_boundary_conditions(
+        const Parameters parameters, int i_epoch
+    );
+    //! Runge-Kutta + stochastic integration of every replica
+    void integrate_batch_rungekutta();
+    //! Explicit Euler + stochastic integration of every replica
+    void integrate_batch_euler();
+    //! Fetch the number of replicas
+    int get_n_replicas() const;
+    //! Fetch the grid-average density of replica r
+    double get_replica_mean_density(const int r) const;
+    //! Expose the interleaved density field grids buffer
+    const grid_t& get_batch_density_grid() const;
+};
+
+#endif
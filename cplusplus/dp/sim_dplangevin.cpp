@@ -3,6 +3,7 @@
  * @brief Constructor for class that manages simulation of DP Langevin equations.
  */ 
 
+#include <algorithm>
 #include "sim_dplangevin.hpp"
 
 /**
@@ -22,6 +23,10 @@
     const InitialCondition initial_condition,
     const dbl_vec_t ic_values,
     const IntegrationMethod integration_method,
+    const RandomGenerator random_generator,
+    const int n_threads,
+    const bool do_active_set,
+    const obs_vec_t observables,
     const bool do_snapshot_grid,
     const bool do_verbose
 ) : coefficients(linear, quadratic, diffusion, noise),
@@ -37,8 +42,12 @@
         bc_values,
         initial_condition, 
         ic_values, 
-        integration_method
+        integration_method,
+        random_generator,
+        n_threads,
+        do_active_set
     ),
+    observables(observables),
     do_snapshot_grid(do_snapshot_grid),
     do_verbose(do_verbose)
 {
@@ -57,6 +66,21 @@
 //! solution state is recorded (after applying boundary conditions).
 bool SimDP::initialize(int n_decimals)
 {
+    // Reject a squared radius without a seed to measure it from up front,
+    // before any grid is allocated or initial condition drawn
+    const bool do_squared_radius = std::find(
+        observables.begin(), observables.end(), Observable::SQUARED_RADIUS
+    )!=observables.end();
+    if (
+        do_squared_radius 
+        and p.initial_condition!=InitialCondition::SINGLE_SEED
+    )
+    {
+        std::cout 
+            << "SimDP::initialize failure: squared radius needs a single seed" 
+            << std::endl;
+        return false;
+    }
     if (not dpLangevin->construct_grid(p)) { 
         std::cout 
             << "SimDP::initialize failure: couldn't construct grid" 
@@ -72,8 +96,24 @@ bool SimDP::initialize(int n_decimals)
     dpLangevin->prepare(coefficients);
     this->n_decimals = n_decimals;
     n_epochs = count_epochs();
-    t_epochs = dbl_vec_t(n_epochs, 0.0);
-    mean_densities = dbl_vec_t(n_epochs, 0.0);
+    // Assign in place, so as not to invalidate any views of these buffers
+    t_epochs.assign(n_epochs, 0.0);
+    // The epoch times are fixed in advance: fill them in now, summed just 
+    // as the run will sum them, so they can be looked up before the run
+    for (auto i=1; i<n_epochs; i++)
+    {
+        t_epochs[i] = (i==1) ? p.dt : round_time(t_epochs[i-1]+p.dt);
+    }
+    mean_densities.assign(n_epochs, 0.0);
+    observable_series.assign(n_epochs*observables.size(), 0.0);
+    dpLangevin->set_do_moments(not observables.empty());
+    if (do_squared_radius and not dpLangevin->prepare_seed_distances(p))
+    {
+        std::cout 
+            << "SimDP::initialize failure: couldn't measure distances from seed" 
+            << std::endl;
+        return false;
+    }
     // Treat epoch#0 as the initial grid state
     // So after initialization, we are nominally at epoch#1
     i_next_epoch = 1;
@@ -88,6 +128,9 @@ bool SimDP::initialize(int n_decimals)
         std::cout << "SimDP::initialize failure: wrong number of boundary conditions" << std::endl;
         return false;
     }
+    has_boundary_source = dpLangevin->has_boundary_source(p);
+    is_absorbed = false;
+    t_absorption = std::numeric_limits<double>::quiet_NaN();
     is_initialized = true;
     return is_initialized;
 }
@@ -107,10 +150,9 @@ bool SimDP::run(const int n_next_epochs)
     return did_integrate;
 }
 
-//! Method to be called after each `run`: the density grid and grid-average time 
-//! series are then packed and made available to Python through the wrapper.
-//! This method should be called every time a "snapshot" of the simulation
-//! state is desired.
+//! Method to be called after each `run`, to check there are results to fetch.
+//! The density grid and grid-average time series no longer need packing for
+//! Python, since the wrapper hands out views of them directly.
 bool SimDP::postprocess()
 {
     if (not is_initialized) { 
@@ -119,13 +161,5 @@ bool SimDP::postprocess()
             << std::endl;
         return false; 
     }
-    bool did_process_grid;
-    if (do_snapshot_grid) { 
-        did_process_grid = pyprep_density_grid(); 
-    }
-    else { did_process_grid = true; }
-    bool did_process_time_series = (
-        pyprep_t_epochs() and pyprep_mean_densities() 
-    ); 
-    return (did_process_grid and did_process_time_series);
+    return true;
 }
\ No newline at end of file
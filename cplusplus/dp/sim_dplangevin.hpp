@@ -6,14 +6,46 @@
 #ifndef SIMDP_HPP
 #define SIMDP_HPP
 
+#include <limits>
+#include <memory>
+#include <string>
 #include "dplangevin.hpp"
 
+//! Round a time to 15 decimal places, to stop round-off accumulating in Σ Δt
+double round_time(const double time);
+//! Count the number of epochs, including epoch #0, from t=0 to t_final in steps Δt
+int count_epochs(const double t_final, const double dt);
+//! Size in bytes of a NumPy array element
+const py::ssize_t itemsize = sizeof(double);
+//! Wrap a C++ buffer as a read-only NumPy view kept alive by `base`, or copy it
+py::array view_buffer(
+    const double* data,
+    const std::vector<py::ssize_t> shape, 
+    const std::vector<py::ssize_t> strides,
+    const py::handle base,
+    const bool copy,
+    const py::dtype dtype = py::dtype::of<double>()
+);
+//! Name of the field recording a grid observable
+std::string observable_name(const Observable observable);
+
 /**
  * @brief Class that manages simulation of DPLangevin equation.
  *
  * Manages & executes model simulation using instances of 
  * the DPLangevin integrator class, the Coefficients struct, and the 
  * Parameters struct.
+ *
+ * Instances are thread-independent: each owns its grids, RNG and integrator,
+ * so distinct instances can be initialized and run concurrently
+ * (the Python wrapper releases the GIL to allow this).
+ *
+ * The density grid and time series are handed to Python as read-only NumPy
+ * views of the C++ buffers, which keep the owning Python object alive:
+ * they cost nothing to fetch, and they follow the simulation as it runs.
+ * The buffers are allocated once, on initialization, so views stay valid
+ * until the simulation is re-initialized with a different number of epochs.
+ * Fetch with `copy=True` to take an independent (writeable) snapshot.
  */
 class SimDP 
 {
@@ -30,32 +62,37 @@ private:
     void (DPLangevin::*integrator)(rng_t&);
     
     //! Total number of simulation time steps aka "epochs"
-    int n_epochs;
+    int n_epochs = 0;
     //! Index of current epoch aka time step
     int i_current_epoch = 0;
     //! Index of next epoch aka time step
-    int i_next_epoch;
+    int i_next_epoch = 0;
     //! Time of current epoch
     double t_current_epoch = 0.0;
     //! Time of next epoch
-    double t_next_epoch;
+    double t_next_epoch = 0.0;
     //! Vector time-series of epochs
     dbl_vec_t t_epochs;
     //! Truncation number of decimal places when summing Δt
-    int n_decimals;
+    int n_decimals = 0;
     //! Vector time-series of grid-averaged field density values
     dbl_vec_t mean_densities;
-    //! Python-compatible array of epochs time-series
-    py_array_t pyarray_t_epochs;
-    //! Python-compatible array of mean density time-series
-    py_array_t pyarray_mean_densities;
-    //! Python-compatible array of current density grid
-    py_array_t pyarray_density;
+    //! Grid observables to record at every epoch
+    obs_vec_t observables;
+    //! Time series of the grid observables, epoch by epoch
+    dbl_vec_t observable_series;
+    //! Flag whether boundary conditions can reinject density into the grid
+    bool has_boundary_source = false;
+    //! Flag whether the density field has reached the absorbing state ρ=0
+    bool is_absorbed = false;
+    //! Time at which the density field reached the absorbing state
+    double t_absorption = std::numeric_limits<double>::quiet_NaN();
     //! Flag whether integration step was successful or not
     bool did_integrate = false;
     //! Flag whether simulation has been initialized or not
     bool is_initialized = false;
-    //! Flag whether to take density grid snapshots
+    //! Flag whether density grid snapshots are wanted 
+    //! (views of the grid are available regardless)
     bool do_snapshot_grid = true;
     //! Flag whether to report sim parameters etc
     bool do_verbose = false;
@@ -66,13 +103,10 @@ private:
     bool choose_integrator();
     //! Perform Dornic-type integration of the DP Langevin equation for `n_next_epochs`
     bool integrate(const int n_next_epochs);
-
-    //! Generate a Python-compatible version of the epochs time-series vector
-    bool pyprep_t_epochs();
-    //! Generate a Python-compatible version of the mean densities time-series vector
-    bool pyprep_mean_densities();
-    //! Generate a Python-compatible version of the current density grid
-    bool pyprep_density_grid();
+    //! Check for absorption at epoch i, time t; if so, fill in all later epochs
+    bool check_absorption(const int i, const double t);
+    //! Record the grid observables at epoch i from the latest grid moments
+    void record_observables(const int i);
 
 public:
     //! Constructor
@@ -90,6 +124,10 @@ public:
         const InitialCondition initial_condition,
         const dbl_vec_t ic_values,
         const IntegrationMethod integration_method,
+        const RandomGenerator random_generator,
+        const int n_threads,
+        const bool do_active_set,
+        const obs_vec_t observables,
         const bool do_snapshot_grid,
         const bool do_verbose
     );
@@ -99,6 +137,18 @@ public:
     bool run(const int n_next_epochs);
     //! Process the model results data if available
     bool postprocess();
+    //! Serialize the evolving simulation state into a byte string
+    std::string serialize() const;
+    //! Restore the simulation state from a byte string made by `serialize`
+    bool deserialize(const std::string& state);
+    //! Write the simulation state to a checkpoint file
+    bool checkpoint(const std::string& path) const;
+    //! Restore the simulation state from a checkpoint file
+    bool restore(const std::string& path);
+    //! Pickle the simulation, with its state, into a Python tuple
+    py::tuple get_state() const;
+    //! Unpickle a simulation from a Python tuple made by `get_state`
+    static std::unique_ptr<SimDP> from_state(const py::tuple state);
 
     // Utilities provided to Python via the wrapper
 
@@ -112,12 +162,20 @@ public:
     double get_t_current_epoch() const;
     //! Fetch the next epoch (time) of the simulation
     double get_t_next_epoch() const;
-    //! Fetch a times-series vector of the simulation epochs as a Python array
-    py_array_t get_t_epochs() const;
-    //! Fetch a times-series vector of the grid-averaged density field over time as a Python array
-    py_array_t get_mean_densities() const;
-    //! Fetch the current Langevin density field grid as a Python array
-    py_array_t get_density() const;
+    //! Fetch a times-series vector of the simulation epochs as a NumPy view (or copy)
+    py::array get_t_epochs(const py::handle base, const bool copy) const;
+    //! Fetch a times-series vector of the grid-averaged density field over time as a NumPy view (or copy)
+    py::array get_mean_densities(const py::handle base, const bool copy) const;
+    //! Fetch whether the simulation has been initialized
+    bool get_is_initialized() const;
+    //! Fetch whether the density field has reached the absorbing state
+    bool get_is_absorbed() const;
+    //! Fetch the time of absorption (NaN if not absorbed)
+    double get_t_absorption() const;
+    //! Fetch the current Langevin density field grid as an (n_x, n_y) NumPy view (or copy)
+    py::array get_density(const py::handle base, const bool copy) const;
+    //! Fetch the time series of the grid observables as a structured NumPy view (or copy)
+    py::array get_observables(const py::handle base, const bool copy) const;
 };
 
 
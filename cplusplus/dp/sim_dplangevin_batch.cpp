@@ -0,0 +1,190 @@
+/**
+ * @file sim_dplangevin_batch.cpp
+ * @brief Class that manages simulation of a batch of DPLangevin replicas.
+ */ 
+
+#include "sim_dplangevin_batch.hpp"
+
+/**
+ * @details Constructor for class that manages simulation of a batch 
+ * of DP Langevin replicas. If no per-replica linear coefficients are given,
+ * all replicas take the `linear` coefficient.
+ */
+SimDPBatch::SimDPBatch(
+    const double linear, const double quadratic,
+    const double diffusion, const double noise, 
+    const double t_final, 
+    const double dx, const double dt, 
+    const int_vec_t random_seeds,
+    const dbl_vec_t linears,
+    const GridDimension grid_dimension,
+    const int_vec_t grid_size,
+    const gt_vec_t grid_topologies,
+    const bc_vec_t boundary_conditions,
+    const dbl_vec_t bc_values,
+    const InitialCondition initial_condition,
+    const dbl_vec_t ic_values,
+    const IntegrationMethod integration_method,
+    const RandomGenerator random_generator,
+    const bool do_snapshot_grid,
+    const bool do_verbose
+) : coefficients(linear, quadratic, diffusion, noise),
+    p(
+        t_final, 
+        dx, 
+        dt, 
+        (random_seeds.empty()) ? 0 : random_seeds.at(0),
+        grid_dimension, 
+        grid_size, 
+        grid_topologies,
+        boundary_conditions,
+        bc_values,
+        initial_condition, 
+        ic_values, 
+        integration_method,
+        random_generator,
+        1,
+        false
+    ),
+    random_seeds(random_seeds),
+    linears((linears.empty()) ? dbl_vec_t(random_seeds.size(), linear) : linears),
+    n_replicas(random_seeds.size()),
+    do_snapshot_grid(do_snapshot_grid),
+    do_verbose(do_verbose)
+{
+    dpLangevinBatch = std::make_unique<DPLangevinBatch>(p, random_seeds);
+    if (do_verbose) 
+    {
+        coefficients.print();
+        p.print();
+        std::cout << "n_replicas: " << n_replicas << std::endl;
+    }
+}
+
+//! Method to be called first to set up the simulations: 
+//! a grid is constructed; each replica's initial condition is applied; 
+//! the Langevin equation is prepared for each replica.
+bool SimDPBatch::initialize(int n_decimals)
+{
+    if (n_replicas<1) { 
+        std::cout 
+            << "SimDPBatch::initialize failure: no random seeds given" 
+            << std::endl;
+        return false; 
+    }
+    if (linears.size()!=n_replicas) { 
+        std::cout 
+            << "SimDPBatch::initialize failure: need one linear coefficient per random seed" 
+            << std::endl;
+        return false; 
+    }
+    if (not dpLangevinBatch->construct_grid(p)) { 
+        std::cout 
+            << "SimDPBatch::initialize failure: couldn't construct grid" 
+            << std::endl;
+        return false; 
+    }
+    if (not dpLangevinBatch->initialize_batch_grid(p)) { 
+        std::cout 
+            << "SimDPBatch::initialize failure: couldn't initialize grid" 
+            << std::endl;
+        return false; 
+    }
+    dpLangevinBatch->prepare_batch(coefficients, linears);
+    this->n_decimals = n_decimals;
+    n_epochs = count_epochs(p.t_final, p.dt);
+    // Assign in place, so as not to invalidate any views of these buffers
+    t_epochs.assign(n_epochs, 0.0);
+    mean_densities.assign(n_replicas*n_epochs, 0.0);
+    // Treat epoch#0 as the initial grid state
+    // So after initialization, we are nominally at epoch#1
+    i_next_epoch = 1;
+    t_next_epoch = p.dt;
+    if (not choose_integrator())
+    { 
+        std::cout << "SimDPBatch::initialize failure: unable to choose integrator" << std::endl;
+        return false; 
+    }        
+    if (not dpLangevinBatch->check_boundary_conditions(p))
+    {
+        std::cout << "SimDPBatch::initialize failure: wrong number of boundary conditions" << std::endl;
+        return false;
+    }
+    has_boundary_source = dpLangevinBatch->has_boundary_source(p);
+    n_absorbed = 0;
+    are_absorbed = std::vector<bool>(n_replicas, false);
+    t_absorptions = dbl_vec_t(
+        n_replicas, std::numeric_limits<double>::quiet_NaN()
+    );
+    is_initialized = true;
+    return is_initialized;
+}
+
+//! Method to carry out a set of integration steps of all replicas; 
+//! can be rerun repeatedly to segment the overall simulations.
+bool SimDPBatch::run(const int n_next_epochs)
+{
+    if (not is_initialized) 
+    { 
+        std::cout << "SimDPBatch::run failure: must initialize first" << std::endl;
+        return false; 
+    }
+    did_integrate = integrate(n_next_epochs);
+    return did_integrate;
+}
+
+//! Method to be called after each `run`, to check there are results to fetch:
+//! as for SimDP, the wrapper hands out views of the results directly.
+bool SimDPBatch::postprocess()
+{
+    if (not is_initialized) { 
+        std::cout 
+            << "SimDPBatch::postprocess failure: no data to process yet" 
+            << std::endl;
+        return false; 
+    }
+    return true;
+}
+
+int SimDPBatch::get_n_replicas() const { return n_replicas; }
+int SimDPBatch::get_n_epochs() const { return n_epochs; }
+int SimDPBatch::get_i_current_epoch() const { return i_current_epoch; }
+int SimDPBatch::get_i_next_epoch() const { return i_next_epoch; }
+double SimDPBatch::get_t_current_epoch() const { return t_current_epoch; }
+double SimDPBatch::get_t_next_epoch() const { return t_next_epoch; }
+py_array_t SimDPBatch::get_t_absorptions() const
+{
+    return py_array_t(n_replicas, t_absorptions.data());
+}
+
+py::array SimDPBatch::get_t_epochs(const py::handle base, const bool copy) 
+    const
+{
+    return view_buffer(
+        t_epochs.data(), {n_epochs}, {itemsize}, base, copy
+    );
+}
+
+py::array SimDPBatch::get_mean_densities(
+    const py::handle base, const bool copy
+) const
+{
+    return view_buffer(
+        mean_densities.data(), 
+        {n_replicas, n_epochs}, {n_epochs*itemsize, itemsize}, 
+        base, copy
+    );
+}
+
+//! The grids are interleaved by replica, at i*R + r for cell i = x + y*n_x,
+//! so an (R, n_x, n_y) view of them just needs the right strides
+py::array SimDPBatch::get_density(const py::handle base, const bool copy) 
+    const
+{
+    return view_buffer(
+        dpLangevinBatch->get_batch_density_grid().data(),
+        {n_replicas, p.n_x, p.n_y}, 
+        {itemsize, n_replicas*itemsize, p.n_x*n_replicas*itemsize}, 
+        base, copy
+    );
+}
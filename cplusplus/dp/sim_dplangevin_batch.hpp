@@ -0,0 +1,133 @@
+/**
+ * @file sim_dplangevin_batch.hpp
+ * @brief Class that manages simulation of a batch of DPLangevin replicas.
+ */
+
+#ifndef SIMDP_BATCH_HPP
+#define SIMDP_BATCH_HPP
+
+#include "sim_dplangevin.hpp"
+#include "dplangevin_batch.hpp"
+
+/**
+ * @brief Class that manages simulation of a batch of DPLangevin replicas.
+ *
+ * Manages & executes R independent simulations of the same grid, one per
+ * RNG seed, each optionally with its own linear coefficient, using a single
+ * instance of the DPLangevinBatch integrator class. Time series of
+ * grid-averaged density are returned as an (R, n_epochs) array.
+ * As for SimDP, results are handed to Python as read-only NumPy views
+ * of the C++ buffers, or as copies if requested.
+ */
+class SimDPBatch
+{
+private:
+    //! Langevin equation coefficients shared by all replicas
+    Coefficients coefficients;
+    //! Model simulation parameters
+    Parameters p;
+    //! Per-replica RNG seeds
+    int_vec_t random_seeds;
+    //! Per-replica linear coefficients
+    dbl_vec_t linears;
+    //! Number of replicas R
+    int n_replicas;
+    //! Instance of batched DP Langevin integrator class (owned pointer)
+    std::unique_ptr<DPLangevinBatch> dpLangevinBatch;
+    //! Integrator: either a Runge-Kutta or an Euler method
+    void (DPLangevinBatch::*integrator)();
+
+    //! Total number of simulation time steps aka "epochs"
+    int n_epochs = 0;
+    //! Index of current epoch aka time step
+    int i_current_epoch = 0;
+    //! Index of next epoch aka time step
+    int i_next_epoch = 0;
+    //! Time of current epoch
+    double t_current_epoch = 0.0;
+    //! Time of next epoch
+    double t_next_epoch = 0.0;
+    //! Vector time-series of epochs
+    dbl_vec_t t_epochs;
+    //! Truncation number of decimal places when summing Δt
+    int n_decimals = 0;
+    //! Time series of grid-averaged field density, replica by replica
+    dbl_vec_t mean_densities;
+    //! Flag whether boundary conditions can reinject density into the grid
+    bool has_boundary_source = false;
+    //! Number of replicas that have reached the absorbing state ρ=0
+    int n_absorbed = 0;
+    //! Per-replica flag whether the absorbing state has been reached
+    std::vector<bool> are_absorbed;
+    //! Per-replica time of reaching the absorbing state (NaN if not yet)
+    dbl_vec_t t_absorptions;
+    //! Flag whether integration step was successful or not
+    bool did_integrate = false;
+    //! Flag whether simulation has been initialized or not
+    bool is_initialized = false;
+    //! Flag whether density grid snapshots are wanted 
+    //! (views of the grids are available regardless)
+    bool do_snapshot_grid = false;
+    //! Flag whether to report sim parameters etc
+    bool do_verbose = false;
+
+    //! Chooses function implementing either Runge-Kutta or Euler integration methods
+    bool choose_integrator();
+    //! Record the mean densities of all replicas at epoch i, time t
+    void record_epoch(const int i, const double t);
+    //! Perform Dornic-type integration of all replicas for `n_next_epochs`
+    bool integrate(const int n_next_epochs);
+
+public:
+    //! Constructor
+    SimDPBatch(
+        const double linear, const double quadratic,
+        const double diffusion, const double noise,
+        const double t_final,
+        const double dx, const double dt,
+        const int_vec_t random_seeds,
+        const dbl_vec_t linears,
+        const GridDimension grid_dimension,
+        const int_vec_t grid_size,
+        const gt_vec_t grid_topologies,
+        const bc_vec_t boundary_conditions,
+        const dbl_vec_t bc_values,
+        const InitialCondition initial_condition,
+        const dbl_vec_t ic_values,
+        const IntegrationMethod integration_method,
+        const RandomGenerator random_generator,
+        const bool do_snapshot_grid,
+        const bool do_verbose
+    );
+    //! Initialize the model simulations
+    bool initialize(int n_decimals);
+    //! Execute the model simulations for `n_next_epochs`
+    bool run(const int n_next_epochs);
+    //! Process the model results data if available
+    bool postprocess();
+
+    // Utilities provided to Python via the wrapper
+
+    //! Fetch the number of replicas
+    int get_n_replicas() const;
+    //! Fetch the total number of simulation epochs
+    int get_n_epochs() const;
+    //! Fetch the index of the current epoch of the simulations
+    int get_i_current_epoch() const;
+    //! Fetch the index of the next epoch of the simulations
+    int get_i_next_epoch() const;
+    //! Fetch the current epoch (time) of the simulations
+    double get_t_current_epoch() const;
+    //! Fetch the next epoch (time) of the simulations
+    double get_t_next_epoch() const;
+    //! Fetch a times-series vector of the simulation epochs as a NumPy view (or copy)
+    py::array get_t_epochs(const py::handle base, const bool copy) const;
+    //! Fetch the (R, n_epochs) grid-averaged density time series as a NumPy view (or copy)
+    py::array get_mean_densities(const py::handle base, const bool copy) const;
+    //! Fetch the per-replica times of absorption (NaN if not absorbed)
+    py_array_t get_t_absorptions() const;
+    //! Fetch the (R, n_x, n_y) current density field grids as a NumPy view (or copy)
+    py::array get_density(const py::handle base, const bool copy) const;
+};
+
+#endif
@@ -0,0 +1,89 @@
+/**
+ * @file sim_dplangevin_batch_private.cpp
+ * @brief Class to manage & run a batch of DPLangevin replicas: private methods.
+ */ 
+
+#include "sim_dplangevin_batch.hpp"
+
+bool SimDPBatch::choose_integrator()
+{
+    switch (p.integration_method)
+    {
+        case (IntegrationMethod::RUNGE_KUTTA):
+            integrator = &DPLangevinBatch::integrate_batch_rungekutta;
+            return true;
+        case (IntegrationMethod::EULER):
+            integrator = &DPLangevinBatch::integrate_batch_euler;
+            return true;
+        default:
+            return false;
+    }
+}
+
+//! Record each replica's mean density, noting any newly absorbed replica;
+//! once every replica is absorbed (and no boundary condition can reinject
+//! density), fill the remaining epochs, whose mean densities are all zero
+void SimDPBatch::record_epoch(const int i, const double t)
+{
+    t_epochs[i] = t;
+    for (auto r=0; r<n_replicas; r++)
+    {
+        const double mean_density = dpLangevinBatch->get_replica_mean_density(r);
+        mean_densities[r*n_epochs+i] = mean_density;
+        if (not has_boundary_source and mean_density==0.0 and not are_absorbed[r])
+        {
+            are_absorbed[r] = true;
+            t_absorptions[r] = t;
+            n_absorbed++;
+        }
+    }
+    if (n_absorbed<n_replicas) { return; }
+    double t_j = t;
+    for (auto j=i+1; j<n_epochs; j++)
+    {
+        t_j = round_time(t_j+p.dt);
+        t_epochs[j] = t_j;
+    }
+}
+
+bool SimDPBatch::integrate(const int n_next_epochs)
+{
+    // Check a further n_next_epochs won't exceed total permitted steps
+    if (t_epochs.size() < i_next_epoch+n_next_epochs)
+    {
+        std::cout << "Too many epochs: " 
+            << t_epochs.size() 
+            << " < " 
+            << i_next_epoch+n_next_epochs 
+            << std::endl;
+        return false;
+    }
+    int i;
+    double t; 
+    // For the very first epoch, record mean densities right now
+    if (i_next_epoch==1) { 
+        dpLangevinBatch->apply_batch_boundary_conditions(p, 0);
+        i_current_epoch = 0;
+        t_current_epoch = 0;
+        record_epoch(0, 0);
+    }
+    for (
+        i=i_next_epoch, t=t_next_epoch; 
+        i<i_next_epoch+n_next_epochs; 
+        t=round_time(t+p.dt), i++
+    )
+    {
+        i_current_epoch = i;
+        t_current_epoch = t;
+        // Once all replicas are absorbed, the time series are filled in
+        if (n_absorbed==n_replicas) { continue; }
+        dpLangevinBatch->apply_batch_boundary_conditions(p, i);
+        dpLangevinBatch->set_epoch(i);
+        ((*dpLangevinBatch).*integrator)();
+        record_epoch(i, t);
+    };
+    // Set epoch and time counters to point to *after* the last integration step
+    i_next_epoch = i;
+    t_next_epoch = t;
+    return true;
+}
@@ -0,0 +1,264 @@
+/**
+ * @file sim_dplangevin_checkpoint.cpp
+ * @brief Checkpoint, restore & pickling of a DPLangevin model simulation.
+ */ 
+
+#include <algorithm>
+#include <fstream>
+#include <stdexcept>
+// Essential for STL container conversions
+#include <pybind11/stl.h>
+#include "sim_dplangevin.hpp"
+#include "../core/langevin_checkpoint.hpp"
+
+//! Serialize everything a restarted simulation needs to carry on exactly 
+//! as if uninterrupted: the epoch counters, the time series (including any 
+//! observables) recorded so far, the absorption state, the main RNG, and the integrator state 
+//! (density grid and chunk RNG streams).
+//! Model coefficients & parameters are not included: the simulation to be 
+//! restored must be constructed with the same ones.
+std::string SimDP::serialize() const
+{
+    std::ostringstream stream(std::ios::binary);
+    stream.write(checkpoint_magic.data(), checkpoint_magic.size());
+    write_value(stream, checkpoint_format);
+    write_value(stream, n_decimals);
+    write_value(stream, n_epochs);
+    write_value(stream, i_current_epoch);
+    write_value(stream, i_next_epoch);
+    write_value(stream, t_current_epoch);
+    write_value(stream, t_next_epoch);
+    write_value(stream, is_absorbed);
+    write_value(stream, t_absorption);
+    write_vector(stream, t_epochs);
+    write_vector(stream, mean_densities);
+    write_vector(stream, observable_series);
+    write_rng(stream, *rng);
+    dpLangevin->save_state(stream);
+    return stream.str();
+}
+
+//! Restore the state serialized by `serialize`, initializing the simulation
+//! first if need be. The whole record is read and checked, against the 
+//! sizes set by the parameters, before the simulation is initialized or
+//! any of the record adopted, so a failed restore leaves the simulation 
+//! as it was, initialized or not.
+//! The time series and the density grid are overwritten in place, 
+//! so existing views of them stay valid.
+bool SimDP::deserialize(const std::string& state)
+{
+    std::istringstream stream(state, std::ios::binary);
+    std::string magic(checkpoint_magic.size(), '\0');
+    int format;
+    int n_decimals_;
+    stream.read(magic.data(), magic.size());
+    if (
+        not stream or magic!=checkpoint_magic 
+        or not read_value(stream, format) or format!=checkpoint_format
+        or not read_value(stream, n_decimals_)
+    )
+    {
+        std::cout 
+            << "SimDP::deserialize failure: not a SimDP checkpoint" 
+            << std::endl;
+        return false;
+    }
+    // The number of epochs is fixed by the parameters, even before
+    // the sim is initialized
+    const int n_epochs_expected = count_epochs();
+    int n_epochs_;
+    if (not read_value(stream, n_epochs_) or n_epochs_!=n_epochs_expected)
+    {
+        std::cout 
+            << "SimDP::deserialize failure: checkpoint has " 
+            << n_epochs_ << " epochs, not " << n_epochs_expected 
+            << std::endl;
+        return false;
+    }
+    int i_current_epoch_;
+    int i_next_epoch_;
+    double t_current_epoch_;
+    double t_next_epoch_;
+    bool is_absorbed_;
+    double t_absorption_;
+    dbl_vec_t t_epochs_(n_epochs_expected);
+    dbl_vec_t mean_densities_(n_epochs_expected);
+    dbl_vec_t observable_series_(n_epochs_expected*observables.size());
+    rng_t rng_;
+    IntegratorState integrator_state_;
+    if (
+        not read_value(stream, i_current_epoch_)
+        or not read_value(stream, i_next_epoch_)
+        or not read_value(stream, t_current_epoch_)
+        or not read_value(stream, t_next_epoch_)
+        or not read_value(stream, is_absorbed_)
+        or not read_value(stream, t_absorption_)
+        or not read_vector(stream, t_epochs_)
+        or not read_vector(stream, mean_densities_)
+        or not read_vector(stream, observable_series_)
+        or not read_rng(stream, rng_)
+        or not BaseLangevin::read_state(stream, p, integrator_state_)
+    )
+    {
+        std::cout 
+            << "SimDP::deserialize failure: checkpoint doesn't match this sim" 
+            << std::endl;
+        return false;
+    }
+    // Only now is the record known to be sound: set up the sim to adopt it
+    if (not is_initialized and not initialize(n_decimals_)) { return false; }
+    dpLangevin->adopt_state(integrator_state_);
+    n_decimals = n_decimals_;
+    i_current_epoch = i_current_epoch_;
+    i_next_epoch = i_next_epoch_;
+    t_current_epoch = t_current_epoch_;
+    t_next_epoch = t_next_epoch_;
+    is_absorbed = is_absorbed_;
+    t_absorption = t_absorption_;
+    std::copy(t_epochs_.begin(), t_epochs_.end(), t_epochs.begin());
+    std::copy(
+        mean_densities_.begin(), mean_densities_.end(), mean_densities.begin()
+    );
+    std::copy(
+        observable_series_.begin(), observable_series_.end(), 
+        observable_series.begin()
+    );
+    *rng = rng_;
+    return true;
+}
+
+//! Write the simulation state to a binary checkpoint file
+bool SimDP::checkpoint(const std::string& path) const
+{
+    if (not is_initialized) 
+    { 
+        std::cout 
+            << "SimDP::checkpoint failure: must initialize first" 
+            << std::endl;
+        return false; 
+    }
+    std::ofstream file(path, std::ios::binary | std::ios::trunc);
+    const std::string state = serialize();
+    file.write(state.data(), state.size());
+    file.close();
+    if (not file)
+    {
+        std::cout 
+            << "SimDP::checkpoint failure: couldn't write " << path 
+            << std::endl;
+        return false;
+    }
+    return true;
+}
+
+//! Restore the simulation state from a binary checkpoint file
+bool SimDP::restore(const std::string& path)
+{
+    std::ifstream file(path, std::ios::binary);
+    if (not file)
+    {
+        std::cout 
+            << "SimDP::restore failure: couldn't read " << path 
+            << std::endl;
+        return false;
+    }
+    std::ostringstream state;
+    state << file.rdbuf();
+    return deserialize(state.str());
+}
+
+//! Pickle the simulation: its coefficients & parameters, as constructor
+//! arguments (with enums as integers), followed by the byte string of its 
+//! serialized state, which holds the grid & time series as raw binary
+//! (empty if the simulation has not been initialized)
+py::tuple SimDP::get_state() const
+{
+    auto to_ints = [](const auto& enums)
+    {
+        int_vec_t ints;
+        for (const auto& value : enums)
+        {
+            ints.push_back(static_cast<int>(value));
+        }
+        return ints;
+    };
+    return py::make_tuple(
+        checkpoint_format,
+        py::make_tuple(
+            coefficients.linear, coefficients.quadratic, 
+            coefficients.diffusion, coefficients.noise
+        ),
+        py::make_tuple(
+            p.t_final, p.dx, p.dt, p.random_seed,
+            static_cast<int>(p.grid_dimension),
+            p.grid_size,
+            to_ints(p.grid_topologies),
+            to_ints(p.boundary_conditions),
+            p.bc_values,
+            static_cast<int>(p.initial_condition),
+            p.ic_values,
+            static_cast<int>(p.integration_method),
+            static_cast<int>(p.random_generator),
+            p.n_threads,
+            p.do_active_set,
+            to_ints(observables)
+        ),
+        do_snapshot_grid,
+        do_verbose,
+        py::bytes(is_initialized ? serialize() : std::string())
+    );
+}
+
+//! Unpickle a simulation: construct it afresh from its coefficients & 
+//! parameters, then restore its serialized state, if any
+std::unique_ptr<SimDP> SimDP::from_state(const py::tuple state)
+{
+    if (state.size()!=6 or state[0].cast<int>()!=checkpoint_format)
+    {
+        throw std::runtime_error("SimDP unpickling failure: invalid state");
+    }
+    const auto c = state[1].cast<py::tuple>();
+    const auto q = state[2].cast<py::tuple>();
+    gt_vec_t grid_topologies;
+    for (const auto& value : q[6].cast<int_vec_t>())
+    {
+        grid_topologies.push_back(static_cast<GridTopology>(value));
+    }
+    bc_vec_t boundary_conditions;
+    for (const auto& value : q[7].cast<int_vec_t>())
+    {
+        boundary_conditions.push_back(static_cast<BoundaryCondition>(value));
+    }
+    obs_vec_t observables;
+    for (const auto& value : q[15].cast<int_vec_t>())
+    {
+        observables.push_back(static_cast<Observable>(value));
+    }
+    auto sim = std::make_unique<SimDP>(
+        c[0].cast<double>(), c[1].cast<double>(), 
+        c[2].cast<double>(), c[3].cast<double>(),
+        q[0].cast<double>(), 
+        q[1].cast<double>(), q[2].cast<double>(), 
+        q[3].cast<int>(),
+        static_cast<GridDimension>(q[4].cast<int>()),
+        q[5].cast<int_vec_t>(),
+        grid_topologies,
+        boundary_conditions,
+        q[8].cast<dbl_vec_t>(),
+        static_cast<InitialCondition>(q[9].cast<int>()),
+        q[10].cast<dbl_vec_t>(),
+        static_cast<IntegrationMethod>(q[11].cast<int>()),
+        static_cast<RandomGenerator>(q[12].cast<int>()),
+        q[13].cast<int>(),
+        q[14].cast<bool>(),
+        observables,
+        state[3].cast<bool>(),
+        state[4].cast<bool>()
+    );
+    const std::string serialized_state = state[5].cast<std::string>();
+    if (not serialized_state.empty() and not sim->deserialize(serialized_state))
+    {
+        throw std::runtime_error("SimDP unpickling failure: invalid state");
+    }
+    return sim;
+}
@@ -3,6 +3,7 @@
  * @brief Class to manage & run DPLangevin model simulation: private methods.
  */ 
 
+#include <cmath>
 #include "sim_dplangevin.hpp"
 
 // double round_up(const double value, const int n_decimals) {
@@ -29,17 +30,19 @@ double round_time(const double time) {
 }
 
 //! Count total number of time steps, just in case rounding causes problems
-int SimDP::count_epochs() const
+int count_epochs(const double t_final, const double dt)
 {
     int n_epochs;
     double t=0; 
-    for (n_epochs=0; t<p.t_final; t=round_time(t+p.dt)) 
+    for (n_epochs=0; t<t_final; t=round_time(t+dt)) 
     {
         n_epochs++;
     }
     return n_epochs+1;
 }
 
+int SimDP::count_epochs() const { return ::count_epochs(p.t_final, p.dt); }
+
 bool SimDP::choose_integrator()
 {
     switch (p.integration_method)
@@ -55,6 +58,67 @@ bool SimDP::choose_integrator()
     }
 }
 
+//! DP has an absorbing state: once the density is zero everywhere, and no
+//! boundary condition can reinject density, the grid can never change again. 
+//! So, at absorption, record the time and fill the remaining epochs 
+//! of the time series with zero density.
+bool SimDP::check_absorption(const int i, const double t)
+{
+    if (has_boundary_source or mean_densities[i]!=0.0) { return false; }
+    is_absorbed = true;
+    t_absorption = t;
+    double t_j = t;
+    for (auto j=i+1; j<n_epochs; j++)
+    {
+        t_j = round_time(t_j+p.dt);
+        t_epochs[j] = t_j;
+        mean_densities[j] = 0.0;
+    }
+    std::fill(
+        observable_series.begin() + (i+1)*observables.size(), 
+        observable_series.end(), 
+        0.0
+    );
+    return true;
+}
+
+//! Convert the grid moments computed by the integrator, along with the 
+//! grid-mean density, into the requested observables
+void SimDP::record_observables(const int i)
+{
+    if (observables.empty()) { return; }
+    const GridMoments& moments = dpLangevin->get_grid_moments();
+    const double n_cells = static_cast<double>(p.n_cells);
+    const double cell_volume 
+        = std::pow(p.dx, static_cast<int>(p.grid_dimension));
+    double* record = observable_series.data() + i*observables.size();
+    for (const auto& observable : observables)
+    {
+        switch (observable)
+        {
+            case (Observable::MEAN_SQUARED_DENSITY):
+                *record = moments.sum_sq/n_cells;
+                break;
+            case (Observable::ACTIVE_FRACTION):
+                *record = moments.n_active/n_cells;
+                break;
+            case (Observable::SURVIVAL):
+                *record = (moments.n_active>0) ? 1.0 : 0.0;
+                break;
+            case (Observable::MAX_DENSITY):
+                *record = moments.max;
+                break;
+            case (Observable::TOTAL_MASS):
+                *record = moments.sum*cell_volume;
+                break;
+            case (Observable::SQUARED_RADIUS):
+                *record = (moments.sum>0.0) ? moments.sum_r2/moments.sum : 0.0;
+                break;
+        }
+        record++;
+    }
+}
+
 bool SimDP::integrate(const int n_next_epochs)
 {
     // Check a further n_next_epochs won't exceed total permitted steps
@@ -75,8 +139,14 @@ bool SimDP::integrate(const int n_next_epochs)
     if (i_next_epoch==1) { 
         dpLangevin->apply_boundary_conditions(p, 0);
         mean_densities[0] = dpLangevin->get_mean_density(); 
+        if (not observables.empty())
+        {
+            dpLangevin->measure_grid_moments();
+            record_observables(0);
+        }
         i_current_epoch = 0;
         t_current_epoch = 0;
+        check_absorption(0, 0);
     }
     // Loop over integration steps.
     // Effectively increment epoch counter and add to Δt to time counter
@@ -89,62 +159,23 @@ bool SimDP::integrate(const int n_next_epochs)
         t=round_time(t+p.dt), i++
     )
     {
+        i_current_epoch = i;
+        t_current_epoch = t;
+        // Once absorbed, the rest of the time series is already filled in
+        if (is_absorbed) { continue; }
         // Reapply boundary conditions prior to integrating
         dpLangevin->apply_boundary_conditions(p, i);
         // Perform a single integration over Δt
+        dpLangevin->set_epoch(i);
         (dpLangevin->*integrator)(*rng);
         // Record this epoch
         t_epochs[i] = t;
         mean_densities[i] = dpLangevin->get_mean_density();
-        i_current_epoch = i;
-        t_current_epoch = t;
+        record_observables(i);
+        check_absorption(i, t);
     };
     // Set epoch and time counters to point to *after* the last integration step
     i_next_epoch = i;
     t_next_epoch = t;
     return true;
 }
-
-bool SimDP::pyprep_t_epochs()
-{
-    py_array_t epochs_array(n_epochs);
-    auto epochs_proxy = epochs_array.mutable_unchecked();
-    for (auto i=0; i<n_epochs; i++)
-    {
-        epochs_proxy(i) = t_epochs[i];
-    };
-    pyarray_t_epochs = epochs_array;
-    return true;
-}
-
-bool SimDP::pyprep_mean_densities()
-{
-    py_array_t mean_densities_array(n_epochs);
-    auto mean_densities_proxy = mean_densities_array.mutable_unchecked();
-    for (auto i=0; i<n_epochs; i++)
-    {
-        mean_densities_proxy(i) = mean_densities[i];
-    };
-    pyarray_mean_densities = mean_densities_array;
-    return true;
-}
-
-bool SimDP::pyprep_density_grid()
-{
-    if (not (p.n_cells == p.n_x * p.n_y * p.n_z)) 
-    { 
-        std::cout << "prep_density: grid size problem" << std::endl;
-        return false; 
-    }
-    // Assume we're working with a <=2d grid for now
-    py_array_t density_array({p.n_x, p.n_y});
-    auto density_proxy = density_array.mutable_unchecked();
-    for (auto i=0; i<p.n_cells; i++)
-    {
-        int x = i % p.n_x;
-        int y = i / p.n_x;
-        density_proxy(x, y) = dpLangevin->get_density_grid_value(i);
-    };
-    pyarray_density = density_array;
-    return true;
-}
\ No newline at end of file
@@ -10,7 +10,90 @@ int SimDP::get_i_current_epoch() const { return i_current_epoch; }
 int SimDP::get_i_next_epoch() const { return i_next_epoch; }
 double SimDP::get_t_current_epoch() const { return t_current_epoch; }
 double SimDP::get_t_next_epoch() const { return t_next_epoch; }
-py_array_t SimDP::get_t_epochs() const { return pyarray_t_epochs; }
-py_array_t SimDP::get_mean_densities() const { return pyarray_mean_densities; }
-py_array_t SimDP::get_density() const { return pyarray_density; }
+bool SimDP::get_is_initialized() const { return is_initialized; }
+bool SimDP::get_is_absorbed() const { return is_absorbed; }
+double SimDP::get_t_absorption() const { return t_absorption; }
 
+//! Wrap a C++ buffer of doubles as a read-only NumPy array, without copying, 
+//! whose base is the Python object `base` owning the buffer, 
+//! which is thereby kept alive for as long as the array; 
+//! or, if `copy` is set, as an independent, writeable, C-ordered copy.
+py::array view_buffer(
+    const double* data,
+    const std::vector<py::ssize_t> shape, 
+    const std::vector<py::ssize_t> strides,
+    const py::handle base,
+    const bool copy,
+    const py::dtype dtype
+)
+{
+    py::array view(dtype, shape, strides, data, base);
+    if (copy) { return view.attr("copy")(); }
+    view.attr("setflags")(py::arg("write")=false);
+    return view;
+}
+
+py::array SimDP::get_t_epochs(const py::handle base, const bool copy) const
+{
+    return view_buffer(
+        t_epochs.data(), {n_epochs}, {itemsize}, base, copy
+    );
+}
+
+py::array SimDP::get_mean_densities(const py::handle base, const bool copy) 
+    const
+{
+    return view_buffer(
+        mean_densities.data(), {n_epochs}, {itemsize}, base, copy
+    );
+}
+
+//! The grid is indexed i = x + y*n_x, so an (n_x, n_y) view of it 
+//! has Fortran-order strides
+py::array SimDP::get_density(const py::handle base, const bool copy) const
+{
+    return view_buffer(
+        dpLangevin->get_density_grid().data(),
+        {p.n_x, p.n_y}, {itemsize, p.n_x*itemsize}, 
+        base, copy
+    );
+}
+
+std::string observable_name(const Observable observable)
+{
+    switch (observable)
+    {
+        case (Observable::MEAN_SQUARED_DENSITY): return "mean_squared_density";
+        case (Observable::ACTIVE_FRACTION): return "active_fraction";
+        case (Observable::SURVIVAL): return "survival";
+        case (Observable::MAX_DENSITY): return "max_density";
+        case (Observable::TOTAL_MASS): return "total_mass";
+        case (Observable::SQUARED_RADIUS): return "squared_radius";
+        default: return "unknown";
+    }
+}
+
+//! The observables are recorded epoch by epoch, so the time series is 
+//! an (n_epochs,) array of records, with one float field per observable
+py::array SimDP::get_observables(const py::handle base, const bool copy) const
+{
+    const auto n_observables = static_cast<py::ssize_t>(observables.size());
+    py::list names, formats, offsets;
+    for (auto k=0; k<n_observables; k++)
+    {
+        names.append(observable_name(observables[k]));
+        formats.append(py::dtype::of<double>());
+        offsets.append(k*itemsize);
+    }
+    const py::dtype record(names, formats, offsets, n_observables*itemsize);
+    if (n_observables==0)
+    {
+        // No observables: an empty array of empty records
+        return py::array(record, {0}, {});
+    }
+    return view_buffer(
+        observable_series.data(), 
+        {n_epochs}, {n_observables*itemsize}, 
+        base, copy, record
+    );
+}
@@ -8,6 +8,7 @@
 // Essential for STL container conversions
 #include <pybind11/stl.h> 
 #include "sim_dplangevin.hpp"
+#include "sim_dplangevin_batch.hpp"
 
 /**
  * @details Pybind11 wrapper between C++ and Python for SimDP application.
@@ -17,6 +18,17 @@
  * data results. This class exploits the  DPLangevin integrator, which itself
  * is a subclass of the more general BaseLangevin integration scheme.
  * 
+ * The GIL is released while a simulation is initialized or run, since these
+ * steps touch no Python objects: each SimDP (or SimDPBatch) instance owns its 
+ * grids, RNG streams and integrator, and shares no mutable state with any
+ * other instance, so separate instances may be run concurrently from 
+ * separate Python threads. A single instance must not be used by more than
+ * one thread at a time.
+ * 
+ * SimDP instances can be pickled, e.g. to hand an initialized, or part-run,
+ * simulation to a worker process: its state is restored exactly, 
+ * so the copy carries on just as the original would.
+ * 
  * This macro expands the parameter `"dplvn"` into `pybind11_exec_dplvn` 
  * and generates the function `pybind11_init_dplvn` among others.
  * 
@@ -58,7 +70,28 @@ PYBIND11_MODULE(dplvn, module)
         .value("EULER", IntegrationMethod::EULER)
         .value("RUNGE_KUTTA", IntegrationMethod::RUNGE_KUTTA)
         .export_values();
-        
+
+    py::enum_<RandomGenerator>(module, "RandomGenerator")
+        .value("MERSENNE_TWISTER", RandomGenerator::MERSENNE_TWISTER)
+        .value("PHILOX", RandomGenerator::PHILOX)
+        .export_values();
+
+    py::enum_<Observable>(module, "Observable")
+        .value("MEAN_SQUARED_DENSITY", Observable::MEAN_SQUARED_DENSITY)
+        .value("ACTIVE_FRACTION", Observable::ACTIVE_FRACTION)
+        .value("SURVIVAL", Observable::SURVIVAL)
+        .value("MAX_DENSITY", Observable::MAX_DENSITY)
+        .value("TOTAL_MASS", Observable::TOTAL_MASS)
+        .value("SQUARED_RADIUS", Observable::SQUARED_RADIUS)
+        .export_values();
+
+    module.def(
+        "count_epochs",
+        &count_epochs,
+        "Count the epochs, including epoch #0, of a sim to t_final in steps dt",
+        py::arg("t_final"), py::arg("dt")
+    );
+
     py::class_<SimDP>(module, "SimDP")
         .def(
             py::init<
@@ -74,6 +107,10 @@ PYBIND11_MODULE(dplvn, module)
                 InitialCondition,
                 dbl_vec_t,
                 IntegrationMethod,
+                RandomGenerator,
+                int,
+                bool,
+                obs_vec_t,
                 bool,
                 bool
             >(),
@@ -94,18 +131,146 @@ PYBIND11_MODULE(dplvn, module)
             py::arg("initial_condition") = InitialCondition::RANDOM_UNIFORM,
             py::arg("ic_values") = dbl_vec_t(3),
             py::arg("integration_method") = IntegrationMethod::RUNGE_KUTTA,
+            py::arg("rng") = RandomGenerator::MERSENNE_TWISTER,
+            py::arg("n_threads") = 1,
+            py::arg("do_active_set") = false,
+            py::arg("observables") = obs_vec_t(),
             py::arg("do_snapshot_grid") = false,
             py::arg("do_verbose") = false
         )
-        .def("initialize", &SimDP::initialize)
-        .def("run", &SimDP::run)
+        .def(
+            "initialize", &SimDP::initialize, 
+            py::call_guard<py::gil_scoped_release>()
+        )
+        .def("run", &SimDP::run, py::call_guard<py::gil_scoped_release>())
         .def("postprocess", &SimDP::postprocess)
+        .def(
+            "checkpoint", &SimDP::checkpoint, 
+            "Write the sim state to a checkpoint file", 
+            py::arg("path"), py::call_guard<py::gil_scoped_release>()
+        )
+        .def(
+            "restore", &SimDP::restore, 
+            "Restore the sim state from a checkpoint file", 
+            py::arg("path"), py::call_guard<py::gil_scoped_release>()
+        )
         .def("get_n_epochs", &SimDP::get_n_epochs)
         .def("get_i_next_epoch", &SimDP::get_i_next_epoch)
         .def("get_i_current_epoch", &SimDP::get_i_current_epoch)
         .def("get_t_next_epoch", &SimDP::get_t_next_epoch)
         .def("get_t_current_epoch", &SimDP::get_t_current_epoch)
-        .def("get_t_epochs", &SimDP::get_t_epochs)
-        .def("get_mean_densities", &SimDP::get_mean_densities)
-        .def("get_density", &SimDP::get_density);
+        .def(
+            "get_t_epochs", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDP&>().get_t_epochs(self, copy);
+            },
+            py::arg("copy") = false
+        )
+        .def(
+            "get_mean_densities", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDP&>().get_mean_densities(self, copy);
+            },
+            py::arg("copy") = false
+        )
+        .def(
+            "get_density", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDP&>().get_density(self, copy);
+            },
+            py::arg("copy") = false
+        )
+        .def(
+            "get_observables", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDP&>().get_observables(self, copy);
+            },
+            py::arg("copy") = false
+        )
+        .def("get_is_initialized", &SimDP::get_is_initialized)
+        .def("get_is_absorbed", &SimDP::get_is_absorbed)
+        .def("get_t_absorption", &SimDP::get_t_absorption)
+        .def(py::pickle(
+            [](const SimDP& self) { return self.get_state(); },
+            [](const py::tuple state) { return SimDP::from_state(state); }
+        ));
+
+    py::class_<SimDPBatch>(module, "SimDPBatch")
+        .def(
+            py::init<
+                double, double, 
+                double, double, 
+                double, double, double,
+                int_vec_t, 
+                dbl_vec_t, 
+                GridDimension,
+                int_vec_t,
+                gt_vec_t,
+                bc_vec_t,
+                dbl_vec_t,
+                InitialCondition,
+                dbl_vec_t,
+                IntegrationMethod,
+                RandomGenerator,
+                bool,
+                bool
+            >(),
+            "Simulation of a batch of DP Langevin equation replicas",
+            py::arg("linear") = 1.0, 
+            py::arg("quadratic") = 2.0, 
+            py::arg("diffusion") = 0.1,
+            py::arg("noise") = 1.0,
+            py::arg("t_final") = 100.0,
+            py::arg("dx") = 0.5,
+            py::arg("dt") = 0.01,
+            py::arg("random_seeds") = int_vec_t{1},
+            py::arg("linears") = dbl_vec_t(),
+            py::arg("grid_dimension") = GridDimension::D2,
+            py::arg("grid_size") = int_vec_t(2),
+            py::arg("grid_topologies") = gt_vec_t(2),
+            py::arg("boundary_conditions") = bc_vec_t(4),
+            py::arg("bc_values") = dbl_vec_t(4),
+            py::arg("initial_condition") = InitialCondition::RANDOM_UNIFORM,
+            py::arg("ic_values") = dbl_vec_t(3),
+            py::arg("integration_method") = IntegrationMethod::RUNGE_KUTTA,
+            py::arg("rng") = RandomGenerator::MERSENNE_TWISTER,
+            py::arg("do_snapshot_grid") = false,
+            py::arg("do_verbose") = false
+        )
+        .def(
+            "initialize", &SimDPBatch::initialize, 
+            py::call_guard<py::gil_scoped_release>()
+        )
+        .def("run", &SimDPBatch::run, py::call_guard<py::gil_scoped_release>())
+        .def("postprocess", &SimDPBatch::postprocess)
+        .def("get_n_replicas", &SimDPBatch::get_n_replicas)
+        .def("get_n_epochs", &SimDPBatch::get_n_epochs)
+        .def("get_i_next_epoch", &SimDPBatch::get_i_next_epoch)
+        .def("get_i_current_epoch", &SimDPBatch::get_i_current_epoch)
+        .def("get_t_next_epoch", &SimDPBatch::get_t_next_epoch)
+        .def("get_t_current_epoch", &SimDPBatch::get_t_current_epoch)
+        .def(
+            "get_t_epochs", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDPBatch&>().get_t_epochs(self, copy);
+            },
+            py::arg("copy") = false
+        )
+        .def(
+            "get_mean_densities", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDPBatch&>().get_mean_densities(
+                    self, copy
+                );
+            },
+            py::arg("copy") = false
+        )
+        .def("get_t_absorptions", &SimDPBatch::get_t_absorptions)
+        .def(
+            "get_density", 
+            [](const py::object self, const bool copy) {
+                return self.cast<const SimDPBatch&>().get_density(self, copy);
+            },
+            py::arg("copy") = false
+        );
 }
\ No newline at end of file
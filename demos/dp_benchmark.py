@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""!
+@file dp_benchmark.py
+@brief Benchmark 2d DP Langevin integration throughput in cells/second.
+
+Usage:  dp_benchmark.py [path/to/dplvn.so]
+
+Times a near-critical run, for which the Poisson-gamma stochastic step
+dominates the computation time, for each integration method and RNG.
+Pass the path to an alternative build of the `dplvn` extension module
+to compare "before" and "after" throughput.
+"""
+
+import sys
+import importlib.util
+from time import perf_counter
+
+def load_dplvn(path: str | None):
+    if path is None:
+        from langevin.dp import dplvn # type: ignore
+        return dplvn
+    spec = importlib.util.spec_from_file_location("dplvn", path)
+    dplvn = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(dplvn)
+    return dplvn
+
+def main() -> None:
+    dplvn = load_dplvn(sys.argv[1] if len(sys.argv)>1 else None)
+    grid_size: tuple = (500, 500,)
+    n_cells: int = grid_size[0]*grid_size[1]
+    print(f"dplvn version:  {dplvn.__version__}")
+    rngs: dict = {"MERSENNE_TWISTER": {}}
+    if hasattr(dplvn, "RandomGenerator"):
+        rngs["PHILOX"] = {"rng": dplvn.PHILOX}
+    for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+        for (rng_name, rng_kwargs,) in rngs.items():
+            sim = dplvn.SimDP(
+                linear=1.18855, quadratic=1.0, diffusion=0.04, noise=1.0,
+                t_final=5.0,
+                dx=1, dt=0.1,
+                random_seed=1,
+                grid_dimension=dplvn.D2,
+                grid_size=grid_size,
+                grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+                boundary_conditions=(dplvn.FLOATING,)*4,
+                bc_values=(0,)*4,
+                initial_condition=dplvn.RANDOM_UNIFORM,
+                ic_values=(0, 2,),
+                integration_method=integration_method,
+                **rng_kwargs,
+            )
+            sim.initialize(5)
+            n_steps: int = sim.get_n_epochs()-1
+            tick: float = perf_counter()
+            sim.run(n_steps)
+            tock: float = perf_counter()
+            print(
+                f"{integration_method.name:>11} {rng_name:>16}:  "
+                + f"{n_cells*n_steps/(tock-tick)/1e6:.2f} Mcells/s"
+            )
+
+if __name__ == "__main__":
+    main()
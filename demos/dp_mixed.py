@@ -69,7 +69,7 @@ def main() -> None:
             raise Exception("Failed to process sim results")
         i_epoch = sim.get_i_current_epoch()
         t_epoch = np.round(sim.get_t_current_epoch(), 5)
-        density_dict[t_epoch] = sim.get_density()
+        density_dict[t_epoch] = sim.get_density(copy=True)
         print(bold(
             f"segment={i_segment}/{n_segments}  "
             + f"i={i_epoch} t={t_epoch}"
@@ -1,9 +1,12 @@
 __version__ = "2025.12.16a4"
 
 __all__ = [
+    "correlation",
     "file",
     "initialize",
     "serialize",
+    "snapshot",
+    "statistics",
     "utils",
     "viz",
 ]
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Accumulate radially averaged density correlations and structure factors.
+"""
+import warnings
+from collections.abc import Sequence
+import numpy as np
+from numpy.typing import NDArray
+
+warnings.filterwarnings("ignore")
+
+__all__ = [
+    "CorrelationAccumulator",
+]
+
+class CorrelationAccumulator:
+    """
+    Average the structure factor S(k) of density grids at chosen epochs.
+
+    Each density grid handed to `add`, e.g. a live (zero-copy) view of a
+    sim buffer, is reduced straight away to the power spectrum of its
+    fluctuations δρ = ρ - ⟨ρ⟩ by a real FFT, and summed into the running
+    total for its epoch: so only one half-spectrum per chosen epoch is ever
+    held, however many snapshots (e.g. ensemble replicas) are averaged.
+    A stack of grids, such as the density of a `dplvn.SimDPBatch`, is
+    transformed in one batched FFT.
+
+    The radially averaged S(k), and the two-point correlation
+    C(r) = ⟨δρ(x) δρ(x+r)⟩, its inverse transform, are computed
+    on request. The FFT treats the grid as periodic, so on bounded grids
+    correlations reaching across the grid are not meaningful.
+    """
+    def __init__(
+            self,
+            grid_shape: tuple[int,int],
+            t_epochs: Sequence[float],
+            dx: float=1.0,
+        ) -> None:
+        """
+        Constructor.
+
+        Args:
+            grid_shape: shape (n_x, n_y) of each density grid
+            t_epochs: epoch times at which to accumulate the grids; others
+                are ignored
+            dx: grid spacing Δx
+        """
+        self.grid_shape: tuple[int,int] = (grid_shape[0], grid_shape[1],)
+        self.dx: float = dx
+        (n_x, n_y,) = self.grid_shape
+        self.n_cells: int = n_x*n_y
+        self.power_sums: dict[float, NDArray] = {
+            t_epoch_: np.zeros((n_x, n_y//2+1,)) for t_epoch_ in t_epochs
+        }
+        self.n_snapshots: dict[float, int] = {
+            t_epoch_: 0 for t_epoch_ in t_epochs
+        }
+        # Wavevector magnitudes of the half spectrum, binned into shells
+        # as wide as the coarser of the two wavevector spacings
+        k_x: NDArray = 2*np.pi*np.fft.fftfreq(n_x, d=dx)
+        k_y: NDArray = 2*np.pi*np.fft.rfftfreq(n_y, d=dx)
+        self.k: NDArray = np.hypot(k_x[:,np.newaxis], k_y[np.newaxis,:])
+        self.k_shells: NDArray = np.rint(
+            self.k / (2*np.pi/(dx*min(n_x, n_y)))
+        ).astype(int).ravel()
+        # Columns of the half spectrum standing in for their mirror images
+        # count twice (all but k_y=0 and, if n_y is even, the Nyquist k_y)
+        self.k_weights: NDArray = np.full(n_y//2+1, 2.0)
+        self.k_weights[0] = 1.0
+        if n_y%2==0:
+            self.k_weights[-1] = 1.0
+        self.k_weights = np.broadcast_to(
+            self.k_weights[np.newaxis,:], self.k.shape
+        ).ravel()
+        # Separations across the grid, the short way round, binned into
+        # shells of width Δx
+        r_x: NDArray = np.minimum(np.arange(n_x), n_x-np.arange(n_x))
+        r_y: NDArray = np.minimum(np.arange(n_y), n_y-np.arange(n_y))
+        self.r: NDArray = dx*np.hypot(r_x[:,np.newaxis], r_y[np.newaxis,:])
+        self.r_shells: NDArray = np.rint(self.r/dx).astype(int).ravel()
+
+    def add(self, t_epoch: float, density: NDArray) -> bool:
+        """
+        Fold a density grid, or a stack of grids, into the average at an epoch.
+
+        Args:
+            t_epoch: time slice of the density grid(s)
+            density: an (n_x, n_y) density grid, or an (n, n_x, n_y) stack
+                of grids, e.g. a live view of a sim buffer
+
+        Returns:
+            whether the grid(s) were accumulated, i.e., whether `t_epoch` is
+            one of the chosen epochs.
+        """
+        if t_epoch not in self.power_sums:
+            return False
+        grids: NDArray = np.asarray(density, dtype=np.float64)
+        if grids.shape[-2:]!=self.grid_shape:
+            raise ValueError(
+                f"Density grid has shape {grids.shape}, "
+                + f"not (..., {self.grid_shape[0]}, {self.grid_shape[1]})"
+            )
+        grids = grids.reshape(-1, *self.grid_shape)
+        fluctuations: NDArray \
+            = grids - grids.mean(axis=(-2,-1), keepdims=True)
+        spectra: NDArray = np.fft.rfft2(fluctuations, axes=(-2,-1))
+        self.power_sums[t_epoch] += (
+            np.sum(spectra.real**2 + spectra.imag**2, axis=0) / self.n_cells
+        )
+        self.n_snapshots[t_epoch] += grids.shape[0]
+        return True
+
+    def merge(self, other: "CorrelationAccumulator") -> None:
+        """
+        Fold in the snapshots accumulated by another accumulator, e.g.
+        that of another sim of an ensemble.
+
+        Args:
+            other: accumulator of the same grid shape and epochs
+        """
+        if (
+            other.grid_shape!=self.grid_shape
+            or other.power_sums.keys()!=self.power_sums.keys()
+        ):
+            raise ValueError("Can't merge mismatched correlation accumulators")
+        for t_epoch_ in self.power_sums:
+            self.power_sums[t_epoch_] += other.power_sums[t_epoch_]
+            self.n_snapshots[t_epoch_] += other.n_snapshots[t_epoch_]
+
+    def power_spectrum(self, t_epoch: float) -> NDArray:
+        """
+        Snapshot-averaged power spectrum of the density fluctuations.
+
+        Args:
+            t_epoch: epoch time
+
+        Returns:
+            (n_x, n_y//2+1) half spectrum S(k_x, k_y).
+        """
+        if self.n_snapshots[t_epoch]==0:
+            raise ValueError(f"No snapshots accumulated at t={t_epoch}")
+        return self.power_sums[t_epoch] / self.n_snapshots[t_epoch]
+
+    def structure_factor(self, t_epoch: float) -> tuple[NDArray, NDArray]:
+        """
+        Radially averaged structure factor.
+
+        Args:
+            t_epoch: epoch time
+
+        Returns:
+            mean wavevector magnitude k of each (nonempty) shell,
+            and S(k) averaged over the shell.
+        """
+        weights: NDArray = np.bincount(self.k_shells, weights=self.k_weights)
+        is_filled: NDArray = weights>0
+        k_sums: NDArray = np.bincount(
+            self.k_shells, weights=self.k_weights*self.k.ravel()
+        )
+        s_sums: NDArray = np.bincount(
+            self.k_shells,
+            weights=self.k_weights*self.power_spectrum(t_epoch).ravel(),
+        )
+        return (
+            k_sums[is_filled]/weights[is_filled],
+            s_sums[is_filled]/weights[is_filled],
+        )
+
+    def correlation(self, t_epoch: float) -> tuple[NDArray, NDArray]:
+        """
+        Radially averaged two-point correlation of the density fluctuations.
+
+        Args:
+            t_epoch: epoch time
+
+        Returns:
+            mean separation r of each (nonempty) shell, and C(r) averaged
+            over the shell, with C(0) the variance of the density.
+        """
+        c_grid: NDArray = np.fft.irfft2(
+            self.power_spectrum(t_epoch), s=self.grid_shape, axes=(-2,-1),
+        )
+        counts: NDArray = np.bincount(self.r_shells)
+        is_filled: NDArray = counts>0
+        r_sums: NDArray = np.bincount(self.r_shells, weights=self.r.ravel())
+        c_sums: NDArray = np.bincount(self.r_shells, weights=c_grid.ravel())
+        return (
+            r_sums[is_filled]/counts[is_filled],
+            c_sums[is_filled]/counts[is_filled],
+        )
+
+    def as_dict(self) -> dict[str, NDArray]:
+        """
+        Radial averages at every epoch with snapshots, e.g. to save to `.npz`.
+
+        Returns:
+            dictionary of the epoch times `t_epochs`, their snapshot counts
+            `n_snapshots`, the shell wavevectors `k` and separations `r`, and
+            the structure factors `structure_factors` and correlations
+            `correlations`, one row per epoch.
+        """
+        t_epochs: list[float] = [
+            t_epoch_ for t_epoch_, n_ in self.n_snapshots.items() if n_>0
+        ]
+        (k, _,) = self.structure_factor(t_epochs[0]) if t_epochs else ([],[],)
+        (r, _,) = self.correlation(t_epochs[0]) if t_epochs else ([],[],)
+        return dict(
+            t_epochs=np.array(t_epochs),
+            n_snapshots=np.array(
+                [self.n_snapshots[t_epoch_] for t_epoch_ in t_epochs]
+            ),
+            k=np.array(k),
+            structure_factors=np.array([
+                self.structure_factor(t_epoch_)[1] for t_epoch_ in t_epochs
+            ]),
+            r=np.array(r),
+            correlations=np.array([
+                self.correlation(t_epoch_)[1] for t_epoch_ in t_epochs
+            ]),
+        )
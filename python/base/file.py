@@ -9,6 +9,11 @@ from os import mkdir
 from shutil import rmtree
 from json import dump, load
 from io import TextIOWrapper
+from multiprocessing.pool import Pool as Pool
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.image import imsave
+from numpy.typing import NDArray
 from langevin.base.serialize import (
     from_serializable, to_serializable,
 )
@@ -23,7 +28,9 @@ __all__ = [
     "export_info",
     "read_info",
     "export_plots",
-    "export_plot"
+    "export_plot",
+    "export_images",
+    "export_image",
 ]
 
 def create_directories(
@@ -185,10 +192,16 @@ def export_plots(
         suffix: str = "",
         dpi: int = 150,
         do_verbose: bool=False,
+        n_workers: int = 1,
     ) -> str:
     """
     Export plots to PDF or other format files.
 
+    With more than one worker, the figures are pickled out to a pool of
+    processes, each rendering with the Agg backend, so that exporting 
+    many figures (e.g. hundreds of density images) scales with cores.
+    File names are given by the figure names either way.
+
     Args:
         fig_dict: dictionary of figures
         results_dir: name of output directory
@@ -196,6 +209,7 @@ def export_plots(
         suffix: filename suffix
         dpi: output image resolution
         do_verbose: use tqdm progress bar to track 
+        n_workers: number of processes rendering & saving figures
 
     Returns:
         the supplied export directory
@@ -210,6 +224,25 @@ def export_plots(
     progress_bar: Callable = (
         progress if do_verbose else progress_disabled
     )
+    if n_workers>1 and len(fig_dict)>1:
+        tasks: list[tuple] = [
+            (fig_name, fig, results_path, file_type, suffix, dpi,)
+            for file_type in file_types_
+            for fig_name, fig in fig_dict.items()
+        ]
+        with Pool(
+            processes=min(n_workers, len(tasks)), initializer=use_agg,
+        ) as pool:
+            for _ in progress_bar(
+                pool.imap_unordered(
+                    export_plot_task, 
+                    tasks, 
+                    chunksize=max(len(tasks)//(4*n_workers), 1),
+                ), 
+                total=len(tasks),
+            ):
+                pass
+        return results_dir
     for file_type in file_types_:
         # logging.info(f'Image file type: "{file_type}"')
         for fig_name, fig in progress_bar(fig_dict.items(),):
@@ -222,6 +255,32 @@ def export_plots(
             )
     return results_dir
 
+def use_agg() -> None:
+    """Initialize a figure-exporting worker process to render with Agg."""
+    matplotlib.use("Agg")
+
+def export_plot_task(task: tuple) -> str:
+    """
+    Pool wrapper to export, then release, a figure in a worker process.
+
+    Args:
+        task: arguments of `export_plot`, namely figure name, figure, 
+            output directory, file format, filename suffix, and resolution
+
+    Returns:
+        name of the exported figure.
+    """
+    (fig_name, fig, results_dir, file_type, suffix, dpi,) = task
+    export_plot(
+        fig_name, fig, 
+        results_dir, 
+        file_type=file_type, 
+        suffix=suffix, 
+        dpi=dpi,
+    )
+    plt.close(fig)
+    return fig_name
+
 def export_plot(
         fig_name: str,
         fig: Any,
@@ -260,3 +319,66 @@ def export_plot(
         raise
     except:
         raise
+
+def export_images(
+        image_dict: dict[str, NDArray],
+        results_dir: str,
+        file_type: str = "png",
+        suffix: str = "",
+        do_verbose: bool=False,
+    ) -> str:
+    """
+    Export rendered RGB(A) image arrays to PNG or other format files.
+
+    Args:
+        image_dict: dictionary of image arrays
+        results_dir: name of output directory
+        file_type: file format
+        suffix: filename suffix
+        do_verbose: use tqdm progress bar to track 
+
+    Returns:
+        the supplied export directory
+    """
+    results_path: str = realpath(results_dir)
+    logging.info(
+        "gmplib.save.export_images:\n   " + f'Writing to dir: "{results_path}"'
+    )
+    progress_bar: Callable = (
+        progress if do_verbose else progress_disabled
+    )
+    for image_name, image in progress_bar(image_dict.items(),):
+        export_image(
+            image_name, image,
+            results_path,
+            file_type=file_type,
+            suffix=suffix,
+        )
+    return results_dir
+
+def export_image(
+        image_name: str,
+        image: NDArray,
+        results_dir: str,
+        file_type: str = "png", 
+        suffix: str = "",
+    ) -> None:
+    """
+    Export a rendered RGB(A) image array, pixel for pixel, to file.
+
+    Args:
+        image_name: name to be used for file (extension auto-appended)
+        image: (height, width, 3|4) uint8 image array
+        results_dir: name of output directory
+        file_type: file format
+        suffix: filename suffix
+    """
+    image_name_ = f"{image_name}{suffix}.{file_type.lower()}"
+    try:
+        imsave(join(results_dir, image_name_), image, format=file_type,)
+        logging.info(f'export_image: Exported "{image_name_}"')
+    except OSError:
+        logging.info(
+            f'export_image: Failed to export image "{image_name_}"'
+        )
+        raise
@@ -83,6 +83,14 @@ def to_serializable(value: Any, module: Any,) -> Any:
                     return "EULER"
                 case _:
                     return None
+        case module.RandomGenerator:
+            match value:
+                case module.MERSENNE_TWISTER:
+                    return "MERSENNE_TWISTER"
+                case module.PHILOX:
+                    return "PHILOX"
+                case _:
+                    return None
         case builtins.tuple:
             if is_serializable(value[0]) and is_serializable(value):
                 return value
@@ -144,6 +152,10 @@ def from_serializable(value: Any, module: Any) -> Any:
                     return module.RUNGE_KUTTA
                 case "EULER":
                     return module.EULER
+                case "MERSENNE_TWISTER":
+                    return module.MERSENNE_TWISTER
+                case "PHILOX":
+                    return module.PHILOX
                 case _:
                     return None
         case builtins.tuple | builtins.list:
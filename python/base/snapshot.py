@@ -0,0 +1,176 @@
+"""
+Stream density grid snapshots to, and read them lazily from, disk.
+"""
+import warnings
+from collections.abc import Iterator, Mapping, Sequence
+from os.path import exists, join
+from os import remove
+import numpy as np
+from numpy.typing import NDArray, DTypeLike
+
+warnings.filterwarnings("ignore")
+
+__all__ = [
+    "SnapshotWriter",
+    "SnapshotReader",
+    "snapshot_file_names",
+]
+
+def snapshot_file_names(data_path: str, name: str="ρ_snapshots") -> tuple[str,str]:
+    """
+    Paths of the grid snapshots file and of its epoch times file.
+
+    Args:
+        data_path: directory in which the files are (to be) written
+        name: stem of the file names
+
+    Returns:
+        paths to the snapshots `.npy` file and the times `.npy` file.
+    """
+    return (join(data_path, name+".npy"), join(data_path, name+"_t.npy"))
+
+
+class SnapshotWriter:
+    """
+    Stream density grid snapshots into a preallocated, memory-mapped `.npy`.
+
+    The (n_snapshots, n_x, n_y) file is allocated up front, and each
+    snapshot is written straight into its slice of the memory map, so that
+    no more than one grid is ever held in memory. The epoch time of each
+    snapshot is kept, and written to a companion `.npy` file when the writer
+    is closed. If fewer snapshots than allocated are written (e.g. because
+    the sim reached the absorbing state), only those written are read back.
+
+    Writing can be resumed, e.g. when a sim is restarted from a checkpoint,
+    by passing the epoch times of the snapshots already in the file.
+    """
+    def __init__(
+            self,
+            data_path: str,
+            n_snapshots: int,
+            grid_shape: tuple[int,int],
+            dtype: DTypeLike=np.float64,
+            name: str="ρ_snapshots",
+            t_epochs: Sequence[float] | None=None,
+        ) -> None:
+        """
+        Constructor.
+
+        Args:
+            data_path: directory in which to write the files
+            n_snapshots: maximum number of snapshots to be written
+            grid_shape: shape (n_x, n_y) of each density grid
+            dtype: type of the stored densities, e.g. float32 to halve the
+                file size
+            name: stem of the file names
+            t_epochs: times of the snapshots already written to the file,
+                if resuming writing it
+        """
+        self.file_path, self.t_file_path = snapshot_file_names(data_path, name)
+        if exists(self.t_file_path):
+            # Don't let a stale times file describe the new snapshots
+            remove(self.t_file_path)
+        if t_epochs is not None:
+            self.snapshots: np.memmap \
+                = np.lib.format.open_memmap(self.file_path, mode="r+")
+            if self.snapshots.shape!=(n_snapshots, *grid_shape,):
+                raise ValueError(
+                    f"Snapshots file {self.file_path} has shape "
+                    + f"{self.snapshots.shape}, not "
+                    + f"{(n_snapshots, *grid_shape,)}"
+                )
+        else:
+            self.snapshots = np.lib.format.open_memmap(
+                self.file_path,
+                mode="w+",
+                dtype=np.dtype(dtype),
+                shape=(n_snapshots, *grid_shape,),
+            )
+        self.t_epochs: list[float] = (
+            [] if t_epochs is None else list(t_epochs)
+        )
+
+    def __len__(self) -> int:
+        return len(self.t_epochs)
+
+    def write(self, t_epoch: float, density: NDArray) -> None:
+        """
+        Copy a density grid into the next slot of the memory map.
+
+        Args:
+            t_epoch: time slice of the density grid
+            density: the density grid, e.g. a live view of the sim buffer
+        """
+        i_snapshot: int = len(self.t_epochs)
+        if i_snapshot>=self.snapshots.shape[0]:
+            raise IndexError(
+                f"Snapshots file is full ({self.snapshots.shape[0]} grids)"
+            )
+        self.snapshots[i_snapshot] = density
+        self.t_epochs.append(t_epoch)
+
+    def flush(self) -> None:
+        """
+        Flush the snapshots written so far to disk.
+        """
+        self.snapshots.flush()
+
+    def close(self) -> "SnapshotReader":
+        """
+        Flush the snapshots to disk and write out their epoch times.
+
+        Returns:
+            lazy reader of the snapshots just written.
+        """
+        self.snapshots.flush()
+        del self.snapshots
+        np.save(self.t_file_path, np.array(self.t_epochs, dtype=np.float64))
+        return SnapshotReader(self.file_path, self.t_file_path)
+
+
+class SnapshotReader(Mapping):
+    """
+    Lazy, read-only mapping from epoch time to density grid snapshot.
+
+    The snapshots file is memory-mapped, so a grid is only read from disk
+    when it is looked up. Since the reader quacks like the dictionary of
+    density grids kept in memory by `Simulation`, it can be handed
+    unchanged to the plotting methods.
+    """
+    def __init__(self, file_path: str, t_file_path: str) -> None:
+        """
+        Constructor.
+
+        Args:
+            file_path: path to the snapshots `.npy` file
+            t_file_path: path to the snapshot epoch times `.npy` file
+        """
+        self.t_epochs: NDArray = np.load(t_file_path)
+        self.snapshots: np.memmap \
+            = np.load(file_path, mmap_mode="r")[:len(self.t_epochs)]
+        self.indexes: dict[float, int] = {
+            t_epoch_: i_ for i_, t_epoch_ in enumerate(self.t_epochs.tolist())
+        }
+
+    @classmethod
+    def from_path(cls, data_path: str, name: str="ρ_snapshots",) -> "SnapshotReader":
+        """
+        Open the snapshots written to a directory by a `SnapshotWriter`.
+
+        Args:
+            data_path: directory containing the files
+            name: stem of the file names
+
+        Returns:
+            lazy reader of the snapshots.
+        """
+        return cls(*snapshot_file_names(data_path, name))
+
+    def __getitem__(self, t_epoch: float) -> NDArray:
+        return self.snapshots[self.indexes[t_epoch]]
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.indexes)
+
+    def __len__(self) -> int:
+        return len(self.indexes)
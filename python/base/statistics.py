@@ -0,0 +1,131 @@
+"""
+Accumulate ensemble statistics of time series one replica at a time.
+"""
+import warnings
+import numpy as np
+from numpy.typing import NDArray
+
+warnings.filterwarnings("ignore")
+
+__all__ = [
+    "RunningStatistics",
+]
+
+class RunningStatistics:
+    """
+    Running, epoch-by-epoch statistics of the mean density ρ(t) of replicas.
+
+    Each replica's ρ(t) time series is folded in as soon as it is available,
+    using Welford's update of the mean and of the sum of squared deviations
+    from it, and is then no longer needed: memory use is fixed by the number
+    of epochs, not by the number of replicas. Alongside the mean and
+    variance, the fraction of replicas surviving (ρ>0) at each epoch,
+    and the mean over just those surviving replicas, are kept.
+
+    Accumulators built separately, e.g. by different workers, can be merged
+    (using the pairwise update of Chan et al). The statistics don't depend
+    on the order in which replicas are folded in, up to rounding.
+    """
+    def __init__(self, n_epochs: int) -> None:
+        """
+        Constructor.
+
+        Args:
+            n_epochs: length of each replica's time series
+        """
+        self.n_replicas: int = 0
+        self.running_mean: NDArray = np.zeros(n_epochs)
+        self.sum_sq_deviations: NDArray = np.zeros(n_epochs)
+        self.n_surviving: NDArray = np.zeros(n_epochs, dtype=np.int64)
+        self.running_surviving_mean: NDArray = np.zeros(n_epochs)
+
+    def add(self, mean_densities: NDArray) -> None:
+        """
+        Fold in the time series of one replica.
+
+        Args:
+            mean_densities: the replica's mean density ρ(t) at every epoch
+        """
+        ρ: NDArray = np.asarray(mean_densities, dtype=np.float64)
+        if ρ.shape!=self.running_mean.shape:
+            raise ValueError(
+                f"Time series has shape {ρ.shape}, "
+                + f"not {self.running_mean.shape}"
+            )
+        self.n_replicas += 1
+        deviation: NDArray = ρ - self.running_mean
+        self.running_mean += deviation/self.n_replicas
+        self.sum_sq_deviations += deviation*(ρ - self.running_mean)
+        is_surviving: NDArray = ρ>0
+        self.n_surviving += is_surviving
+        self.running_surviving_mean += np.where(
+            is_surviving,
+            (ρ - self.running_surviving_mean)/np.maximum(self.n_surviving, 1),
+            0,
+        )
+
+    def merge(self, other: "RunningStatistics") -> None:
+        """
+        Fold in the replicas accumulated by another accumulator.
+
+        Args:
+            other: accumulator of time series of the same length
+        """
+        if other.running_mean.shape!=self.running_mean.shape:
+            raise ValueError("Can't merge mismatched running statistics")
+        if other.n_replicas==0:
+            return
+        n_replicas: int = self.n_replicas + other.n_replicas
+        deviation: NDArray = other.running_mean - self.running_mean
+        self.running_mean += deviation*other.n_replicas/n_replicas
+        self.sum_sq_deviations += (
+            other.sum_sq_deviations
+            + deviation**2*self.n_replicas*other.n_replicas/n_replicas
+        )
+        n_surviving: NDArray = self.n_surviving + other.n_surviving
+        self.running_surviving_mean += np.where(
+            n_surviving>0,
+            (other.running_surviving_mean - self.running_surviving_mean)
+                * other.n_surviving/np.maximum(n_surviving, 1),
+            0,
+        )
+        self.n_replicas = n_replicas
+        self.n_surviving = n_surviving
+
+    @property
+    def mean(self) -> NDArray:
+        """Mean density ⟨ρ(t)⟩ over all replicas"""
+        return self.running_mean.copy()
+
+    @property
+    def variance(self) -> NDArray:
+        """Sample variance of ρ(t) over all replicas (NaN if fewer than 2)"""
+        if self.n_replicas<2:
+            return np.full_like(self.running_mean, np.nan)
+        return self.sum_sq_deviations/(self.n_replicas-1)
+
+    @property
+    def survival(self) -> NDArray:
+        """Fraction P(t) of replicas with ρ(t)>0"""
+        return self.n_surviving/max(self.n_replicas, 1)
+
+    @property
+    def surviving_mean(self) -> NDArray:
+        """Mean density over surviving replicas (NaN where none survive)"""
+        return np.where(self.n_surviving>0, self.running_surviving_mean, np.nan)
+
+    def as_dict(self) -> dict[str, NDArray]:
+        """
+        Statistics at every epoch, e.g. to save to `.npz`.
+
+        Returns:
+            dictionary of `n_replicas`, `mean`, `variance`, `survival`
+            and `surviving_mean`.
+        """
+        return dict(
+            n_replicas=np.array(self.n_replicas),
+            mean=self.mean,
+            variance=self.variance,
+            survival=self.survival,
+            surviving_mean=self.surviving_mean,
+        )
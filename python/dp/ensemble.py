@@ -6,13 +6,20 @@ from typing import Any
 from collections.abc import Callable, Sequence
 from multiprocessing.pool import Pool as Pool
 from multiprocessing import cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from copy import deepcopy
+from types import SimpleNamespace
+from tqdm import tqdm
 import numpy as np
 from numpy.typing import NDArray
 import os
 from langevin.base.file import (
     create_directories, export_info, read_info, export_plots
 )
+from langevin.base.statistics import RunningStatistics
+from langevin.base.utils import progress, progress_disabled
 from langevin.dp import dplvn
 from langevin.dp.simulation import Simulation
 from langevin.dp.vizdp import VizDP #type: ignore
@@ -23,9 +30,48 @@ __all__ = [
     "Ensemble"
 ]
 
+class SharedBlock:
+    """
+    Buffer of a block of shared memory, owning the block.
+
+    NumPy arrays made over it (and any views of them) keep it alive: 
+    only once the last of them is gone is the block closed, by 
+    `SharedMemory.__del__`, so arrays can't outlive their memory.
+    """
+    def __init__(self, shared_memory: SharedMemory) -> None:
+        """
+        Constructor.
+
+        Args:
+            shared_memory: block of shared memory, already unlinked or not
+        """
+        self.shared_memory: SharedMemory = shared_memory
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.shared_memory.buf.__buffer__(flags)
+
 class Ensemble:
     """
     Multiprocessing wrapper class to batch run Langevin integrations.
+
+    By default, sims are run in a `multiprocessing` pool of processes. 
+    Each worker is sent only its sim's info dictionary (parameters, 
+    including the random seed, etc), and writes its mean density 
+    time series straight into one (n_sims, n_epochs) block of shared 
+    memory, which the sims' results then simply view.
+    If `Info.json` sets `Misc.do_use_threads`, sims are instead run in a 
+    pool of threads: `dplvn.SimDP` releases the GIL while integrating, 
+    so threads run sims concurrently, without process start-up costs and 
+    without serializing sims and their results.
+
+    If `Info.json` sets `Misc.do_replicas`, the sims are replicas, 
+    differing only in their random seeds, all at the `linear` value of
+    `Parameters`, rather than spread over a range of `linear` values.
+    If `Misc.do_stream_statistics` is set, each sim's mean density time 
+    series is folded into running statistics for its `linear` value
+    (see `RunningStatistics`) as soon as the sim is done, and is kept 
+    only if `Misc.do_keep_replicas` is set too; all the sims then share
+    the one epoch time series `t_epochs`.
     """
     def __init__(
             self, info_path: Sequence[str], do_verbose: bool=False,
@@ -61,6 +107,11 @@ class Ensemble:
             +
             [round(a_c+Δa*i_, n_round) for i_ in range(0, n_supercritical)]
         )))[::-1]
+        if (
+            "do_replicas" in self.info["Misc"] 
+            and self.info["Misc"]["do_replicas"]
+        ):
+            a_list = [self.info["Parameters"]["linear"]]*n_sims
         b_list: list[float] = [self.info["Parameters"]["quadratic"]]*n_sims
         seed_list: list[int] = [
             self.info["Parameters"]["random_seed"]*(i_+1) 
@@ -83,6 +134,9 @@ class Ensemble:
             print(f"seeds: {[seed_ for seed_ in seed_list]}")
         
         self.graphs: VizDP
+        self.statistics: dict[float, RunningStatistics] = {}
+        self.t_epochs: NDArray | None = None
+        self.do_keep_replicas: bool = True
 
     def create(self) -> None:
         """
@@ -129,73 +183,539 @@ class Ensemble:
             sim_.initialize()
 
     @staticmethod
-    def sim_exec_wrapper(sim: Simulation) -> Sequence[tuple]:
+    def sim_shared_exec_wrapper(task: tuple) -> tuple[str, float | None]:
         """
-        Pool wrapper to execute a specific sim instance.
+        Pool wrapper to execute a sim, writing its results to shared memory.
+
+        The sim is constructed in the worker process from its info dictionary.
+        Its mean density time series is copied from the `dplvn.SimDP` buffer
+        into row `i_row` of the shared (n_rows, n_epochs) results block; 
+        the epoch time series, common to all the sims, is copied by the sim 
+        of row#0 into the shared (n_epochs,) block. If requested, the results
+        are also cached to disk (see `Simulation.save_cache`).
+
+        Args:
+            task: results row index, sim info dictionary, names of the shared 
+                epochs & mean densities blocks, (n_rows, n_epochs) shape of 
+                the latter, and flag whether to report progress
+
+        Returns:
+            results row index, computation run time, and time of absorption 
+            (None if never).
+        """
+        (
+            i_row, info, t_epochs_name, mean_densities_name, 
+            shape, do_verbose,
+        ) = task
+        sim: Simulation = Simulation(
+            name=info["Misc"]["name"],
+            path=info["Misc"]["path"], 
+            info=info, 
+            do_verbose=do_verbose,
+        )
+        try:
+            if do_verbose:
+                print(f"Sim exec starting: {sim}")
+            sim.initialize()
+            computation_time_report: str = sim.run_wrapper()
+            if do_verbose:
+                print(computation_time_report)
+            results_: list[tuple[str, NDArray, tuple]] = [
+                (mean_densities_name, sim.sim.get_mean_densities(), shape,)
+            ]
+            if i_row==0:
+                results_.append((t_epochs_name, sim.t_epochs, shape[1:],))
+            for (name_, result_, shape_,) in results_:
+                shared_memory_: SharedMemory = SharedMemory(name=name_)
+                block_: NDArray = np.ndarray(
+                    shape_, dtype=np.float64, buffer=shared_memory_.buf,
+                )
+                if len(shape_)==2:
+                    block_[i_row] = result_
+                else:
+                    block_[:] = result_
+                del block_
+                shared_memory_.close()
+            if "do_cache_results" in sim.misc and sim.misc["do_cache_results"]:
+                sim.save_cache()
+        except:
+            print(f"Sim exec error: {sim}")
+            raise
+        finally:
+            if do_verbose:
+                print(f"Sim exec completion: {sim}")
+        return (i_row, sim.misc["computation_time"], sim.t_absorption,)
+
+    @staticmethod
+    def sim_streamed_exec_wrapper(task: tuple) -> tuple:
+        """
+        Pool wrapper to execute a sim, returning its time series.
+
+        The sim is constructed in the worker process from its info dictionary.
+        If requested, its results are also cached to disk 
+        (see `Simulation.save_cache`).
+
+        Args:
+            task: sim index, sim info dictionary, and flag whether to 
+                report progress
+
+        Returns:
+            sim index, computation run time, time of absorption (None if 
+            never), and epoch & mean density time series.
+        """
+        (i_sim, info, do_verbose,) = task
+        sim: Simulation = Simulation(
+            name=info["Misc"]["name"],
+            path=info["Misc"]["path"], 
+            info=info, 
+            do_verbose=do_verbose,
+        )
+        try:
+            if do_verbose:
+                print(f"Sim exec starting: {sim}")
+            sim.initialize()
+            computation_time_report: str = sim.run_wrapper()
+            if do_verbose:
+                print(computation_time_report)
+            if "do_cache_results" in sim.misc and sim.misc["do_cache_results"]:
+                sim.save_cache()
+        except:
+            print(f"Sim exec error: {sim}")
+            raise
+        finally:
+            if do_verbose:
+                print(f"Sim exec completion: {sim}")
+        return (
+            i_sim, sim.misc["computation_time"], sim.t_absorption, 
+            sim.t_epochs, sim.mean_densities,
+        )
+
+    @staticmethod
+    def sim_run_wrapper(sim: Simulation) -> Simulation:
+        """
+        Thread-pool wrapper to execute a specific sim instance in place.
 
         Args:
             sim: simulation instance
 
         Returns:
-            serialized output returned by the completed sim.
+            the same sim instance, now holding its results.
         """
-        result: Sequence[tuple]
         try:
             if sim.do_verbose:
                 print(f"Sim exec starting: {sim}")
-            result = sim.exec()
+            sim.initialize()
+            computation_time_report: str = sim.run_wrapper()
+            if sim.do_verbose:
+                print(computation_time_report)
+            if "do_cache_results" in sim.misc and sim.misc["do_cache_results"]:
+                sim.save_cache()
         except:
             print(f"Sim exec error: {sim}")
+            raise
         finally:
             if sim.do_verbose:
                 print(f"Sim exec completion: {sim}")
-        return result
-    
-    def exec_multiple_sims(self, function: Callable,) -> list[Sequence[tuple]]:
+        return sim
+
+    def exec_shared_sims(
+            self, function: Callable, i_sims: Sequence[int] | None=None,
+        ) -> list[tuple]:
         """
-        Carry out the `multiprocessing` parallelization of the ensemble of sims.
+        Carry out the `multiprocessing` parallelization of the ensemble 
+        of sims, with results returned through shared memory.
+
+        Sims are dispatched singly, costliest first (see `order_by_cost`), 
+        to whichever worker is free, so that no core is left idle while 
+        a long sim started late finishes. Results are reassembled in 
+        the order of `i_sims`: row i of the results block holds the mean 
+        density time series of sim `i_sims[i]`.
+
+        Once the pool is done, the shared blocks are unlinked, and wrapped,
+        without copying, as `self.t_epochs` and `self.mean_densities`, 
+        whose rows the sims' results then view. The arrays own their blocks
+        (see `SharedBlock`), which are only closed once no view of them is 
+        left, e.g. after the ensemble is gone and its sims' results too.
 
         Args:
-            function: wrapper passed to pool to act on each sim instance.
+            function: wrapper passed to pool to act on each sim task.
+            i_sims: indexes of the sims to run (all of them by default)
 
         Returns:
-            list of serialized outputs returned by each completed sim.
+            list of computation times & absorption times of the sims run.
         """
-        ensemble_results: list[Sequence[tuple]]
-        with Pool(processes=self.info["Misc"]["n_cores"]) as pool:
-            ensemble_results = (pool.map(function, self.sim_list,))
+        i_sims_: list[int] = (
+            list(range(len(self.sim_list))) if i_sims is None else list(i_sims)
+        )
+        parameters: dict = self.sim_list[0].parameters
+        n_sims: int = len(i_sims_)
+        n_epochs: int = dplvn.count_epochs(
+            parameters["t_final"], parameters["dt"],
+        )
+        shape: tuple[int,int] = (n_sims, n_epochs,)
+        itemsize: int = np.dtype(np.float64).itemsize
+        shared_memory: list[SharedMemory] = [
+            SharedMemory(create=True, size=n_epochs*itemsize),
+            SharedMemory(create=True, size=n_sims*n_epochs*itemsize),
+        ]
+        try:
+            tasks: list[tuple] = [
+                (
+                    i_, 
+                    {
+                        "Parameters": sim_.parameters, 
+                        "Analysis": sim_.analysis, 
+                        "Misc": sim_.misc,
+                    },
+                    shared_memory[0].name,
+                    shared_memory[1].name,
+                    shape,
+                    sim_.do_verbose,
+                )
+                for i_, sim_ in enumerate(
+                    [self.sim_list[i_sim_] for i_sim_ in i_sims_]
+                )
+            ]
+            i_rows: dict[int, int] = {
+                i_sim_: i_ for i_, i_sim_ in enumerate(i_sims_)
+            }
+            ensemble_results: list[tuple] = [()]*n_sims
+            progress_bar: Callable = (
+                progress if self.do_verbose else progress_disabled
+            )
+            with Pool(processes=self.info["Misc"]["n_cores"]) as pool:
+                # Costliest sims first, one at a time, to whichever 
+                #   worker is free
+                for (i_, computation_time_, t_absorption_,) in progress_bar(
+                    pool.imap_unordered(
+                        function, 
+                        [tasks[i_rows[i_]] for i_ in self.order_by_cost(i_sims_)], 
+                        chunksize=1,
+                    ),
+                    total=n_sims,
+                ):
+                    ensemble_results[i_] \
+                        = (computation_time_, t_absorption_,)
+                    if self.do_verbose:
+                        tqdm.write(
+                            f"Sim#{i_sims_[i_]+1} done: "
+                            + f"computation time = {computation_time_}"
+                            + ("" if t_absorption_ is None else 
+                               f", absorbed at t={t_absorption_}")
+                        )
+        finally:
+            # The blocks stay mapped, for the views below, once unlinked
+            for shared_memory_ in shared_memory:
+                shared_memory_.unlink()
+        self.t_epochs: NDArray = np.ndarray(
+            shape[1:], dtype=np.float64, buffer=SharedBlock(shared_memory[0]),
+        )
+        self.mean_densities: NDArray = np.ndarray(
+            shape, dtype=np.float64, buffer=SharedBlock(shared_memory[1]),
+        )
+        for i_sim_ in i_sims_:
+            self.sim_list[i_sim_].analysis["n_epochs"] = n_epochs
         return ensemble_results
 
+    def exec_streamed_sims(
+            self, function: Callable, i_sims: Sequence[int] | None=None,
+        ) -> None:
+        """
+        Carry out the `multiprocessing` parallelization of the ensemble 
+        of sims, folding each sim's results into the running statistics
+        (see `accumulate`) as soon as the sim is done.
+
+        Sims are dispatched singly, costliest first (see `order_by_cost`), 
+        to whichever worker is free. Only the results of sims still to be
+        folded in are ever held, so memory use doesn't grow with the number
+        of sims, unless per-sim results are kept (`do_keep_replicas`).
+
+        Args:
+            function: wrapper passed to pool to act on each sim task.
+            i_sims: indexes of the sims to run (all of them by default)
+        """
+        i_sims_: list[int] = (
+            list(range(len(self.sim_list))) if i_sims is None else list(i_sims)
+        )
+        tasks: dict[int, tuple] = {
+            i_: (
+                i_, 
+                {
+                    "Parameters": self.sim_list[i_].parameters, 
+                    "Analysis": self.sim_list[i_].analysis, 
+                    "Misc": self.sim_list[i_].misc,
+                },
+                self.sim_list[i_].do_verbose,
+            )
+            for i_ in i_sims_
+        }
+        progress_bar: Callable = (
+            progress if self.do_verbose else progress_disabled
+        )
+        with Pool(processes=self.info["Misc"]["n_cores"]) as pool:
+            for (
+                i_, computation_time_, t_absorption_, 
+                t_epochs_, mean_densities_,
+            ) in progress_bar(
+                pool.imap_unordered(
+                    function, 
+                    [tasks[i_] for i_ in self.order_by_cost(i_sims_)], 
+                    chunksize=1,
+                ),
+                total=len(i_sims_),
+            ):
+                sim_: Simulation = self.sim_list[i_]
+                # Pointed at the t_epochs shared by all sims in accumulate
+                sim_.t_epochs = t_epochs_
+                sim_.mean_densities = mean_densities_
+                sim_.misc["computation_time"] = computation_time_
+                sim_.t_absorption = t_absorption_
+                sim_.analysis["t_absorption"] = t_absorption_
+                sim_.analysis["n_epochs"] = len(t_epochs_)
+                self.accumulate(sim_)
+                if self.do_verbose:
+                    tqdm.write(
+                        f"Sim#{i_+1} done: "
+                        + f"computation time = {computation_time_}"
+                        + ("" if t_absorption_ is None else 
+                           f", absorbed at t={t_absorption_}")
+                    )
+
+    def accumulate(self, sim: Simulation) -> None:
+        """
+        Fold a sim's mean density time series into the running statistics 
+        for its `linear` value, and point the sim at the epoch time series
+        `t_epochs` shared by all the sims.
+        Unless `do_keep_replicas` is set, the sim then drops its mean 
+        density time series (leaving None) and its `dplvn.SimDP` instance.
+
+        Not thread-safe: threads must take turns (see `exec_threaded_sims`).
+
+        Args:
+            sim: simulation instance holding its results
+        """
+        self.statistics[sim.parameters["linear"]].add(sim.mean_densities)
+        if self.t_epochs is None:
+            self.t_epochs = sim.t_epochs
+        sim.t_epochs = self.t_epochs
+        if not self.do_keep_replicas:
+            sim.mean_densities = None
+            if hasattr(sim, "sim"):
+                del sim.sim
+
+    @staticmethod
+    def estimate_cost(parameters: dict, analysis: dict) -> float:
+        """
+        Estimate the relative computational cost of a sim.
+
+        The cost of a sim that runs to completion scales with its number of
+        cell updates, n_cells × n_epochs. A subcritical sim (a<a_c) is
+        expected to reach the absorbing state and stop early: after a time
+        of order the correlation time ξ_∥ ~ (a_c-a)^{-ν_∥}, which is taken
+        as the time it runs for, if that is sooner than t_final.
+
+        Args:
+            parameters: sim parameters dictionary
+            analysis: sim analysis dictionary
+
+        Returns:
+            estimated number of cell updates.
+        """
+        n_cells: int = int(np.prod(parameters["grid_size"]))
+        t_final: float = parameters["t_final"]
+        Δa: float = analysis["a_c"] - parameters["linear"]
+        t_run: float = (
+            t_final if Δa<=0 else min(t_final, Δa**(-analysis["dp_ν_ll"]))
+        )
+        return n_cells*(t_run/parameters["dt"] + 1)
+
+    def order_by_cost(self, i_sims: Sequence[int] | None=None) -> list[int]:
+        """
+        Order the sims by decreasing estimated cost (see `estimate_cost`).
+
+        Args:
+            i_sims: indexes of the sims to order (all of them by default)
+
+        Returns:
+            list of sim indexes, costliest first.
+        """
+        i_sims_: Sequence[int] = (
+            range(len(self.sim_list)) if i_sims is None else i_sims
+        )
+        costs: dict[int, float] = {
+            i_: self.estimate_cost(
+                self.sim_list[i_].parameters, self.sim_list[i_].analysis
+            )
+            for i_ in i_sims_
+        }
+        return sorted(costs, key=lambda i_: -costs[i_])
+
+    def exec_threaded_sims(
+            self, 
+            function: Callable, 
+            i_sims: Sequence[int] | None=None,
+            do_accumulate: bool=False,
+        ) -> list[Simulation]:
+        """
+        Carry out the thread-pool parallelization of the ensemble of sims.
+
+        If `do_accumulate` is set, each thread folds the results of its sim
+        into the running statistics (see `accumulate`), taking turns with 
+        the others, as soon as the sim is done: so only the sims still 
+        running hold their results.
+
+        Args:
+            function: wrapper passed to pool to act on each sim instance.
+            i_sims: indexes of the sims to run (all of them by default)
+            do_accumulate: flag whether to fold each sim into the running
+                statistics once it's done
+
+        Returns:
+            list of completed sim instances.
+        """
+        lock: Lock = Lock()
+        def run(sim_: Simulation) -> Simulation:
+            function(sim_)
+            if do_accumulate:
+                with lock:
+                    self.accumulate(sim_)
+            return sim_
+        with ThreadPoolExecutor(
+            max_workers=self.info["Misc"]["n_cores"]
+        ) as executor:
+            # Costliest sims first: each thread takes the next sim when free
+            list(executor.map(
+                run, 
+                [self.sim_list[i_] for i_ in self.order_by_cost(i_sims)],
+            ))
+        return self.sim_list
+
     def exec(self) -> None:
         """
-        Execute an ensemble of sims in parallel using `multiprocessing`.
+        Execute an ensemble of sims in parallel, using either 
+        `multiprocessing` or, if `Misc.do_use_threads` is set, threads.
+
+        If `Misc.do_cache_results` is set, each sim's results are cached 
+        to disk as soon as it is done, and sims whose results have already
+        been cached, for the same parameters and `dplvn` version, are not
+        run again: their cached results are loaded lazily instead 
+        (see `Simulation.load_cache`). So an interrupted ensemble can 
+        be resumed.
+
+        If `Misc.do_stream_statistics` is set, the results of each sim,
+        cached or not, are folded into `statistics` instead of being kept 
+        (unless `Misc.do_keep_replicas` is set): sims are run by processes 
+        (see `exec_streamed_sims`) or by threads, and no (n_sims, n_epochs) 
+        block of results is made.
         """
-        ensemble_results: list[Sequence[tuple]] \
-            = self.exec_multiple_sims(self.sim_exec_wrapper)
-        for (sim_results_, sim_,) in zip(ensemble_results, self.sim_list):
-            sim_.t_epochs = np.array(sim_results_[0])
-            sim_.mean_densities = np.array(sim_results_[1])
-            sim_.misc["computation_time"] = sim_results_[2]
-            self.info["Misc"]["computation_time"] = sim_results_[2]
+        do_cache_results: bool = (
+            "do_cache_results" in self.info["Misc"] 
+            and self.info["Misc"]["do_cache_results"]
+        )
+        do_stream_statistics: bool = (
+            "do_stream_statistics" in self.info["Misc"] 
+            and self.info["Misc"]["do_stream_statistics"]
+        )
+        self.do_keep_replicas = not do_stream_statistics or (
+            "do_keep_replicas" in self.info["Misc"] 
+            and self.info["Misc"]["do_keep_replicas"]
+        )
+        self.statistics = {}
+        self.t_epochs = None
+        if do_stream_statistics:
+            # One set of statistics per linear value, in the order of the sims
+            parameters: dict = self.sim_list[0].parameters
+            n_epochs: int = dplvn.count_epochs(
+                parameters["t_final"], parameters["dt"],
+            )
+            for sim_ in self.sim_list:
+                if sim_.parameters["linear"] not in self.statistics:
+                    self.statistics[sim_.parameters["linear"]] \
+                        = RunningStatistics(n_epochs)
+        i_sims: list[int] = []
+        for i_, sim_ in enumerate(self.sim_list):
+            sim_.misc["do_cache_results"] = do_cache_results
+            if not (do_cache_results and sim_.load_cache()):
+                i_sims.append(i_)
+            elif do_stream_statistics:
+                self.accumulate(sim_)
+        if self.do_verbose and do_cache_results:
+            print(
+                f"Loaded cached results of {len(self.sim_list)-len(i_sims)} "
+                + f"sim(s): running {len(i_sims)} sim(s)"
+            )
+        if len(i_sims)==0:
+            pass
+        elif (
+            "do_use_threads" in self.info["Misc"] 
+            and self.info["Misc"]["do_use_threads"]
+        ):
+            self.exec_threaded_sims(
+                self.sim_run_wrapper, i_sims, 
+                do_accumulate=do_stream_statistics,
+            )
+        elif do_stream_statistics:
+            self.exec_streamed_sims(self.sim_streamed_exec_wrapper, i_sims)
+        else:
+            ensemble_results: list[tuple] \
+                = self.exec_shared_sims(self.sim_shared_exec_wrapper, i_sims)
+            for (i_, (sim_results_, i_sim_,)) in enumerate(
+                zip(ensemble_results, i_sims)
+            ):
+                sim_: Simulation = self.sim_list[i_sim_]
+                sim_.t_epochs = self.t_epochs
+                sim_.mean_densities = self.mean_densities[i_]
+                sim_.misc["computation_time"] = sim_results_[0]
+                sim_.t_absorption = sim_results_[1]
+                sim_.analysis["t_absorption"] = sim_results_[1]
+        self.info["Misc"]["computation_time"] \
+            = self.sim_list[-1].misc["computation_time"]
         self.info["Misc"]["dplvn_version"] \
             = self.sim_list[0].misc["dplvn_version"]
         self.info["Misc"]["date_time"] \
             = self.sim_list[0].misc["date_time"]
 
+    def statistics_list(self) -> list[SimpleNamespace]:
+        """
+        Stand-ins for the sims, one per `linear` value, whose mean 
+        density time series is the ensemble mean over the replicas 
+        at that value.
+
+        Returns:
+            list of objects with the `parameters`, `analysis`, `t_epochs` 
+            and `mean_densities` of a sim, in the order of the sims.
+        """
+        sims: dict[float, Simulation] = {}
+        for sim_ in self.sim_list:
+            sims.setdefault(sim_.parameters["linear"], sim_)
+        return [
+            SimpleNamespace(
+                parameters=sim_.parameters,
+                analysis=sim_.analysis,
+                t_epochs=self.t_epochs,
+                mean_densities=self.statistics[linear_].mean,
+            )
+            for linear_, sim_ in sims.items()
+        ]
+
     def multi_plot(self) -> None:
         """
-        Generate graphs of the ensemble results.
+        Generate graphs of the ensemble results: of each sim, or if their
+        results weren't kept, of the ensemble mean at each `linear` value.
         """
         if not hasattr(self, "graphs"):
             self.graphs = VizDP()
+        sims_list: list[Any] = (
+            self.sim_list if self.do_keep_replicas else self.statistics_list()
+        )
         self.graphs.multiplot_mean_density_evolution(
             "ρ_t_loglog",
-            self.info, self.sim_list,
+            self.info, sims_list,
             do_rescale=False, y_sf=0.75,
         )
         self.graphs.multiplot_mean_density_evolution(
             "ρ_t_rescaled",
-            self.info, self.sim_list,
+            self.info, sims_list,
             do_rescale=True,
         )
         # self.graphs.multiplot_mean_density_evolution(
@@ -238,23 +758,44 @@ class Ensemble:
                 self.graphs.fdict, 
                 graphs_path,
                 do_verbose=False,
+                n_workers=(
+                    1 if "n_export_workers" not in self.info["Misc"]
+                    else self.info["Misc"]["n_export_workers"]
+                ),
             )
 
         data_path: str = \
             create_directories(self.info["Misc"]["path"], "",)
         if self.do_verbose:
             print(f"Combo data path:  {outfo_path}")
-        if self.info["Misc"]["do_export_combo_data"]:
-            t_epochs: NDArray = self.sim_list[0].t_epochs
-            mean_densities: NDArray = np.array([
-                sim_.mean_densities for sim_ in self.sim_list
-            ])
-        if not do_dummy:
-            np.savez_compressed(
-                os.path.join(data_path, "combo_ρ_t",), 
-                t_epochs=t_epochs,
-                mean_densities=mean_densities,
-            )
+        if self.info["Misc"]["do_export_combo_data"] and not do_dummy:
+            if self.do_keep_replicas:
+                t_epochs: NDArray = self.sim_list[0].t_epochs
+                mean_densities: NDArray = np.array([
+                    sim_.mean_densities for sim_ in self.sim_list
+                ])
+                np.savez_compressed(
+                    os.path.join(data_path, "combo_ρ_t",), 
+                    t_epochs=t_epochs,
+                    mean_densities=mean_densities,
+                )
+            if self.statistics:
+                # One row of each statistic per linear value
+                statistics: list[dict] = [
+                    statistics_.as_dict() 
+                    for statistics_ in self.statistics.values()
+                ]
+                np.savez_compressed(
+                    os.path.join(data_path, "combo_ρ_t_statistics",), 
+                    t_epochs=self.t_epochs,
+                    linears=np.array(list(self.statistics)),
+                    **{
+                        key_: np.array([
+                            statistics_[key_] for statistics_ in statistics
+                        ])
+                        for key_ in statistics[0]
+                    },
+                )
 
         if self.info["Misc"]["do_export_data"]:
             for (i_, sim_) in enumerate(self.sim_list):
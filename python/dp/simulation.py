@@ -16,12 +16,18 @@ except:
     # Quietly fail
     pass
 import sys, os
+from hashlib import sha256
+from io import TextIOWrapper
+from json import dump, dumps, load
 from os.path import join, pardir, isfile
-from os import listdir, remove
+from os import listdir, remove, replace
 sys.path.insert(0, join(pardir, "Packages"))
 from langevin.base.file import (
-    create_directories, export_info, export_plots,
+    create_directories, export_info, export_plots, export_images,
 )
+from langevin.base.correlation import CorrelationAccumulator
+from langevin.base.serialize import to_serializable
+from langevin.base.snapshot import SnapshotReader, SnapshotWriter
 from langevin.base.utils import (
     progress, progress_disabled, set_name,
 )
@@ -32,9 +38,10 @@ from pprint import PrettyPrinter
 pp = PrettyPrinter(indent=4).pprint
 
 # Possible fix to Windows issue with printing unicode characters 
-import io
+# (reconfigured in place: rewrapping the buffer would close it, and 
+# break any capture of stdout, once the old wrapper is garbage-collected)
 try:
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
 except:
     pass
 
@@ -101,15 +108,31 @@ class Simulation:
         self.do_verbose: bool = do_verbose
         self.t_epochs: NDArray = np.empty([])
         self.mean_densities: NDArray= np.empty([])
-        self.density_dict: dict[float, NDArray] = {}
+        self.observables: NDArray = np.empty([])
+        self.correlation: CorrelationAccumulator | None = None
+        self.t_absorption: float | None = None
+        self.density_dict: dict[float, NDArray] | SnapshotReader = {}
         self.density_image_dict: dict[int, Any] = {}
     
     def initialize(self) -> None:
         """
         Create and initialize a `dpvln.SimSP` class instance.
+
+        Grid observables to be recorded at every epoch, e.g. 
+        `["MEAN_SQUARED_DENSITY", "SURVIVAL"]`, can be listed in 
+        `Misc["observables"]` (see `dplvn.Observable`). For spreading from
+        a `SINGLE_SEED`, `["TOTAL_MASS", "SURVIVAL", "SQUARED_RADIUS"]`
+        gives N(t), P(t) and R²(t) without any grid snapshots.
         """
         self.sim = dplvn.SimDP(
             **self.parameters, 
+            observables=[
+                getattr(dplvn.Observable, observable_)
+                for observable_ in (
+                    self.misc["observables"] 
+                    if "observables" in self.misc else []
+                )
+            ],
             do_snapshot_grid=self.do_snapshot_grid,
             do_verbose=self.do_verbose,
         )
@@ -120,6 +143,38 @@ class Simulation:
     def run(self) -> None:
         """
         Execute a `dpvln.SimSP` simulation.
+
+        Segment by segment, only a grid snapshot (if requested) is copied 
+        out of the sim; the epoch and mean density time series (and any
+        observables) are fetched just once, at the end of the run.
+
+        If the density field reaches the absorbing state ρ=0 everywhere,
+        the remaining segments are skipped: `dplvn.SimDP` has already 
+        filled in the rest of the mean density time series with zeros.
+
+        If `Misc["do_stream_snapshots"]` is set, grid snapshots are 
+        streamed into a memory-mapped `ρ_snapshots.npy` file in the 
+        data directory, stored with `Misc["snapshot_dtype"]` precision 
+        (e.g. "float32"; default "float64"), rather than kept in memory; 
+        `density_dict` is then a lazy reader of this file.
+
+        If `Misc["n_checkpoint_segments"]` is set to N, the sim state is 
+        checkpointed to the data directory every N segments 
+        (see `dplvn.SimDP.checkpoint`). A run that finds a checkpoint of 
+        the same sim (see `cache_key`) there restores it, and carries on 
+        from the segment after it: the results are identical to those of 
+        an uninterrupted run. Streamed snapshots are resumed too; grid 
+        snapshots kept in memory are only those since the restart.
+        The checkpoint is deleted once the run is complete.
+
+        If `Misc["correlation_t_epochs"]` lists epoch times (which must
+        be, once rounded, the times of segment ends in the sim's own epoch 
+        time series, else a `ValueError` is raised before the run starts), 
+        the density structure factor and 
+        correlation function are accumulated at those times, without 
+        keeping any grids (see `CorrelationAccumulator`), into `correlation`.
+        As with snapshots kept in memory, a restarted run accumulates only
+        the epochs since the restart.
         """
         n_segments: int = self.misc["n_segments"]
         n_epochs: int = self.analysis["n_epochs"]
@@ -129,36 +184,291 @@ class Simulation:
                 f"Failed to segment sim with {n_epochs} epochs "
                 + f"into {n_segments} segment(s)"
             )
+        n_round: int = self.misc["n_round_Δt_summation"]
+        correlation_t_epochs: list[float] = [
+            np.round(t_epoch_, n_round)
+            for t_epoch_ in (
+                self.misc["correlation_t_epochs"] 
+                if "correlation_t_epochs" in self.misc 
+                and self.misc["correlation_t_epochs"] else []
+            )
+        ]
+        # The very times, rounded, under which step() accumulates grids
+        segment_t_epochs: set[float] = set(np.round(
+            self.sim.get_t_epochs()[::n_segment_epochs], n_round
+        ))
+        unmatched_t_epochs: list[float] = [
+            float(t_epoch_) for t_epoch_ in correlation_t_epochs
+            if t_epoch_ not in segment_t_epochs
+        ]
+        if unmatched_t_epochs:
+            raise ValueError(
+                f"Correlation epoch time(s) {unmatched_t_epochs} "
+                + "don't fall at the end of any segment"
+            )
         progress_bar: Callable = (
             progress if self.do_verbose else progress_disabled
         )
-        def step(i_segment_: int,):
+        n_checkpoint_segments: int = (
+            self.misc["n_checkpoint_segments"] 
+            if "n_checkpoint_segments" in self.misc 
+            and self.misc["n_checkpoint_segments"] else 0
+        )
+        checkpoint: dict | None = (
+            self.restore_checkpoint() if n_checkpoint_segments>0 else None
+        )
+        i_first_segment: int = (
+            0 if checkpoint is None else checkpoint["i_segment"]+1
+        )
+        snapshot_writer: SnapshotWriter | None = None
+        if self.do_snapshot_grid and (
+            "do_stream_snapshots" in self.misc 
+            and self.misc["do_stream_snapshots"]
+        ):
+            snapshot_writer = SnapshotWriter(
+                self.data_path(),
+                n_segments+1,
+                tuple(self.sim.get_density().shape),
+                dtype=(
+                    self.misc["snapshot_dtype"] 
+                    if "snapshot_dtype" in self.misc else "float64"
+                ),
+                t_epochs=(
+                    None if checkpoint is None 
+                    else checkpoint["snapshot_t_epochs"]
+                ),
+            )
+        if correlation_t_epochs:
+            self.correlation = CorrelationAccumulator(
+                tuple(self.sim.get_density().shape),
+                correlation_t_epochs,
+                dx=self.parameters["dx"],
+            )
+        def step(i_segment_: int,) -> bool:
             if i_segment_>0 and not self.sim.run(n_segment_epochs):
                 raise Exception("Failed to run sim")
-            self.sim.postprocess()
             if not self.sim.postprocess():
                 raise Exception("Failed to process sim results")
             t_epoch_ = np.round(
                 self.sim.get_t_current_epoch(), 
                 self.misc["n_round_Δt_summation"]
             )
-            if self.do_snapshot_grid:
-                self.density_dict[t_epoch_] = self.sim.get_density()
+            if snapshot_writer is not None:
+                # Stream the live view of the sim's buffer straight to disk
+                snapshot_writer.write(t_epoch_, self.sim.get_density())
+            elif self.do_snapshot_grid:
+                # The grid is a live view of the sim's buffer: keep a copy
+                self.density_dict[t_epoch_] = self.sim.get_density(copy=True)
+            if self.correlation is not None:
+                # Reduced straight away, so no copy of the grid is needed
+                self.correlation.add(t_epoch_, self.sim.get_density())
+            if (
+                n_checkpoint_segments>0 and i_segment_<n_segments
+                and (i_segment_+1)%n_checkpoint_segments==0
+            ):
+                self.save_checkpoint(i_segment_, snapshot_writer)
+            return self.sim.get_is_absorbed()
         # This ridiculous verbiage is needed because tqdm, even when
         #   disabled, generates some "leaked semaphore objects" errors
         #   when invoked in a `multiprocessing` process
         i_segment_: int
         if self.do_verbose:
-            for i_segment_ in progress_bar(range(0, n_segments+1, 1)):
-                step(i_segment_)
+            for i_segment_ in progress_bar(
+                range(i_first_segment, n_segments+1, 1)
+            ):
+                if step(i_segment_):
+                    break
         else:
-            for i_segment_ in range(0, n_segments+1, 1):
-                step(i_segment_)
+            for i_segment_ in range(i_first_segment, n_segments+1, 1):
+                if step(i_segment_):
+                    break
+        if snapshot_writer is not None:
+            self.density_dict = snapshot_writer.close()
+        if n_checkpoint_segments>0:
+            self.remove_checkpoint()
         self.t_epochs = np.round(
             self.sim.get_t_epochs(), 
             self.misc["n_round_Δt_summation"]
         )
-        self.mean_densities = self.sim.get_mean_densities()
+        self.mean_densities = self.sim.get_mean_densities(copy=True)
+        self.observables = self.sim.get_observables(copy=True)
+        if self.sim.get_is_absorbed():
+            self.t_absorption = float(np.round(
+                self.sim.get_t_absorption(), 
+                self.misc["n_round_Δt_summation"]
+            ))
+        self.analysis["t_absorption"] = self.t_absorption
+
+    def data_path(self) -> str:
+        """
+        Create (if need be) the directory for this sim's data files.
+
+        Returns:
+            path to the data directory.
+        """
+        seed_dir_name: str = f"rs{self.parameters["random_seed"]}"
+        return create_directories(self.misc["path"], seed_dir_name,)
+
+    def checkpoint_file_names(self) -> tuple[str, str]:
+        """
+        Paths of the sim state checkpoint file and of its description.
+
+        Returns:
+            paths to the binary `checkpoint.bin` and the `checkpoint.json` 
+            files in the data directory.
+        """
+        data_path: str = self.data_path()
+        return (
+            join(data_path, "checkpoint.bin"), 
+            join(data_path, "checkpoint.json"),
+        )
+
+    def save_checkpoint(
+            self, i_segment: int, snapshot_writer: SnapshotWriter | None,
+        ) -> None:
+        """
+        Checkpoint the `dplvn.SimDP` state after a segment of the run.
+
+        Each file is written to a temporary file which then replaces the
+        old one, so an interruption while checkpointing leaves the previous
+        checkpoint intact; the description is replaced last.
+
+        Args:
+            i_segment: index of the segment just done
+            snapshot_writer: writer of any streamed snapshots, whose 
+                snapshots are flushed to disk
+        """
+        checkpoint_file, checkpoint_info_file = self.checkpoint_file_names()
+        if snapshot_writer is not None:
+            snapshot_writer.flush()
+        if not self.sim.checkpoint(checkpoint_file+".tmp"):
+            raise Exception("Failed to checkpoint sim")
+        replace(checkpoint_file+".tmp", checkpoint_file)
+        file: TextIOWrapper
+        with open(
+            checkpoint_info_file+".tmp", "w", encoding="utf-8",
+        ) as file:
+            dump({
+                "key": self.cache_key(),
+                "n_segments": self.misc["n_segments"],
+                "i_segment": i_segment,
+                "snapshot_t_epochs": (
+                    None if snapshot_writer is None 
+                    else snapshot_writer.t_epochs
+                ),
+            }, file, indent=4,)
+        replace(checkpoint_info_file+".tmp", checkpoint_info_file)
+
+    def restore_checkpoint(self) -> dict | None:
+        """
+        Restore the `dplvn.SimDP` state from a checkpoint of this sim, if any.
+
+        Returns:
+            description of the checkpoint restored, including the index 
+            of the segment it was taken after, or None if there's none.
+        """
+        checkpoint_file, checkpoint_info_file = self.checkpoint_file_names()
+        if not (isfile(checkpoint_file) and isfile(checkpoint_info_file)):
+            return None
+        file: TextIOWrapper
+        with open(checkpoint_info_file, "r", encoding="utf-8",) as file:
+            checkpoint: dict = load(file)
+        if (
+            checkpoint["key"]!=self.cache_key() 
+            or checkpoint["n_segments"]!=self.misc["n_segments"]
+        ):
+            return None
+        if not self.sim.restore(checkpoint_file):
+            raise Exception("Failed to restore sim from checkpoint")
+        if self.do_verbose:
+            print(
+                f"Restored checkpoint after segment#{checkpoint["i_segment"]}"
+            )
+        return checkpoint
+
+    def remove_checkpoint(self) -> None:
+        """
+        Delete any checkpoint of this sim.
+        """
+        for file_name_ in self.checkpoint_file_names():
+            if isfile(file_name_):
+                remove(file_name_)
+
+    def cache_key(self) -> str:
+        """
+        Hash of the sim parameters and of the `dplvn` version.
+
+        Cached results are only reused if this key matches, so that a change 
+        of parameters, or a new version of the integrator, forces a re-run.
+
+        Returns:
+            hex digest of the key.
+        """
+        key: dict = {
+            "Parameters": {
+                key_: to_serializable(value_, dplvn,)
+                for key_, value_ in self.parameters.items()
+            },
+            "dplvn_version": dplvn.__version__,
+        }
+        return sha256(
+            dumps(key, sort_keys=True, default=str,).encode("utf-8")
+        ).hexdigest()
+
+    def save_cache(self) -> None:
+        """
+        Cache the sim results to its data directory.
+
+        The epoch and mean density time series are written to 
+        `ρ_t_cache.npy`, and the cache key, computation time and time of
+        absorption to `ρ_t_cache.json`. The latter is written last, so
+        that a sim interrupted while caching is not taken to be done.
+        """
+        data_path: str = self.data_path()
+        np.save(
+            join(data_path, "ρ_t_cache.npy"),
+            np.vstack([self.t_epochs, self.mean_densities]),
+        )
+        file: TextIOWrapper
+        with open(
+            join(data_path, "ρ_t_cache.json"), "w", encoding="utf-8",
+        ) as file:
+            dump({
+                "key": self.cache_key(),
+                "computation_time": self.misc["computation_time"],
+                "t_absorption": self.t_absorption,
+            }, file, indent=4,)
+
+    def load_cache(self) -> bool:
+        """
+        Load the sim results cached by `save_cache`, if they match this sim.
+
+        The time series are memory-mapped, so they are only read from 
+        disk when they are used.
+
+        Returns:
+            flag whether matching cached results were found and loaded.
+        """
+        data_path: str = join(
+            ".", *self.misc["path"], f"rs{self.parameters["random_seed"]}"
+        )
+        cache_file: str = join(data_path, "ρ_t_cache.json")
+        cache_npy_file: str = join(data_path, "ρ_t_cache.npy")
+        if not (isfile(cache_file) and isfile(cache_npy_file)):
+            return False
+        file: TextIOWrapper
+        with open(cache_file, "r", encoding="utf-8",) as file:
+            cache: dict = load(file)
+        if cache["key"]!=self.cache_key():
+            return False
+        results: np.memmap = np.load(cache_npy_file, mmap_mode="r")
+        self.t_epochs = results[0]
+        self.mean_densities = results[1]
+        self.t_absorption = cache["t_absorption"]
+        self.misc["computation_time"] = cache["computation_time"]
+        self.analysis["t_absorption"] = self.t_absorption
+        self.analysis["n_epochs"] = results.shape[1]
+        return True
 
     def run_wrapper(self) -> str:
         """
@@ -178,8 +488,8 @@ class Simulation:
         Carry out all simulation steps, including initialization & running.
 
         Returns:
-            serialized versions of sim epoch times, mean grid densities, and 
-            computation run time.
+            serialized versions of sim epoch times, mean grid densities, 
+            computation run time, and time of absorption (None if never).
         """
         self.initialize()
         computation_time_report: str = self.run_wrapper()
@@ -189,6 +499,7 @@ class Simulation:
             tuple(self.t_epochs.tolist()), 
             tuple(self.mean_densities.tolist()),
             self.misc["computation_time"],
+            self.t_absorption,
         )
 
     def plot(self) -> None:
@@ -255,21 +566,39 @@ class Simulation:
     def plot_images(self) -> None:
         """
         Generate all the required images.
+
+        If `Misc["do_fast_images"]` is set, each snapshot is rendered
+        as a bare RGBA image array through a color lookup table, 
+        `Misc["image_scale"]` pixels per grid cell (default 1), rather than
+        plotted as a Matplotlib figure: much faster for bulk export.
         """
         self.images: VizDP = VizDP()
-        t_epochs: tuple = tuple(self.density_dict.keys())
-        if len(t_epochs)==0: 
+        if len(self.density_dict)==0: 
             return None
-        t_last: float = t_epochs[-1]
-        n_digits: int = len(f"{t_last:0{self.misc["n_digits"]}.1f}".replace(".","p"))
+        (density_max, tick_Δρ, n_digits,) = self.image_settings()
         name_: str 
         density_: NDArray
         progress_bar: Callable = (
             progress if self.do_verbose else progress_disabled
         )
-        density_max: float = (
-            3 if "ρ_max" not in self.misc else self.misc["ρ_max"]
-        )
+        if "do_fast_images" in self.misc and self.misc["do_fast_images"]:
+            color_lut: NDArray = self.images.make_color_lut(do_alpha=True)
+            scale: int = (
+                1 if "image_scale" not in self.misc else self.misc["image_scale"]
+            )
+            for i_epoch_, t_epoch_ in progress_bar(enumerate(self.density_dict.keys())):
+                name_ =  f"ρ_t{t_epoch_:0{n_digits}.1f}".replace(".","p")
+                self.density_image_dict[i_epoch_] \
+                    = self.images.render_density_image(
+                        name_, 
+                        self.parameters, 
+                        self.density_dict[t_epoch_], 
+                        color_lut,
+                        density_max=density_max,
+                        do_extend_if_periodic=False,
+                        scale=scale,
+                    )
+            return None
         for i_epoch_, t_epoch_ in progress_bar(enumerate(self.density_dict.keys())):
             name_ =  f"ρ_t{t_epoch_:0{n_digits}.1f}".replace(".","p")
             density_ = self.density_dict[t_epoch_]
@@ -281,13 +610,91 @@ class Simulation:
                     t_epoch_, 
                     density_, 
                     density_max=density_max,
-                    tick_Δρ=(1 if density_max>=2 else (
-                        0.1 if density_max<=0.5 else 0.5)
-                    ),
+                    tick_Δρ=tick_Δρ,
                     do_extend_if_periodic=False,
                     n_digits=n_digits,
                 )
 
+    def image_settings(self) -> tuple[float, float, int]:
+        """
+        Settings common to all the density images of this sim.
+
+        Returns:
+            upper bound for rendering density, step in density colorbar
+            labeling, and number of digits used to print the time slice.
+        """
+        t_last: float = tuple(self.density_dict.keys())[-1]
+        n_digits: int = len(f"{t_last:0{self.misc["n_digits"]}.1f}".replace(".","p"))
+        density_max: float = (
+            3 if "ρ_max" not in self.misc else self.misc["ρ_max"]
+        )
+        tick_Δρ: float = (
+            1 if density_max>=2 else (0.1 if density_max<=0.5 else 0.5)
+        )
+        return (density_max, tick_Δρ, n_digits,)
+
+    def stream_video(self, video_file: str) -> None:
+        """
+        Make a video of the density snapshots by piping frames into ffmpeg.
+
+        Rather than exporting each density image to PNG and having ffmpeg
+        glob and decode them, each snapshot is rendered straight into 
+        an RGB frame (see `VizDP.density_frame_renderer`) and written 
+        as raw video to ffmpeg's stdin.
+
+        Args:
+            video_file: path to the video file to be written
+        """
+        if len(self.density_dict)==0: 
+            return None
+        (density_max, tick_Δρ, n_digits,) = self.image_settings()
+        t_epochs: tuple = tuple(self.density_dict.keys())
+        render_frame: Callable = VizDP().density_frame_renderer(
+            self.parameters, 
+            self.analysis,
+            t_epochs[-1],
+            density_max=density_max,
+            tick_Δρ=tick_Δρ,
+            do_extend_if_periodic=False,
+            n_digits=n_digits,
+        )
+        frame: NDArray = render_frame(t_epochs[0], self.density_dict[t_epochs[0]])
+        (height, width, _,) = frame.shape
+        try:
+            process = (
+                ffmpeg.input( 
+                    "pipe:", 
+                    format="rawvideo", 
+                    pix_fmt="rgb24", 
+                    s=f"{width}x{height}",
+                    framerate=self.misc["video_frame_rate"], 
+                )
+                .output(
+                    video_file,
+                    vf="crop=floor(iw/2)*2:floor(ih/2)*2",
+                    vcodec="libx264",
+                    pix_fmt="yuv420p",
+                    format=self.misc["video_format"],
+                )
+                .global_args("-loglevel", "error")
+                .overwrite_output()
+                .run_async(pipe_stdin=True)
+            )
+        except:
+            raise Exception("Failed to start ffmpeg")
+        progress_bar: Callable = (
+            progress if self.do_verbose else progress_disabled
+        )
+        try:
+            process.stdin.write(frame.tobytes())
+            for t_epoch_ in progress_bar(t_epochs[1:]):
+                frame = render_frame(t_epoch_, self.density_dict[t_epoch_])
+                process.stdin.write(frame.tobytes())
+        finally:
+            process.stdin.close()
+            if process.wait()!=0:
+                raise Exception("Failed to run ffmpeg")
+
     def save(
             self, 
             module: Any, 
@@ -309,6 +716,10 @@ class Simulation:
         except:
             print(f"Issue printing Outfo|graphs|videos|data path")
         seed_dir_name: str = f"rs{self.parameters["random_seed"]}"
+        n_export_workers: int = (
+            1 if "n_export_workers" not in self.misc 
+            else self.misc["n_export_workers"]
+        )
     
         outfo_path: str = \
             create_directories(
@@ -332,11 +743,17 @@ class Simulation:
                     join(data_path, "ρ_t",), 
                     t_epochs=self.t_epochs,
                     mean_densities=self.mean_densities,
+                    observables=self.observables,
                 )
                 data_npz: NpzFile = np.load(
                     join(data_path, "ρ_t"+".npz",), 
                 )
                 data_npz["t_epochs"][-10:], data_npz["mean_densities"][-10:]
+                if self.correlation is not None:
+                    np.savez_compressed(
+                        join(data_path, "ρ_correlation",), 
+                        **self.correlation.as_dict(),
+                    )
 
         if self.misc["do_export_graphs"]:
             graphs_path: str = \
@@ -348,6 +765,7 @@ class Simulation:
                         self.graphs.fdict, 
                         graphs_path,
                         do_verbose=self.do_verbose,
+                        n_workers=n_export_workers,
                     )
 
         if (
@@ -368,6 +786,12 @@ class Simulation:
                         self.images.fdict, 
                         images_path,
                         do_verbose=self.do_verbose,
+                        n_workers=n_export_workers,
+                    )
+                _ = export_images(
+                        self.images.idict, 
+                        images_path,
+                        do_verbose=self.do_verbose,
                     )
 
         if self.misc["do_make_video"]:
@@ -377,6 +801,15 @@ class Simulation:
 
             video_frame_rate: int = self.misc["video_frame_rate"]
             video_format: str = self.misc["video_format"]
+            if (
+                "do_stream_video" in self.misc 
+                and self.misc["do_stream_video"]
+            ):
+                if not do_dummy:
+                    self.stream_video(join(
+                        videos_path, f"ρ_{seed_dir_name}.{video_format}"
+                    ))
+                return None
             n_digits: int = self.misc["n_digits"]+1
             # video_images_wildcard: str = "ρ_t"+"?"*n_digits+".png"
             video_images_wildcard: str = "ρ_t*.png"
@@ -2,7 +2,7 @@
 Provide a data visualization class for DP simulations.
 """
 import warnings
-from typing import Any
+from typing import Any, Callable
 from functools import reduce
 # from copy import deepcopy
 import numpy as np
@@ -10,6 +10,9 @@ from numpy.typing import NDArray
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from matplotlib.text import Text
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import ListedColormap, Colormap
 from langevin.base.viz import Viz
 from langevin.base.utils import make_sim_title
@@ -23,6 +26,269 @@ class VizDP(Viz):
     """
     Visualization class for directed percolation simulations.
     """
+    #: RGBA color of the absorbing phase ρ=0 in density images
+    absorbing_color: list[float] = [0.9, 0.9, 0.9, 0.9]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initialize, adding a dictionary of rendered density images.
+
+        Args:
+            args: passed to `Viz`
+            kwargs: passed to `Viz`
+        """
+        super().__init__(*args, **kwargs)
+        self.idict: dict[str, NDArray] = {}
+
+    @staticmethod
+    def density_image_prefix(t_epoch: float, n_digits: int) -> str:
+        """
+        Time-slice prefix of a density image title.
+
+        Args:
+            t_epoch: time slice of density grid
+            n_digits: number of digits to be used in printing the time
+
+        Returns:
+            LaTeX string labeling the density field at time t_epoch.
+        """
+        return (
+            r"$\rho(\mathbf{x},t=$" + f"{t_epoch:0{n_digits-1}.0f}" + r"$)$  "
+            # r"$\rho(\mathbf{x},t=$" + f"{t_epoch:0{n_digits+2}.1f}" + r"$)$  "
+        )
+
+    @staticmethod
+    def orient_density_grid(
+            parameters: dict,
+            density: NDArray,
+            do_extend_if_periodic: bool=False,
+        ) -> NDArray:
+        """
+        Orient a density grid for display, with x across and y upwards.
+
+        Args:
+            parameters: sim parameters dictionary
+            density: the (n_x, n_y) sliced density field
+            do_extend_if_periodic: artificially extend grid by ~20% in periodic directions
+
+        Returns:
+            (n_y, n_x) density array, possibly extended, top row first.
+        """
+        grid_: NDArray = np.flipud(density.T)
+        n_pad_ud: int
+        n_pad_lr: int
+        if (
+            do_extend_if_periodic 
+            and parameters["grid_topologies"][1]==dplvn.PERIODIC
+        ):
+            n_pad_ud = max(grid_.shape[0]//5, 10)
+            grid_ = np.vstack([grid_, grid_[:n_pad_ud]])
+        if (
+            do_extend_if_periodic 
+            and parameters["grid_topologies"][0]==dplvn.PERIODIC
+        ):
+            n_pad_lr = max(grid_.shape[1]//5, 10)
+            grid_ = np.hstack([grid_, grid_[:,:n_pad_lr]])
+        return grid_
+
+    def make_color_lut(
+            self,
+            color_palette: str="plasma",
+            n_colors: int=1000,
+            do_alpha: bool=False,
+        ) -> NDArray:
+        """
+        Tabulate the density image colormap as 8-bit RGB(A) values.
+
+        The table is that used by `plot_density_image`: the palette is
+        resampled into `n_colors` levels, the lowest of which (the absorbing 
+        phase ρ=0) is a translucent gray. Unless alpha is kept, colors 
+        are composited over a white background.
+
+        Args:
+            color_palette: for image grid rendering
+            n_colors: number of color levels
+            do_alpha: tabulate RGBA rather than RGB values
+
+        Returns:
+            (n_colors, 3) or (n_colors, 4) uint8 array of RGB(A) values.
+        """
+        color_map: Colormap = mpl.colormaps[color_palette].resampled(n_colors)
+        rgba: NDArray = color_map(np.arange(n_colors))
+        rgba[0] = self.absorbing_color
+        if do_alpha:
+            return (rgba*255).astype(np.uint8)
+        rgb: NDArray = rgba[:,:3]*rgba[:,3:] + (1-rgba[:,3:])
+        return (rgb*255).astype(np.uint8)
+
+    @staticmethod
+    def map_density_colors(
+            grid: NDArray,
+            n_colors: int,
+            density_max: float,
+        ) -> NDArray:
+        """
+        Map densities onto color table indexes, as Matplotlib's `imshow` does.
+
+        Args:
+            grid: density array
+            n_colors: number of color levels
+            density_max: upper bound for rendering density
+
+        Returns:
+            integer array of color table indexes.
+        """
+        return np.clip(
+            (grid*(n_colors/density_max)).astype(np.intp), 0, n_colors-1,
+        )
+
+    def render_density_image(
+            self,
+            name: str,
+            parameters: dict,
+            density: NDArray,
+            color_lut: NDArray,
+            density_max: float=0.5,
+            do_extend_if_periodic: bool=False,
+            scale: int=1,
+        ) -> NDArray:
+        """
+        Render the density field as a bare image, bypassing Matplotlib figures.
+
+        Densities are mapped through a precomputed color lookup table 
+        (see `make_color_lut`), in vectorized NumPy, in the same way as 
+        by `plot_density_image`; there is no title, colorbar or axes.
+        The image is added to the `idict` dictionary, from which it can be 
+        exported to PNG (see `export_images`); its raw buffer is 
+        `image.tobytes()`.
+
+        Args:
+            name: of image to be used as key in image dictionary
+            parameters: sim parameters dictionary
+            density: the sliced density field
+            color_lut: (n_colors, 3|4) uint8 color lookup table
+            density_max: upper bound for rendering density
+            do_extend_if_periodic: artificially extend grid by ~20% in periodic directions
+            scale: number of pixels per grid cell along each direction
+
+        Returns:
+            (n_y*scale, n_x*scale, 3|4) uint8 RGB(A) image array, top row first.
+        """
+        image: NDArray = color_lut[self.map_density_colors(
+            self.orient_density_grid(
+                parameters, density, do_extend_if_periodic,
+            ),
+            color_lut.shape[0],
+            density_max,
+        )]
+        if scale>1:
+            image = np.repeat(np.repeat(image, scale, axis=0), scale, axis=1)
+        self.idict[name] = image
+        return image
+
+    def density_frame_renderer(
+            self,
+            parameters: dict,
+            analysis: dict,
+            t_epoch_last: float,
+            density_max: float=0.5,
+            tick_Δρ: float=0.5,
+            do_extend_if_periodic: bool=False,
+            n_digits: int=6,
+            color_palette: str="plasma",
+            n_colors: int=1000,
+            dpi: int=150,
+        ) -> Callable[[float, NDArray], NDArray]:
+        """
+        Make a fast renderer of density images as RGB video frames.
+
+        The axes, colorbar and labels of a `plot_density_image` figure 
+        are rasterized just once. Each frame is then a copy of this 
+        background, with only the time-slice title drawn by Matplotlib, 
+        and the density grid pasted in after mapping it through a color 
+        lookup table, in vectorized NumPy. Frames are cropped as if exported 
+        with `bbox_inches="tight"`.
+
+        Args:
+            parameters: sim parameters dictionary
+            analysis: sim analysis dictionary
+            t_epoch_last: time of last frame, used to size the title
+            density_max: upper bound for rendering density
+            tick_Δρ: step in density colorbar labeling
+            do_extend_if_periodic: artificially extend grid by ~20% in periodic directions
+            n_digits: number of digits to be used in title when printing time
+            color_palette: for image grid rendering
+            n_colors: number of color levels
+            dpi: frame resolution
+
+        Returns:
+            function mapping a time slice and density grid to an 
+            (height, width, 3) uint8 RGB frame.
+        """
+        template_name: str = "ρ_frame_template"
+        grid_size: tuple[int,int] = tuple(parameters["grid_size"])
+        template: Figure = self.plot_density_image(
+            template_name, 
+            parameters, 
+            analysis, 
+            t_epoch_last, 
+            np.zeros(grid_size),
+            density_max=density_max,
+            tick_Δρ=tick_Δρ,
+            do_extend_if_periodic=do_extend_if_periodic,
+            n_digits=n_digits,
+            color_palette=color_palette,
+        )
+        del self.fdict[template_name]
+        template.set_dpi(dpi)
+        canvas: FigureCanvasAgg = FigureCanvasAgg(template)
+        axes: Axes = template.axes[0]
+        title: Text = axes.title
+        sim_title: str = make_sim_title(parameters, analysis, dplvn,)
+        canvas.draw()
+        renderer: Any = canvas.get_renderer()
+        (_, height,) = canvas.get_width_height()
+        # Crop to the tight bounding box plus padding, sized with the last title
+        crop: Any = template.get_tightbbox(renderer).padded(0.05)
+        crop_x0: int = max(int(np.floor(crop.x0*dpi)), 0)
+        crop_x1: int = int(np.ceil(crop.x1*dpi))
+        crop_y0: int = max(height - int(np.ceil(crop.y1*dpi)), 0)
+        crop_y1: int = height - int(np.floor(crop.y0*dpi))
+        # Rasterize everything but the title & image once
+        # (an axes hiding its title shifts the title position: reinstate it)
+        title_position: tuple[float,float] = title.get_position()
+        title.set_visible(False)
+        canvas.draw()
+        background: Any = canvas.copy_from_bbox(template.bbox)
+        title.set_visible(True)
+        title.set_position(title_position)
+        # Nearest-neighbor resampling of the grid onto the axes' pixels
+        box: Any = axes.get_window_extent(renderer)
+        (x0, x1,) = (int(round(box.x0)), int(round(box.x1)),)
+        (y0, y1,) = (height-int(round(box.y1)), height-int(round(box.y0)),)
+        (n_ud, n_lr,) = self.orient_density_grid(
+            parameters, np.zeros(grid_size), do_extend_if_periodic,
+        ).shape
+        rows: NDArray = ((np.arange(y1-y0)+0.5)*n_ud/(y1-y0)).astype(np.intp)
+        columns: NDArray = ((np.arange(x1-x0)+0.5)*n_lr/(x1-x0)).astype(np.intp)
+        color_lut: NDArray = self.make_color_lut(color_palette, n_colors)
+
+        def render(t_epoch: float, density: NDArray) -> NDArray:
+            canvas.restore_region(background)
+            title.set_text(self.density_image_prefix(t_epoch, n_digits)+sim_title)
+            template.draw_artist(title)
+            frame: NDArray = np.array(canvas.buffer_rgba())[..., :3]
+            color_indexes: NDArray = self.map_density_colors(
+                self.orient_density_grid(
+                    parameters, density, do_extend_if_periodic,
+                ),
+                n_colors, 
+                density_max,
+            )
+            frame[y0:y1, x0:x1] = color_lut[color_indexes[np.ix_(rows, columns)]]
+            return frame[crop_y0:crop_y1, crop_x0:crop_x1]
+        
+        return render
     def plot_density_image(
             self,
             name: str, 
@@ -59,34 +325,21 @@ class VizDP(Viz):
         fig_size: tuple[float,float] = (6.5*sf, 6.5/sf,)
         fig = self.create_figure(fig_name=name, fig_size=fig_size,)
 
-        prefix: str = (
-            r"$\rho(\mathbf{x},t=$" + f"{t_epoch:0{n_digits-1}.0f}" + r"$)$  "
-            # r"$\rho(\mathbf{x},t=$" + f"{t_epoch:0{n_digits+2}.1f}" + r"$)$  "
-        )
         title = make_sim_title(
             parameters, analysis, dplvn,
         )
-        plt.title(prefix+title, fontdict={"size":10},)
+        plt.title(
+            self.density_image_prefix(t_epoch, n_digits)+title, 
+            fontdict={"size":10},
+        )
 
-        grid_: NDArray = np.flipud(density.T)
-        n_pad_ud: int
-        n_pad_lr: int
-        if (
-            do_extend_if_periodic 
-            and parameters["grid_topologies"][0]==dplvn.PERIODIC
-        ):
-            n_pad_ud = max(grid_.shape[0]//5, 10)
-            grid_ = np.vstack([grid_, grid_[:n_pad_ud]])
-        if (
-            do_extend_if_periodic 
-            and parameters["grid_topologies"][1]==dplvn.PERIODIC
-        ):
-            n_pad_lr = max(grid_.shape[1]//5, 10)
-            grid_ = np.hstack([grid_, grid_[:,:n_pad_lr]])
+        grid_: NDArray = self.orient_density_grid(
+            parameters, density, do_extend_if_periodic,
+        )
         (n_ud, n_lr,) = grid_.shape
         # Fix absorbing phase ρ=0 to be gray
         color_map: Colormap = mpl.colormaps[color_palette].resampled(1000)
-        color_map.colors[0] = [0.9, 0.9, 0.9, 0.9]
+        color_map.colors[0] = self.absorbing_color
         plt.imshow(
             grid_,  
             extent=(0, n_lr, 0, n_ud), 
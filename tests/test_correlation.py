@@ -0,0 +1,142 @@
+"""!
+@file test_correlation.py
+@brief Unit test accumulation of density correlations & structure factors.
+"""
+
+import unittest
+import tempfile
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+from langevin.dp.simulation import Simulation
+from langevin.base.correlation import CorrelationAccumulator
+
+def sim_parameters() -> dict:
+    return dict(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0,
+        t_final=2,
+        dx=0.5, dt=0.1,
+        random_seed=1,
+        grid_dimension=dplvn.D2,
+        grid_size=(12, 9,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+    )
+
+def radial_averages(density: NDArray, dx: float) -> tuple[NDArray, NDArray]:
+    # Brute-force C(r) from shifted copies, and S(k) from the full spectrum
+    (n_x, n_y,) = density.shape
+    fluctuation: NDArray = density - density.mean()
+    c_grid: NDArray = np.array([[
+        np.mean(fluctuation*np.roll(fluctuation, (-x, -y,), axis=(0, 1,)))
+        for y in range(n_y)] for x in range(n_x)
+    ])
+    r_x: NDArray = np.minimum(np.arange(n_x), n_x-np.arange(n_x))
+    r_y: NDArray = np.minimum(np.arange(n_y), n_y-np.arange(n_y))
+    r_shells: NDArray = np.rint(np.hypot(r_x[:,None], r_y[None,:])).ravel()
+    s_grid: NDArray = np.abs(np.fft.fft2(fluctuation))**2 / density.size
+    k: NDArray = 2*np.pi*np.hypot(
+        np.fft.fftfreq(n_x, d=dx)[:,None], np.fft.fftfreq(n_y, d=dx)[None,:]
+    )
+    k_shells: NDArray = np.rint(k/(2*np.pi/(dx*min(n_x, n_y)))).ravel()
+    return (
+        np.array([
+            np.mean(c_grid.ravel()[r_shells==shell_])
+            for shell_ in np.unique(r_shells)
+        ]),
+        np.array([
+            np.mean(s_grid.ravel()[k_shells==shell_])
+            for shell_ in np.unique(k_shells)
+        ]),
+    )
+
+class TestCorrelation(unittest.TestCase):
+
+    def test_match_brute_force(self):
+        sim = dplvn.SimDP(**sim_parameters())
+        sim.initialize(5)
+        sim.run(10)
+        t_epoch: float = round(sim.get_t_current_epoch(), 5)
+        accumulator = CorrelationAccumulator(
+            sim.get_density().shape, [t_epoch, 2.0,], dx=0.5,
+        )
+        self.assertTrue(accumulator.add(t_epoch, sim.get_density()))
+        self.assertFalse(accumulator.add(1.5, sim.get_density()))
+        density: NDArray = sim.get_density(copy=True)
+        (expected_c, expected_s,) = radial_averages(density, 0.5)
+        (r, c,) = accumulator.correlation(t_epoch)
+        (k, s,) = accumulator.structure_factor(t_epoch)
+        self.assertTrue(np.allclose(c, expected_c))
+        self.assertTrue(np.allclose(s, expected_s))
+        self.assertEqual(r[0], 0)
+        self.assertTrue(np.isclose(c[0], np.var(density)))
+        self.assertTrue(np.all(np.diff(r)>0) and np.all(np.diff(k)>0))
+        # Nothing accumulated yet at t=2
+        with self.assertRaises(ValueError):
+            accumulator.structure_factor(2.0)
+        self.assertEqual(list(accumulator.as_dict()["t_epochs"]), [t_epoch])
+
+    def test_batches_and_merges(self):
+        grids: NDArray = np.random.default_rng(1).uniform(size=(5, 12, 9,))
+        batched = CorrelationAccumulator((12, 9,), [1.0,])
+        batched.add(1.0, grids[:3])
+        merged = CorrelationAccumulator((12, 9,), [1.0,])
+        merged.add(1.0, grids[3:])
+        batched.merge(merged)
+        single = CorrelationAccumulator((12, 9,), [1.0,])
+        for grid_ in grids:
+            single.add(1.0, grid_)
+        self.assertEqual(batched.n_snapshots[1.0], 5)
+        self.assertTrue(np.allclose(
+            batched.power_spectrum(1.0), single.power_spectrum(1.0)
+        ))
+        with self.assertRaises(ValueError):
+            batched.add(1.0, grids[0][:,:8])
+
+    def test_simulation(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            info: dict = {
+                "Parameters": sim_parameters(),
+                "Analysis": {},
+                "Misc": {
+                    "n_round_Δt_summation": 5, "n_segments": 4,
+                    "correlation_t_epochs": [1.0, 2.0],
+                },
+            }
+            sim = Simulation(
+                name="Correlation", path=[data_dir], info=info,
+                do_snapshot_grid=True, do_verbose=False,
+            )
+            sim.initialize()
+            sim.run()
+            correlation: dict = sim.correlation.as_dict()
+            self.assertEqual(list(correlation["t_epochs"]), [1.0, 2.0])
+            self.assertEqual(correlation["structure_factors"].shape[0], 2)
+            for (t_epoch_, c_) in zip(
+                correlation["t_epochs"], correlation["correlations"]
+            ):
+                self.assertTrue(np.allclose(
+                    c_, radial_averages(sim.density_dict[t_epoch_], 0.5)[0]
+                ))
+            # Epochs that aren't segment ends would never be accumulated
+            info["Misc"]["correlation_t_epochs"] = [1.0, 0.7, 1.2]
+            sim = Simulation(
+                name="Correlation", path=[data_dir], info=info,
+                do_snapshot_grid=False, do_verbose=False,
+            )
+            sim.initialize()
+            with self.assertRaises(ValueError) as context:
+                sim.run()
+            self.assertIn("[0.7, 1.2]", str(context.exception))
+
+if __name__ == '__main__':
+    unittest.main()
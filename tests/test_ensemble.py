@@ -0,0 +1,208 @@
+"""!
+@file test_ensemble.py
+@brief Unit test execution of an ensemble of sims by processes & by threads.
+"""
+
+import unittest
+import tempfile
+import json
+import gc
+from copy import deepcopy
+import numpy as np
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+from langevin.dp.ensemble import Ensemble, SharedBlock
+from langevin.base.statistics import RunningStatistics
+
+info: dict = {
+    "Parameters": {
+        "linear": 1.18855, "quadratic": 1, "diffusion": 0.04, "noise": 1,
+        "dx": 1, "dt": 0.1, "t_final": 20.0, "random_seed": 1,
+        "grid_dimension": "D2", "grid_size": [40, 30],
+        "grid_topologies": ["BOUNDED", "BOUNDED"],
+        "boundary_conditions": ["FLOATING", "FLOATING", "FLOATING", "FLOATING"],
+        "bc_values": [0, 0, 0, 0],
+        "initial_condition": "RANDOM_UNIFORM", "ic_values": [0, 10],
+        "integration_method": "RUNGE_KUTTA"
+    },
+    "Analysis": {"a_c": 1.18857},
+    "Misc": {
+        "n_sims": 4, "Δa_range": 0.01, "n_round_Δt_summation": 5,
+        "n_segments": 4, "n_digits": 6,
+    }
+}
+
+def exec_ensemble(
+        info_dir: str, do_use_threads: bool, do_cache_results: bool=False,
+        **misc,
+    ) -> Ensemble:
+    ensemble = Ensemble([info_dir], do_verbose=False)
+    ensemble.info["Misc"]["do_use_threads"] = do_use_threads
+    ensemble.info["Misc"]["do_cache_results"] = do_cache_results
+    ensemble.info["Misc"].update(misc)
+    ensemble.create()
+    ensemble.exec()
+    return ensemble
+
+class TestEnsemble(unittest.TestCase):
+
+    def test_count_epochs(self):
+        self.assertEqual(dplvn.count_epochs(t_final=20.0, dt=0.1), 201)
+        self.assertEqual(dplvn.count_epochs(t_final=1, dt=0.3), 5)
+
+    def test_estimate_cost(self):
+        parameters: dict = dict(
+            linear=1.0, grid_size=(100, 50,), t_final=10000.0, dt=0.1,
+        )
+        analysis: dict = dict(a_c=1.18857, dp_ν_ll=1.2950)
+        cost = lambda linear: Ensemble.estimate_cost(
+            parameters | dict(linear=linear), analysis,
+        )
+        full_cost: float = 100*50*100001
+        self.assertAlmostEqual(cost(1.2), full_cost)
+        self.assertAlmostEqual(cost(1.18857), full_cost)
+        # Subcritical sims cost less the further they are from criticality
+        self.assertLess(cost(1.18), full_cost)
+        self.assertLess(cost(1.1), cost(1.18))
+
+    def test_shared_memory_results(self):
+        with tempfile.TemporaryDirectory() as info_dir:
+            with open(os.path.join(info_dir, "Info.json"), "w") as file:
+                json.dump(info, file)
+            by_processes: Ensemble = exec_ensemble(info_dir, False)
+            by_threads: Ensemble = exec_ensemble(info_dir, True)
+        self.assertEqual(by_processes.mean_densities.shape, (4, 201,))
+        # The results block wraps the shared memory, uncopied
+        self.assertIsInstance(by_processes.mean_densities.base, SharedBlock)
+        for i_, (sim_p, sim_t) in enumerate(
+            zip(by_processes.sim_list, by_threads.sim_list)
+        ):
+            # Results are rows of the shared block
+            self.assertTrue(np.shares_memory(
+                sim_p.mean_densities, by_processes.mean_densities
+            ))
+            self.assertTrue(np.array_equal(sim_p.t_epochs, sim_t.t_epochs))
+            self.assertTrue(np.array_equal(
+                sim_p.mean_densities, sim_t.mean_densities
+            ))
+            self.assertEqual(sim_p.t_absorption, sim_t.t_absorption)
+            self.assertEqual(sim_p.analysis["n_epochs"], 201)
+        # Results outlive the ensemble that computed them, and so the
+        # shared memory holding them stays mapped
+        expected: np.ndarray = by_processes.mean_densities.copy()
+        sims: list = by_processes.sim_list
+        del by_processes
+        gc.collect()
+        for i_, sim_ in enumerate(sims):
+            self.assertTrue(np.array_equal(sim_.mean_densities, expected[i_]))
+
+    def test_cached_results(self):
+        with tempfile.TemporaryDirectory() as info_dir:
+            with open(os.path.join(info_dir, "Info.json"), "w") as file:
+                json.dump(info, file)
+            first: Ensemble = exec_ensemble(info_dir, False, True)
+            # Mimic an interrupted ensemble: lose the cache of the last sim
+            last_sim = first.sim_list[-1]
+            cache_dir: str = os.path.join(
+                *last_sim.misc["path"], f"rs{last_sim.parameters["random_seed"]}",
+            )
+            os.remove(os.path.join(cache_dir, "ρ_t_cache.json"))
+            resumed: Ensemble = exec_ensemble(info_dir, False, True)
+            # Only the last sim is re-run
+            self.assertEqual(resumed.mean_densities.shape, (1, 201,))
+            for sim_f, sim_r in zip(first.sim_list, resumed.sim_list):
+                self.assertTrue(np.array_equal(sim_f.t_epochs, sim_r.t_epochs))
+                self.assertTrue(np.array_equal(
+                    sim_f.mean_densities, sim_r.mean_densities
+                ))
+                self.assertEqual(sim_f.t_absorption, sim_r.t_absorption)
+            self.assertIsInstance(resumed.sim_list[0].mean_densities, np.memmap)
+            # A change of parameters invalidates the cache
+            resumed.sim_list[0].parameters["dt"] = 0.2
+            self.assertFalse(resumed.sim_list[0].load_cache())
+            del first, resumed
+
+    def test_streamed_statistics(self):
+        replicas_info: dict = deepcopy(info)
+        replicas_info["Misc"]["do_replicas"] = True
+        with tempfile.TemporaryDirectory() as info_dir:
+            with open(os.path.join(info_dir, "Info.json"), "w") as file:
+                json.dump(replicas_info, file)
+            kept: Ensemble = exec_ensemble(info_dir, True)
+            streamed: list[Ensemble] = [
+                exec_ensemble(
+                    info_dir, do_use_threads_, do_stream_statistics=True,
+                )
+                for do_use_threads_ in (False, True,)
+            ]
+        # All the sims are replicas at one linear value
+        self.assertEqual(
+            {sim_.parameters["linear"] for sim_ in kept.sim_list}, {1.18855}
+        )
+        mean_densities: np.ndarray = np.array([
+            sim_.mean_densities for sim_ in kept.sim_list
+        ])
+        is_surviving: np.ndarray = mean_densities>0
+        for ensemble_ in streamed:
+            self.assertEqual(list(ensemble_.statistics), [1.18855])
+            statistics: RunningStatistics = ensemble_.statistics[1.18855]
+            self.assertEqual(statistics.n_replicas, 4)
+            self.assertTrue(np.array_equal(
+                ensemble_.t_epochs, kept.sim_list[0].t_epochs
+            ))
+            self.assertTrue(np.allclose(
+                statistics.mean, np.mean(mean_densities, axis=0)
+            ))
+            self.assertTrue(np.allclose(
+                statistics.variance, np.var(mean_densities, axis=0, ddof=1)
+            ))
+            self.assertTrue(np.allclose(
+                statistics.survival, np.mean(is_surviving, axis=0)
+            ))
+            self.assertTrue(np.allclose(
+                statistics.surviving_mean, 
+                np.sum(mean_densities, axis=0)/np.sum(is_surviving, axis=0),
+            ))
+            # Per-replica results weren't kept; epochs are shared
+            for sim_ in ensemble_.sim_list:
+                self.assertIsNone(sim_.mean_densities)
+                self.assertIs(sim_.t_epochs, ensemble_.t_epochs)
+                self.assertFalse(hasattr(sim_, "sim"))
+            self.assertEqual(len(ensemble_.statistics_list()), 1)
+
+    def test_merged_statistics(self):
+        rng = np.random.default_rng(1)
+        replicas: np.ndarray = rng.uniform(size=(7, 11,))
+        replicas[rng.uniform(size=replicas.shape)<0.3] = 0
+        merged = RunningStatistics(11)
+        other = RunningStatistics(11)
+        for replica_ in replicas[:3]:
+            merged.add(replica_)
+        for replica_ in replicas[3:]:
+            other.add(replica_)
+        merged.merge(other)
+        self.assertEqual(merged.n_replicas, 7)
+        self.assertTrue(np.allclose(merged.mean, np.mean(replicas, axis=0)))
+        self.assertTrue(np.allclose(
+            merged.variance, np.var(replicas, axis=0, ddof=1)
+        ))
+        n_surviving: np.ndarray = np.sum(replicas>0, axis=0)
+        self.assertTrue(np.allclose(
+            merged.surviving_mean, 
+            np.where(
+                n_surviving>0, 
+                np.sum(replicas, axis=0)/np.maximum(n_surviving, 1), 
+                np.nan,
+            ),
+            equal_nan=True,
+        ))
+        with self.assertRaises(ValueError):
+            merged.add(replicas[0][:5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""!
+@file test_export_plots.py
+@brief Unit test serial and parallel export of figures to file.
+"""
+
+import unittest
+import tempfile
+import numpy as np
+import os
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.image import imread
+from langevin.base.file import export_plots
+
+def make_figures(n_figures: int) -> dict:
+    fig_dict: dict = {}
+    for i_figure in range(n_figures):
+        fig = plt.figure(figsize=(2, 2,))
+        plt.plot(np.arange(10), np.arange(10)**(1+i_figure/10))
+        plt.title(f"Figure {i_figure}")
+        plt.close()
+        fig_dict[f"fig_{i_figure:02d}"] = fig
+    return fig_dict
+
+class TestExportPlots(unittest.TestCase):
+
+    def test_parallel_matches_serial(self):
+        fig_dict: dict = make_figures(6)
+        with (
+            tempfile.TemporaryDirectory() as serial_path, 
+            tempfile.TemporaryDirectory() as parallel_path
+        ):
+            export_plots(fig_dict, serial_path, dpi=50,)
+            export_plots(
+                fig_dict, parallel_path, 
+                file_types=["png", "pdf"], dpi=50, n_workers=3,
+            )
+            self.assertEqual(
+                sorted(os.listdir(parallel_path)), 
+                sorted([f"{name}.{file_type}" 
+                        for name in fig_dict for file_type in ("png", "pdf",)])
+            )
+            for name in fig_dict:
+                self.assertTrue(np.array_equal(
+                    imread(os.path.join(serial_path, f"{name}.png")),
+                    imread(os.path.join(parallel_path, f"{name}.png")),
+                ))
+
+if __name__ == '__main__':
+    unittest.main()
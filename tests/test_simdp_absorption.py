@@ -0,0 +1,89 @@
+"""!
+@file test_simdp_absorption.py
+@brief Unit test SimDP early termination on reaching the absorbing state.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(
+        initial_condition: dplvn.InitialCondition,
+        ic_values: tuple,
+        boundary_conditions: tuple=(dplvn.FLOATING,)*4,
+        bc_values: tuple=(0,)*4,
+    ) -> dplvn.SimDP:
+    # Strongly subcritical, so that the density field soon dies out
+    return dplvn.SimDP(
+        linear=0.1, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=30, 
+        dx=1, dt=0.1,
+        random_seed=1,
+        grid_dimension=dplvn.D2,
+        grid_size=(10, 5,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+        boundary_conditions=boundary_conditions,
+        bc_values=bc_values,
+        initial_condition=initial_condition,
+        ic_values=ic_values,
+    )
+
+def run_sim(sim: dplvn.SimDP, n_segments: int) -> tuple[NDArray, NDArray]:
+    sim.initialize(5)
+    n_segment_epochs: int = (sim.get_n_epochs()-1) // n_segments
+    for _ in range(n_segments):
+        assert sim.run(n_segment_epochs)
+    sim.postprocess()
+    return (
+        np.round(np.array(sim.get_t_epochs()), 5), 
+        np.array(sim.get_mean_densities()),
+    )
+
+class TestAbsorptionSimDP(unittest.TestCase):
+
+    def test_absorption(self):
+        sim: dplvn.SimDP = instantiate_sim(dplvn.RANDOM_UNIFORM, (0, 1,))
+        (t_epochs, mean_densities,) = run_sim(sim, 10)
+        self.assertTrue(sim.get_is_absorbed())
+        t_absorption: float = sim.get_t_absorption()
+        i_absorption: int = int(np.argmin(np.abs(t_epochs-t_absorption)))
+        self.assertTrue(0<t_absorption<30)
+        self.assertTrue(np.all(mean_densities[:i_absorption]>0))
+        self.assertTrue(np.all(mean_densities[i_absorption:]==0))
+        self.assertEqual(sim.get_i_current_epoch(), sim.get_n_epochs()-1)
+        self.assertEqual(t_epochs[-1], 30.0)
+        self.assertTrue(np.allclose(np.diff(t_epochs), 0.1))
+        # The time series are identical however the run is segmented
+        (t_epochs_, mean_densities_,) = run_sim(
+            instantiate_sim(dplvn.RANDOM_UNIFORM, (0, 1,)), 300
+        )
+        self.assertTrue(np.array_equal(t_epochs, t_epochs_))
+        self.assertTrue(np.array_equal(mean_densities, mean_densities_))
+
+    def test_absorbed_initially(self):
+        sim: dplvn.SimDP = instantiate_sim(dplvn.CONSTANT_VALUE, (0,))
+        (_, mean_densities,) = run_sim(sim, 10)
+        self.assertTrue(sim.get_is_absorbed())
+        self.assertEqual(sim.get_t_absorption(), 0)
+        self.assertTrue(np.all(mean_densities==0))
+
+    def test_boundary_source(self):
+        sim: dplvn.SimDP = instantiate_sim(
+            dplvn.CONSTANT_VALUE, (0,), 
+            boundary_conditions=(dplvn.FIXED_VALUE,)+(dplvn.FLOATING,)*3,
+            bc_values=(1, 0, 0, 0,),
+        )
+        (_, mean_densities,) = run_sim(sim, 10)
+        self.assertFalse(sim.get_is_absorbed())
+        self.assertTrue(np.isnan(sim.get_t_absorption()))
+        self.assertTrue(np.all(mean_densities[1:]>0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""!
+@file test_simdp_active_set.py
+@brief Unit test SimDP integration restricted to the active set of grid blocks.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(
+        grid_dimension: dplvn.GridDimension, 
+        grid_size: tuple,
+        grid_topologies: tuple,
+        boundary_conditions: tuple,
+        bc_values: tuple,
+        ic_values: tuple,
+        integration_method: dplvn.IntegrationMethod,
+        do_active_set: bool,
+    ) -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=1.0, quadratic=1.0, diffusion=0.5, noise=1.0, 
+        t_final=5, 
+        dx=1, dt=0.1,
+        random_seed=4,
+        grid_dimension=grid_dimension,
+        grid_size=grid_size,
+        grid_topologies=grid_topologies,
+        boundary_conditions=boundary_conditions,
+        bc_values=bc_values,
+        initial_condition=dplvn.SINGLE_SEED,
+        ic_values=ic_values,
+        integration_method=integration_method,
+        n_threads=2,
+        do_active_set=do_active_set,
+        do_snapshot_grid=True,
+    )
+
+def run_sim(sim: dplvn.SimDP) -> tuple[NDArray, NDArray]:
+    sim.initialize(5)
+    sim.run(sim.get_n_epochs()-1)
+    sim.postprocess()
+    return (
+        np.array(sim.get_mean_densities()), np.array(sim.get_density()),
+    )
+
+class TestActiveSetSimDP(unittest.TestCase):
+
+    def test_matches_full_grid(self):
+        F: dplvn.BoundaryCondition = dplvn.FLOATING
+        setups: tuple = (
+            (dplvn.D1, (400,), (dplvn.PERIODIC,), (F, F,), (0, 0,), 
+                (5, 5,),),
+            (dplvn.D2, (90, 60,), (dplvn.PERIODIC, dplvn.PERIODIC,), 
+                (F,)*4, (0,)*4, (5, 3, 2,),),
+            (dplvn.D2, (90, 60,), (dplvn.BOUNDED, dplvn.PERIODIC,), 
+                (F,)*4, (0,)*4, (5, 45, 30,),),
+            (dplvn.D2, (40, 30,), (dplvn.BOUNDED, dplvn.PERIODIC,), 
+                (dplvn.FIXED_VALUE, F, F, F,), (0.5, 0, 0, 0,), 
+                (5, 20, 15,),),
+        )
+        for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+            for setup in setups:
+                (mean_densities, density,) = run_sim(
+                    instantiate_sim(*setup, integration_method, False)
+                )
+                (mean_densities_, density_,) = run_sim(
+                    instantiate_sim(*setup, integration_method, True)
+                )
+                self.assertTrue(np.any(density>0))
+                self.assertTrue(np.array_equal(mean_densities, mean_densities_))
+                self.assertTrue(np.array_equal(density, density_))
+
+if __name__ == '__main__':
+    unittest.main()
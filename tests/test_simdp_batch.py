@@ -0,0 +1,119 @@
+"""!
+@file test_simdp_batch.py
+@brief Unit test batched multi-replica SimDPBatch integration.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+common_kwargs: dict = dict(
+    quadratic=1.0, diffusion=0.04, noise=1.0, 
+    t_final=2, 
+    dx=1, dt=0.1,
+    grid_dimension=dplvn.D2,
+    grid_size=(13, 9,),
+    grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+    boundary_conditions=(dplvn.FLOATING,)*4,
+    bc_values=(0,)*4,
+    initial_condition=dplvn.RANDOM_UNIFORM,
+    ic_values=(0, 3,),
+    do_snapshot_grid=True,
+)
+
+def run_sim(sim: dplvn.SimDP | dplvn.SimDPBatch) -> tuple[NDArray, NDArray]:
+    sim.initialize(5)
+    sim.run(sim.get_n_epochs()-1)
+    sim.postprocess()
+    return (
+        np.array(sim.get_mean_densities()), np.array(sim.get_density()),
+    )
+
+class TestBatchSimDP(unittest.TestCase):
+
+    def test_batch_matches_single_replicas(self):
+        random_seeds: tuple = (1, 7, 42,)
+        linears: tuple = (1.1895, 1.0, 1.5,)
+        for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+            for rng in (dplvn.MERSENNE_TWISTER, dplvn.PHILOX,):
+                batch = dplvn.SimDPBatch(
+                    random_seeds=random_seeds, linears=linears, 
+                    integration_method=integration_method, rng=rng, 
+                    **common_kwargs
+                )
+                (mean_densities, density,) = run_sim(batch)
+                self.assertEqual(
+                    mean_densities.shape, (3, batch.get_n_epochs(),)
+                )
+                self.assertEqual(density.shape, (3, 13, 9,))
+                for r in range(3):
+                    (mean_densities_, density_,) = run_sim(dplvn.SimDP(
+                        linear=linears[r], random_seed=random_seeds[r],
+                        integration_method=integration_method, rng=rng, 
+                        **common_kwargs
+                    ))
+                    # Grid-mean sums may be vectorized differently
+                    self.assertTrue(np.allclose(
+                        mean_densities[r], mean_densities_, rtol=1e-14, atol=0
+                    ))
+                    self.assertTrue(np.array_equal(density[r], density_))
+
+    def test_batch_shared_linear(self):
+        batch = dplvn.SimDPBatch(
+            linear=1.1895, random_seeds=(1, 2, 3, 4,), **common_kwargs
+        )
+        (mean_densities, _,) = run_sim(batch)
+        self.assertEqual(batch.get_n_replicas(), 4)
+        # Replicas with different seeds must differ
+        self.assertFalse(np.array_equal(mean_densities[0], mean_densities[1]))
+        self.assertTrue(np.all(np.isnan(batch.get_t_absorptions())))
+
+    def test_batch_absorption(self):
+        kwargs: dict = common_kwargs | dict(ic_values=(0, 0.1,), t_final=30)
+        batch = dplvn.SimDPBatch(
+            random_seeds=(1, 2,), linears=(0.1, 1.1895,), **kwargs
+        )
+        (mean_densities, _,) = run_sim(batch)
+        t_absorptions: NDArray = np.array(batch.get_t_absorptions())
+        t_epochs: NDArray = np.array(batch.get_t_epochs())
+        # The subcritical replica dies out, while the other survives
+        self.assertTrue(0<t_absorptions[0]<30)
+        self.assertTrue(np.isnan(t_absorptions[1]))
+        self.assertTrue(np.all(mean_densities[0][t_epochs>=t_absorptions[0]]==0))
+        self.assertTrue(np.all(mean_densities[1]>0))
+
+    def test_batch_views(self):
+        batch = dplvn.SimDPBatch(random_seeds=(1, 2, 3,), **common_kwargs)
+        # Nothing to view until the batch is initialized
+        self.assertEqual(batch.get_t_epochs().shape, (0,))
+        self.assertEqual(batch.get_mean_densities().shape, (3, 0,))
+        batch.initialize(5)
+        density: NDArray = batch.get_density()
+        mean_densities: NDArray = batch.get_mean_densities()
+        self.assertFalse(density.flags.writeable)
+        self.assertFalse(mean_densities.flags.writeable)
+        batch.run(batch.get_n_epochs()-1)
+        batch.postprocess()
+        # The views follow the sims without any further fetching
+        self.assertTrue(np.array_equal(
+            mean_densities, batch.get_mean_densities(copy=True)
+        ))
+        self.assertTrue(np.array_equal(density, batch.get_density(copy=True)))
+        for r in range(3):
+            self.assertAlmostEqual(np.mean(density[r]), mean_densities[r, -1])
+
+    def test_batch_bad_linears(self):
+        batch = dplvn.SimDPBatch(
+            random_seeds=(1, 2,), linears=(1.0,), **common_kwargs
+        )
+        self.assertFalse(batch.initialize(5))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+"""!
+@file test_simdp_checkpoint.py
+@brief Unit test checkpoint & restart of SimDP runs.
+"""
+
+import unittest
+import tempfile
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+from langevin.dp.simulation import Simulation
+
+def sim_parameters(
+        integration_method: dplvn.IntegrationMethod=dplvn.RUNGE_KUTTA,
+        rng: dplvn.RandomGenerator=dplvn.MERSENNE_TWISTER,
+        n_threads: int=1,
+        do_active_set: bool=False,
+    ) -> dict:
+    return dict(
+        linear=5.0, quadratic=1.0, diffusion=0.1, noise=1.0,
+        t_final=4,
+        dx=1, dt=0.1,
+        random_seed=3,
+        grid_dimension=dplvn.D2,
+        grid_size=(70, 40,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.SINGLE_SEED,
+        ic_values=(5, 35, 20,),
+        integration_method=integration_method,
+        rng=rng,
+        n_threads=n_threads,
+        do_active_set=do_active_set,
+    )
+
+def results(sim: dplvn.SimDP) -> tuple[NDArray, NDArray, NDArray]:
+    return (
+        sim.get_t_epochs(copy=True),
+        sim.get_mean_densities(copy=True),
+        sim.get_density(copy=True),
+    )
+
+class Interruption(Exception):
+    pass
+
+class InterruptedSimDP:
+    """
+    Stand-in for a `dplvn.SimDP` whose run is interrupted after a few segments.
+    """
+    def __init__(self, sim: dplvn.SimDP, n_runs: int) -> None:
+        self.sim = sim
+        self.n_runs = n_runs
+
+    def __getattr__(self, name: str):
+        return getattr(self.sim, name)
+
+    def run(self, n_next_epochs: int) -> bool:
+        if self.n_runs==0:
+            raise Interruption()
+        self.n_runs -= 1
+        return self.sim.run(n_next_epochs)
+
+class TestCheckpointSimDP(unittest.TestCase):
+
+    def test_restart_is_bit_identical(self):
+        setups: tuple = (
+            dict(),
+            dict(integration_method=dplvn.EULER),
+            dict(rng=dplvn.PHILOX),
+            dict(n_threads=3, do_active_set=True),
+        )
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            checkpoint_file: str = os.path.join(checkpoint_dir, "sim.bin")
+            for setup_ in setups:
+                uninterrupted = dplvn.SimDP(**sim_parameters(**setup_))
+                uninterrupted.initialize(5)
+                uninterrupted.run(40)
+                # Checkpoint half way, and carry on regardless
+                interrupted = dplvn.SimDP(**sim_parameters(**setup_))
+                interrupted.initialize(5)
+                interrupted.run(15)
+                self.assertTrue(interrupted.checkpoint(checkpoint_file))
+                interrupted.run(25)
+                restarted = dplvn.SimDP(**sim_parameters(**setup_))
+                self.assertTrue(restarted.restore(checkpoint_file))
+                self.assertEqual(restarted.get_i_next_epoch(), 16)
+                restarted.run(25)
+                self.assertFalse(restarted.get_is_absorbed())
+                for results_ in (results(interrupted), results(restarted)):
+                    for (expected_, result_) in zip(
+                        results(uninterrupted), results_
+                    ):
+                        self.assertTrue(np.array_equal(expected_, result_))
+
+    def test_mismatched_restore(self):
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            checkpoint_file: str = os.path.join(checkpoint_dir, "sim.bin")
+            sim = dplvn.SimDP(**sim_parameters())
+            self.assertFalse(sim.checkpoint(checkpoint_file))
+            sim.initialize(5)
+            sim.run(5)
+            self.assertTrue(sim.checkpoint(checkpoint_file))
+            # Different number of threads, hence of RNG streams
+            other_sim = dplvn.SimDP(**sim_parameters(n_threads=2))
+            self.assertFalse(other_sim.restore(checkpoint_file))
+            # A failed restore doesn't initialize a fresh sim...
+            self.assertFalse(other_sim.get_is_initialized())
+            self.assertEqual(other_sim.get_n_epochs(), 0)
+            # ... and leaves a part-run sim as it was
+            other_sim.initialize(5)
+            other_sim.run(2)
+            before: tuple = results(other_sim)
+            self.assertFalse(other_sim.restore(checkpoint_file))
+            self.assertEqual(other_sim.get_i_next_epoch(), 3)
+            for (expected_, result_) in zip(before, results(other_sim)):
+                self.assertTrue(np.array_equal(expected_, result_))
+            # Truncated: the record is cut short within the integrator state
+            with open(checkpoint_file, "rb") as file:
+                state: bytes = file.read()
+            with open(checkpoint_file, "wb") as file:
+                file.write(state[:-100])
+            fresh_sim = dplvn.SimDP(**sim_parameters())
+            self.assertFalse(fresh_sim.restore(checkpoint_file))
+            self.assertFalse(fresh_sim.get_is_initialized())
+            with open(checkpoint_file, "wb") as file:
+                file.write(b"not a checkpoint")
+            self.assertFalse(sim.restore(checkpoint_file))
+            self.assertFalse(
+                sim.restore(os.path.join(checkpoint_dir, "missing.bin"))
+            )
+
+    def test_simulation_resumes_from_checkpoint(self):
+        def simulation(data_dir: str) -> Simulation:
+            info: dict = {
+                "Parameters": sim_parameters(),
+                "Analysis": {},
+                "Misc": {
+                    "n_round_Δt_summation": 5, "n_segments": 8,
+                    "n_checkpoint_segments": 2, "do_stream_snapshots": True,
+                },
+            }
+            return Simulation(
+                name="Checkpoint", path=[data_dir], info=info,
+                do_snapshot_grid=True, do_verbose=False,
+            )
+        with tempfile.TemporaryDirectory() as data_dir:
+            uninterrupted: Simulation = simulation(data_dir)
+            uninterrupted.initialize()
+            uninterrupted.run()
+            expected: tuple = (
+                uninterrupted.t_epochs, uninterrupted.mean_densities,
+                {t_: np.array(uninterrupted.density_dict[t_])
+                 for t_ in uninterrupted.density_dict}
+            )
+            del uninterrupted
+            interrupted: Simulation = simulation(data_dir)
+            interrupted.initialize()
+            interrupted.sim = InterruptedSimDP(interrupted.sim, 5)
+            with self.assertRaises(Interruption):
+                interrupted.run()
+            checkpoint_files: tuple = interrupted.checkpoint_file_names()
+            self.assertTrue(all(map(os.path.isfile, checkpoint_files)))
+            restarted: Simulation = simulation(data_dir)
+            restarted.initialize()
+            restarted.run()
+            self.assertTrue(np.array_equal(restarted.t_epochs, expected[0]))
+            self.assertTrue(
+                np.array_equal(restarted.mean_densities, expected[1])
+            )
+            self.assertEqual(list(restarted.density_dict), list(expected[2]))
+            for t_, density_ in expected[2].items():
+                self.assertTrue(
+                    np.array_equal(restarted.density_dict[t_], density_)
+                )
+            self.assertFalse(any(map(os.path.isfile, checkpoint_files)))
+            del restarted
+
+if __name__ == '__main__':
+    unittest.main()
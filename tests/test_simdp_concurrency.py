@@ -0,0 +1,86 @@
+"""!
+@file test_simdp_concurrency.py
+@brief Unit test concurrent SimDP runs from Python threads.
+"""
+
+import unittest
+import threading
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(random_seed: int, t_final: float=2) -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=t_final, 
+        dx=1, dt=0.1,
+        random_seed=random_seed,
+        grid_dimension=dplvn.D2,
+        grid_size=(40, 30,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+        do_snapshot_grid=True,
+    )
+
+def run_sim(sim: dplvn.SimDP) -> tuple[NDArray, NDArray]:
+    sim.initialize(5)
+    sim.run(sim.get_n_epochs()-1)
+    sim.postprocess()
+    return (
+        np.array(sim.get_mean_densities()), np.array(sim.get_density()),
+    )
+
+class TestConcurrencySimDP(unittest.TestCase):
+
+    def test_concurrent_runs_match_serial_runs(self):
+        random_seeds: range = range(1, 9)
+        serial_results: list = [
+            run_sim(instantiate_sim(seed_)) for seed_ in random_seeds
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded_results: list = list(executor.map(
+                run_sim, [instantiate_sim(seed_) for seed_ in random_seeds]
+            ))
+        for (serial_, threaded_,) in zip(serial_results, threaded_results):
+            self.assertTrue(np.array_equal(serial_[0], threaded_[0]))
+            self.assertTrue(np.array_equal(serial_[1], threaded_[1]))
+
+    def test_run_releases_gil(self):
+        sim: dplvn.SimDP = instantiate_sim(1, t_final=100)
+        sim.initialize(5)
+        t_run: list[float] = []
+        def run() -> None:
+            t_run.append(perf_counter())
+            sim.run(sim.get_n_epochs()-1)
+            t_run.append(perf_counter())
+        # Record when this thread gets to run Python code: were the GIL 
+        # held throughout the integration, it would only do so briefly, 
+        # before the integration started
+        t_counts: list[float] = []
+        thread = threading.Thread(target=run)
+        thread.start()
+        while thread.is_alive():
+            t_counts.append(perf_counter())
+        thread.join()
+        t_counts_during_run: list[float] = [
+            t_ for t_ in t_counts if t_run[0]<t_<t_run[1]
+        ]
+        self.assertGreater(len(t_counts_during_run), 0)
+        self.assertGreater(
+            t_counts_during_run[-1]-t_counts_during_run[0], 
+            0.5*(t_run[1]-t_run[0])
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""!
+@file test_simdp_observables.py
+@brief Unit test per-epoch grid observables recorded by SimDP.
+"""
+
+import unittest
+import math
+import pickle
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+all_observables: list = [
+    dplvn.MEAN_SQUARED_DENSITY, dplvn.ACTIVE_FRACTION, 
+    dplvn.SURVIVAL, dplvn.MAX_DENSITY,
+]
+
+def instantiate_sim(
+        observables: list,
+        linear: float=1.5,
+        rng: dplvn.RandomGenerator=dplvn.MERSENNE_TWISTER,
+        n_threads: int=1,
+        do_active_set: bool=False,
+    ) -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=linear, quadratic=1.0, diffusion=0.1, noise=1.0,
+        t_final=3,
+        dx=1, dt=0.1,
+        random_seed=2,
+        grid_dimension=dplvn.D2,
+        grid_size=(80, 40,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.SINGLE_SEED,
+        ic_values=(5, 40, 20,),
+        rng=rng,
+        n_threads=n_threads,
+        do_active_set=do_active_set,
+        observables=observables,
+    )
+
+def grid_observables(density: NDArray) -> tuple:
+    return (
+        np.mean(density**2), np.mean(density>0), 
+        float(np.any(density>0)), np.max(density),
+    )
+
+class TestObservablesSimDP(unittest.TestCase):
+
+    def test_match_grid_reductions(self):
+        for setup_ in (
+            dict(),
+            dict(rng=dplvn.PHILOX),
+            dict(n_threads=3, do_active_set=True),
+        ):
+            sim = instantiate_sim(all_observables, **setup_)
+            sim.initialize(5)
+            expected: list = [grid_observables(sim.get_density(copy=True))]
+            for _ in range(sim.get_n_epochs()-1):
+                sim.run(1)
+                expected.append(grid_observables(sim.get_density(copy=True)))
+            observables: NDArray = sim.get_observables()
+            self.assertEqual(observables.dtype.names, (
+                "mean_squared_density", "active_fraction", 
+                "survival", "max_density",
+            ))
+            self.assertEqual(observables.shape, (sim.get_n_epochs(),))
+            for (name_, expected_) in zip(
+                observables.dtype.names, np.array(expected).T
+            ):
+                self.assertTrue(np.allclose(
+                    observables[name_], expected_, rtol=1e-12, atol=0,
+                ))
+            self.assertTrue(np.all(observables["survival"]==1))
+
+    def test_mean_densities_unchanged(self):
+        results: list = []
+        for observables_ in ([], [dplvn.MAX_DENSITY, dplvn.SURVIVAL]):
+            sim = instantiate_sim(observables_)
+            sim.initialize(5)
+            sim.run(sim.get_n_epochs()-1)
+            results.append(sim.get_mean_densities(copy=True))
+        self.assertTrue(np.array_equal(results[0], results[1]))
+        # No observables requested, none recorded
+        self.assertEqual(sim.get_observables().shape, (sim.get_n_epochs(),))
+        empty_sim = instantiate_sim([])
+        empty_sim.initialize(5)
+        self.assertEqual(empty_sim.get_observables().size, 0)
+
+    def test_mean_densities_accurate(self):
+        for setup_ in (
+            dict(),
+            dict(rng=dplvn.PHILOX, n_threads=3, do_active_set=True),
+        ):
+            sim = instantiate_sim([], **setup_)
+            sim.initialize(5)
+            expected: list = []
+            for _ in range(sim.get_n_epochs()-1):
+                sim.run(1)
+                density: NDArray = sim.get_density(copy=True)
+                expected.append(math.fsum(density.ravel())/density.size)
+            self.assertTrue(np.allclose(
+                sim.get_mean_densities()[1:], expected, rtol=1e-14, atol=0,
+            ))
+
+    def test_absorption(self):
+        sim = instantiate_sim([dplvn.SURVIVAL, dplvn.ACTIVE_FRACTION], -3.0)
+        sim.initialize(5)
+        sim.run(sim.get_n_epochs()-1)
+        self.assertTrue(sim.get_is_absorbed())
+        survival: NDArray = sim.get_observables()["survival"]
+        i_absorption: int = int(np.argmin(survival))
+        self.assertTrue(np.all(survival[:i_absorption]==1))
+        self.assertTrue(np.all(survival[i_absorption:]==0))
+        self.assertTrue(np.all(
+            sim.get_observables()["active_fraction"][i_absorption:]==0
+        ))
+
+    def test_pickled(self):
+        sim = instantiate_sim([dplvn.MAX_DENSITY])
+        sim.initialize(5)
+        sim.run(10)
+        copied_sim = pickle.loads(pickle.dumps(sim))
+        sim.run(sim.get_n_epochs()-11)
+        copied_sim.run(copied_sim.get_n_epochs()-11)
+        self.assertTrue(np.array_equal(
+            sim.get_observables(), copied_sim.get_observables()
+        ))
+
+if __name__ == '__main__':
+    unittest.main()
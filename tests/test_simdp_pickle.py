@@ -0,0 +1,83 @@
+"""!
+@file test_simdp_pickle.py
+@brief Unit test pickling of SimDP instances.
+"""
+
+import unittest
+import pickle
+from multiprocessing import Pool
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(n_threads: int=1) -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=1.5, quadratic=1.0, diffusion=0.1, noise=1.0,
+        t_final=3,
+        dx=1, dt=0.1,
+        random_seed=7,
+        grid_dimension=dplvn.D2,
+        grid_size=(40, 25,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+        boundary_conditions=(dplvn.FLOATING,)*2 + (dplvn.FIXED_VALUE,)*2,
+        bc_values=(0, 0, 0.5, 0.5,),
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+        integration_method=dplvn.RUNGE_KUTTA,
+        n_threads=n_threads,
+    )
+
+def finish_run(sim: dplvn.SimDP) -> tuple[NDArray, NDArray]:
+    sim.run(sim.get_n_epochs()-sim.get_i_next_epoch())
+    return (sim.get_mean_densities(copy=True), sim.get_density(copy=True))
+
+class TestPickleSimDP(unittest.TestCase):
+
+    def test_round_trip(self):
+        for n_threads in (1, 2,):
+            sim = instantiate_sim(n_threads)
+            # An uninitialized sim pickles as its parameters alone
+            copied_sim = pickle.loads(pickle.dumps(sim))
+            copied_sim.initialize(5)
+            sim.initialize(5)
+            sim.run(10)
+            copied_sim.run(10)
+            self.assertTrue(np.array_equal(
+                sim.get_density(), copied_sim.get_density()
+            ))
+            # A part-run sim carries on just as the original
+            copied_sim = pickle.loads(pickle.dumps(sim))
+            self.assertEqual(copied_sim.get_i_next_epoch(), 11)
+            self.assertTrue(np.array_equal(
+                sim.get_t_epochs(), copied_sim.get_t_epochs()
+            ))
+            for (expected_, result_) in zip(
+                finish_run(sim), finish_run(copied_sim)
+            ):
+                self.assertTrue(np.array_equal(expected_, result_))
+
+    def test_grid_pickled_as_bytes(self):
+        sim = instantiate_sim()
+        sim.initialize(5)
+        n_bytes: int = len(pickle.dumps(sim))
+        self.assertLess(n_bytes, 2*8*(40*25 + 2*sim.get_n_epochs()) + 10000)
+
+    def test_workers(self):
+        sim = instantiate_sim()
+        sim.initialize(5)
+        sim.run(10)
+        with Pool(2) as pool:
+            worker_results: list = pool.map(finish_run, [sim]*2)
+        expected: tuple = finish_run(sim)
+        for results_ in worker_results:
+            for (expected_, result_) in zip(expected, results_):
+                self.assertTrue(np.array_equal(expected_, result_))
+
+if __name__ == '__main__':
+    unittest.main()
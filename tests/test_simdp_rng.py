@@ -0,0 +1,89 @@
+"""!
+@file test_simdp_rng.py
+@brief Unit test SimDP integration using the counter-based Philox RNG.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(
+        rng: dplvn.RandomGenerator,
+        integration_method: dplvn.IntegrationMethod,
+        n_threads: int,
+        random_seed: int=1,
+    ) -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=2, 
+        dx=1, dt=0.1,
+        random_seed=random_seed,
+        grid_dimension=dplvn.D2,
+        grid_size=(31, 17,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+        integration_method=integration_method,
+        rng=rng,
+        n_threads=n_threads,
+        do_snapshot_grid=True,
+    )
+
+def run_sim(sim: dplvn.SimDP) -> tuple[NDArray, NDArray]:
+    sim.initialize(5)
+    sim.run(sim.get_n_epochs()-1)
+    sim.postprocess()
+    return (
+        np.array(sim.get_mean_densities()), np.array(sim.get_density()),
+    )
+
+class TestRNGSimDP(unittest.TestCase):
+
+    def test_philox_independent_of_threads(self):
+        for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+            (mean_densities, density,) = run_sim(
+                instantiate_sim(dplvn.PHILOX, integration_method, 1)
+            )
+            self.assertTrue(np.all(density>=0))
+            for n_threads in (2, 3, 8,):
+                (mean_densities_, density_,) = run_sim(
+                    instantiate_sim(dplvn.PHILOX, integration_method, n_threads)
+                )
+                self.assertTrue(np.array_equal(mean_densities, mean_densities_))
+                self.assertTrue(np.array_equal(density, density_))
+
+    def test_philox_seed(self):
+        (_, density_1,) = run_sim(
+            instantiate_sim(dplvn.PHILOX, dplvn.RUNGE_KUTTA, 1, random_seed=1)
+        )
+        (_, density_2,) = run_sim(
+            instantiate_sim(dplvn.PHILOX, dplvn.RUNGE_KUTTA, 1, random_seed=2)
+        )
+        self.assertFalse(np.array_equal(density_1, density_2))
+
+    def test_philox_statistics(self):
+        # Same seed & initial condition, different noise: 
+        # grid means should agree statistically, not exactly
+        (mean_densities_mt, _,) = run_sim(
+            instantiate_sim(dplvn.MERSENNE_TWISTER, dplvn.RUNGE_KUTTA, 1)
+        )
+        (mean_densities_px, _,) = run_sim(
+            instantiate_sim(dplvn.PHILOX, dplvn.RUNGE_KUTTA, 1)
+        )
+        self.assertEqual(mean_densities_mt[0], mean_densities_px[0])
+        self.assertFalse(np.array_equal(mean_densities_mt, mean_densities_px))
+        self.assertTrue(np.allclose(
+            mean_densities_mt[-1], mean_densities_px[-1], rtol=0.2,
+        ))
+
+if __name__ == '__main__':
+    unittest.main()
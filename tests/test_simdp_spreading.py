@@ -0,0 +1,112 @@
+"""!
+@file test_simdp_spreading.py
+@brief Unit test spreading observables of SimDP runs from a single seed.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+spreading_observables: list = [
+    dplvn.TOTAL_MASS, dplvn.SURVIVAL, dplvn.SQUARED_RADIUS,
+]
+
+def instantiate_sim(
+        grid_dimension: dplvn.GridDimension=dplvn.D2,
+        initial_condition: dplvn.InitialCondition=dplvn.SINGLE_SEED,
+        n_threads: int=1,
+        do_active_set: bool=False,
+        ic_values: tuple | None=None,
+    ) -> dplvn.SimDP:
+    if grid_dimension==dplvn.D1:
+        grid: dict = dict(
+            grid_size=(150,),
+            grid_topologies=(dplvn.PERIODIC,),
+            boundary_conditions=(dplvn.FLOATING,)*2,
+            bc_values=(0,)*2,
+            ic_values=(5, 3,),
+        )
+    else:
+        grid = dict(
+            grid_size=(60, 40,),
+            grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+            boundary_conditions=(dplvn.FLOATING,)*4,
+            bc_values=(0,)*4,
+            ic_values=(5, 2, 20,),
+        )
+    if ic_values is not None:
+        grid["ic_values"] = ic_values
+    return dplvn.SimDP(
+        linear=5.0, quadratic=1.0, diffusion=0.2, noise=1.0,
+        t_final=3,
+        dx=0.5, dt=0.1,
+        random_seed=4,
+        grid_dimension=grid_dimension,
+        initial_condition=initial_condition,
+        n_threads=n_threads,
+        do_active_set=do_active_set,
+        observables=spreading_observables,
+        **grid,
+    )
+
+def spreading(density: NDArray, seed: tuple, dx: float) -> tuple:
+    # Seed-cell distances along each axis, wrapped along the periodic x-axis
+    n_x: int = density.shape[0]
+    r_x: NDArray = np.abs(np.arange(n_x)-seed[0])
+    r_x = np.minimum(r_x, n_x-r_x)
+    r_sq: NDArray = (r_x**2).astype(float)
+    if density.ndim==2:
+        r_y: NDArray = np.abs(np.arange(density.shape[1])-seed[1])
+        r_sq = r_sq[:,np.newaxis] + (r_y**2)[np.newaxis,:]
+    mass: float = np.sum(density)
+    return (
+        mass*dx**density.ndim, float(mass>0), 
+        np.sum(density*r_sq)*dx**2/mass if mass>0 else 0,
+    )
+
+class TestSpreadingSimDP(unittest.TestCase):
+
+    def test_match_grid_reductions(self):
+        for (setup_, seed_) in (
+            (dict(), (2, 20,)),
+            (dict(n_threads=3, do_active_set=True), (2, 20,)),
+            (dict(grid_dimension=dplvn.D1), (3,)),
+        ):
+            sim = instantiate_sim(**setup_)
+            self.assertTrue(sim.initialize(5))
+            density: NDArray = sim.get_density()
+            expected: list = [spreading(density.squeeze(), seed_, 0.5)]
+            for _ in range(sim.get_n_epochs()-1):
+                sim.run(1)
+                expected.append(spreading(density.squeeze(), seed_, 0.5))
+            self.assertFalse(sim.get_is_absorbed())
+            observables: NDArray = sim.get_observables()
+            self.assertEqual(
+                observables.dtype.names, 
+                ("total_mass", "survival", "squared_radius",)
+            )
+            for (name_, expected_) in zip(
+                observables.dtype.names, np.array(expected).T
+            ):
+                self.assertTrue(np.allclose(
+                    observables[name_], expected_, rtol=1e-12, atol=0,
+                ))
+            # The cloud starts at the seed, then spreads
+            self.assertEqual(observables["squared_radius"][0], 0)
+            self.assertTrue(np.all(observables["squared_radius"][1:]>0))
+
+    def test_needs_single_seed(self):
+        sim = instantiate_sim(
+            initial_condition=dplvn.RANDOM_UNIFORM, ic_values=(2, 5,),
+        )
+        self.assertFalse(sim.initialize(5))
+
+if __name__ == '__main__':
+    unittest.main()
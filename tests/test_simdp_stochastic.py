@@ -0,0 +1,63 @@
+"""!
+@file test_simdp_stochastic.py
+@brief Unit test statistics of the SimDP Poisson-gamma stochastic step.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def step_constant_grid(
+        density: float, linear: float, dt: float, rng: dplvn.RandomGenerator,
+    ) -> NDArray:
+    # With no diffusion and no quadratic term, only the stochastic step
+    # acts on the density grid
+    sim = dplvn.SimDP(
+        linear=linear, quadratic=0.0, diffusion=0.0, noise=1.0, 
+        t_final=dt, 
+        dx=1, dt=dt,
+        random_seed=1,
+        grid_dimension=dplvn.D2,
+        grid_size=(200, 200,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.PERIODIC,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.CONSTANT_VALUE,
+        ic_values=(density,),
+        integration_method=dplvn.EULER,
+        rng=rng,
+        do_snapshot_grid=True,
+    )
+    sim.initialize(5)
+    sim.run(1)
+    sim.postprocess()
+    return np.array(sim.get_density())
+
+class TestStochasticSimDP(unittest.TestCase):
+
+    def test_moments(self):
+        linear: float = 1.0
+        dt: float = 0.1
+        explcdt: float = np.exp(-linear*dt)
+        lambda_: float = 2*linear*explcdt/(1-explcdt)
+        for rng in (dplvn.MERSENNE_TWISTER, dplvn.PHILOX,):
+            # Small & large Poisson means: λρ/exp(-aΔt) ≈ 0.2, 2, 210
+            for density in (0.01, 0.1, 10.0,):
+                grid: NDArray = step_constant_grid(density, linear, dt, rng)
+                mean: float = density/explcdt
+                variance: float = 2*mean/lambda_
+                self.assertTrue(np.all(grid>=0))
+                self.assertLess(
+                    abs(np.mean(grid)-mean), 5*np.sqrt(variance/grid.size)
+                )
+                self.assertLess(abs(np.var(grid)/variance-1), 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""!
+@file test_simdp_threads.py
+@brief Unit test multithreaded SimDP integration.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(
+        grid_dimension: dplvn.GridDimension, 
+        grid_size: tuple,
+        integration_method: dplvn.IntegrationMethod,
+        n_threads: int,
+    ) -> dplvn.SimDP:
+    n_bcs: int = 2*len(grid_size)
+    return dplvn.SimDP(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=2, 
+        dx=1, dt=0.1,
+        random_seed=1,
+        grid_dimension=grid_dimension,
+        grid_size=grid_size,
+        grid_topologies=(dplvn.PERIODIC,)*len(grid_size),
+        boundary_conditions=(dplvn.FLOATING,)*n_bcs,
+        bc_values=(0,)*n_bcs,
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+        integration_method=integration_method,
+        n_threads=n_threads,
+        do_snapshot_grid=True,
+    )
+
+def run_sim(sim: dplvn.SimDP) -> tuple[NDArray, NDArray]:
+    sim.initialize(5)
+    sim.run(sim.get_n_epochs()-1)
+    sim.postprocess()
+    return (
+        np.array(sim.get_mean_densities()), np.array(sim.get_density()),
+    )
+
+class TestThreadsSimDP(unittest.TestCase):
+
+    def test_reproducible(self):
+        for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+            for (grid_dimension, grid_size,) in (
+                (dplvn.D1, (101,),), (dplvn.D2, (31, 17,),),
+            ):
+                results = [
+                    run_sim(instantiate_sim(
+                        grid_dimension, grid_size, integration_method, 4,
+                    ))
+                    for _ in range(2)
+                ]
+                self.assertTrue(np.array_equal(results[0][0], results[1][0]))
+                self.assertTrue(np.array_equal(results[0][1], results[1][1]))
+                self.assertTrue(np.all(results[0][1]>=0))
+
+    def test_more_threads_than_rows(self):
+        sim = instantiate_sim(dplvn.D2, (8, 3,), dplvn.RUNGE_KUTTA, 8)
+        (mean_densities, density,) = run_sim(sim)
+        self.assertTrue(np.allclose(np.mean(density), mean_densities[-1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+
+"""!
+@file test_simdp_topologies.py
+@brief Unit test SimDP integration across grid dimensions and topologies.
+"""
+
+import unittest
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim(
+        grid_dimension: dplvn.GridDimension, 
+        grid_size: tuple,
+        grid_topologies: tuple,
+        integration_method: dplvn.IntegrationMethod,
+    ) -> dplvn.SimDP:
+    n_bcs: int = 2*len(grid_size)
+    return dplvn.SimDP(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=1, 
+        dx=1, dt=0.1,
+        random_seed=1,
+        grid_dimension=grid_dimension,
+        grid_size=grid_size,
+        grid_topologies=grid_topologies,
+        boundary_conditions=(dplvn.FLOATING,)*n_bcs,
+        bc_values=(0,)*n_bcs,
+        integration_method=integration_method,
+        do_snapshot_grid=True,
+    )
+
+def run_sim(sim: dplvn.SimDP) -> tuple[bool, NDArray]:
+    if not sim.initialize(5):
+        return (False, np.empty([]),)
+    was_success: bool = sim.run(sim.get_n_epochs()-1)
+    was_success &= sim.postprocess()
+    return (was_success, np.array(sim.get_density()),)
+
+class TestTopologiesSimDP(unittest.TestCase):
+
+    def test_run_1d(self):
+        for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+            for grid_topology in (dplvn.BOUNDED, dplvn.PERIODIC,):
+                sim = instantiate_sim(
+                    dplvn.D1, (17,), (grid_topology,), integration_method,
+                )
+                (was_success, density,) = run_sim(sim)
+                self.assertTrue(was_success)
+                self.assertEqual(density.shape, (17, 1,))
+                self.assertTrue(np.all(density>=0))
+
+    def test_run_2d(self):
+        for integration_method in (dplvn.RUNGE_KUTTA, dplvn.EULER,):
+            for grid_topologies in (
+                (dplvn.BOUNDED, dplvn.BOUNDED,),
+                (dplvn.BOUNDED, dplvn.PERIODIC,),
+                (dplvn.PERIODIC, dplvn.BOUNDED,),
+                (dplvn.PERIODIC, dplvn.PERIODIC,),
+            ):
+                sim = instantiate_sim(
+                    dplvn.D2, (13, 9,), grid_topologies, integration_method,
+                )
+                (was_success, density,) = run_sim(sim)
+                self.assertTrue(was_success)
+                self.assertEqual(density.shape, (13, 9,))
+                self.assertTrue(np.all(density>=0))
+
+if __name__ == '__main__':
+    unittest.main()
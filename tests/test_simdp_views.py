@@ -0,0 +1,94 @@
+"""!
+@file test_simdp_views.py
+@brief Unit test zero-copy NumPy views of SimDP grid and time series.
+"""
+
+import unittest
+import gc
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+
+def instantiate_sim() -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=2, 
+        dx=1, dt=0.1,
+        random_seed=1,
+        grid_dimension=dplvn.D2,
+        grid_size=(13, 7,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+    )
+
+class TestViewsSimDP(unittest.TestCase):
+
+    def test_views_follow_sim(self):
+        sim: dplvn.SimDP = instantiate_sim()
+        sim.initialize(5)
+        density: NDArray = sim.get_density()
+        mean_densities: NDArray = sim.get_mean_densities()
+        t_epochs: NDArray = sim.get_t_epochs()
+        self.assertEqual(density.shape, (13, 7,))
+        for array_ in (density, mean_densities, t_epochs,):
+            self.assertFalse(array_.flags.writeable)
+            self.assertFalse(array_.flags.owndata)
+        # Successive fetches view the same buffer
+        self.assertTrue(np.shares_memory(density, sim.get_density()))
+        density_initial: NDArray = sim.get_density(copy=True)
+        t_epochs_initial: NDArray = sim.get_t_epochs(copy=True)
+        self.assertTrue(density_initial.flags.writeable)
+        self.assertTrue(density_initial.flags.c_contiguous)
+        self.assertFalse(np.shares_memory(density, density_initial))
+        sim.run(sim.get_n_epochs()-1)
+        sim.postprocess()
+        # The views now show the end state, unlike the copy
+        self.assertFalse(np.array_equal(density, density_initial))
+        self.assertTrue(np.array_equal(density, sim.get_density(copy=True)))
+        self.assertEqual(t_epochs[-1], sim.get_t_current_epoch())
+        # The epoch times were known before the run
+        self.assertTrue(np.array_equal(t_epochs, t_epochs_initial))
+        self.assertAlmostEqual(mean_densities[-1], np.mean(density))
+
+    def test_views_before_initialize(self):
+        sim: dplvn.SimDP = instantiate_sim()
+        self.assertEqual(sim.get_n_epochs(), 0)
+        self.assertEqual(sim.get_t_epochs().shape, (0,))
+        self.assertEqual(sim.get_mean_densities(copy=True).shape, (0,))
+        self.assertEqual(sim.get_observables().shape, (0,))
+        # The grid is allocated, though empty, on construction
+        self.assertFalse(np.any(sim.get_density()))
+        sim.initialize(5)
+        self.assertEqual(sim.get_t_epochs().shape, (sim.get_n_epochs(),))
+
+    def test_view_layout(self):
+        sim: dplvn.SimDP = instantiate_sim()
+        sim.initialize(5)
+        density: NDArray = sim.get_density()
+        # The density view is indexed (x, y), while cells are stored x-fastest
+        self.assertTrue(density.flags.f_contiguous)
+        mean_density: float = np.mean(density)
+        sim.run(1)
+        self.assertAlmostEqual(mean_density, sim.get_mean_densities()[0])
+
+    def test_view_keeps_sim_alive(self):
+        sim: dplvn.SimDP = instantiate_sim()
+        sim.initialize(5)
+        sim.run(sim.get_n_epochs()-1)
+        density: NDArray = sim.get_density()
+        density_: NDArray = density.copy()
+        del sim
+        gc.collect()
+        self.assertTrue(np.array_equal(density, density_))
+
+if __name__ == '__main__':
+    unittest.main()
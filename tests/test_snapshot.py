@@ -0,0 +1,85 @@
+"""!
+@file test_snapshot.py
+@brief Unit test streaming of density grid snapshots to a memory-mapped file.
+"""
+
+import unittest
+import tempfile
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+from langevin.base.snapshot import SnapshotReader, SnapshotWriter
+
+def instantiate_sim() -> dplvn.SimDP:
+    return dplvn.SimDP(
+        linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+        t_final=2, 
+        dx=1, dt=0.1,
+        random_seed=1,
+        grid_dimension=dplvn.D2,
+        grid_size=(13, 7,),
+        grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+        boundary_conditions=(dplvn.FLOATING,)*4,
+        bc_values=(0,)*4,
+        initial_condition=dplvn.RANDOM_UNIFORM,
+        ic_values=(0, 3,),
+    )
+
+def stream_sim(data_path: str, n_snapshots: int, dtype) -> dict:
+    sim: dplvn.SimDP = instantiate_sim()
+    sim.initialize(5)
+    writer = SnapshotWriter(
+        data_path, n_snapshots, sim.get_density().shape, dtype=dtype,
+    )
+    density_dict: dict[float, NDArray] = {}
+    for i_segment in range(n_snapshots):
+        if i_segment>0:
+            sim.run(5)
+        t_epoch: float = round(sim.get_t_current_epoch(), 5)
+        writer.write(t_epoch, sim.get_density())
+        density_dict[t_epoch] = sim.get_density(copy=True)
+    reader: SnapshotReader = writer.close()
+    return (density_dict, reader)
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_roundtrip(self):
+        with tempfile.TemporaryDirectory() as data_path:
+            density_dict, reader = stream_sim(data_path, 5, np.float64)
+            self.assertEqual(list(reader.keys()), list(density_dict.keys()))
+            for t_epoch, density in density_dict.items():
+                self.assertTrue(np.array_equal(reader[t_epoch], density))
+            reopened = SnapshotReader.from_path(data_path)
+            self.assertEqual(len(reopened), 5)
+            self.assertEqual(reopened.snapshots.shape, (5, 13, 7,))
+            del reader, reopened
+
+    def test_float32_partial(self):
+        with tempfile.TemporaryDirectory() as data_path:
+            writer = SnapshotWriter(data_path, 4, (13, 7,), dtype="float32",)
+            density: NDArray = np.random.default_rng(1).random((13, 7,))
+            writer.write(0.0, density)
+            writer.write(0.5, 2*density)
+            reader: SnapshotReader = writer.close()
+            self.assertEqual(len(reader), 2)
+            self.assertEqual(reader[0.5].dtype, np.float32)
+            self.assertTrue(np.allclose(reader[0.5], 2*density, rtol=1e-6))
+            self.assertEqual(np.load(writer.file_path).shape, (4, 13, 7,))
+            del reader
+
+    def test_overflow(self):
+        with tempfile.TemporaryDirectory() as data_path:
+            writer = SnapshotWriter(data_path, 1, (3, 2,))
+            writer.write(0.0, np.zeros((3, 2,)))
+            with self.assertRaises(IndexError):
+                writer.write(1.0, np.zeros((3, 2,)))
+            writer.close()
+
+if __name__ == '__main__':
+    unittest.main()
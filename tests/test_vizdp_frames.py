@@ -0,0 +1,104 @@
+"""!
+@file test_vizdp_frames.py
+@brief Unit test fast rendering of density snapshots into images & video frames.
+"""
+
+import unittest
+import tempfile
+import numpy as np
+from numpy.typing import NDArray
+import os
+import sys
+dp_dir = os.path.abspath("C:\\hostedtoolcache\\windows\\Python\\3.14.0\\x64\\Lib\\site-packages\\langevin\\dp")
+if sys.platform == "win32" and os.path.exists(dp_dir):
+    os.add_dll_directory(dp_dir)
+    sys.path.insert(0, dp_dir)
+from langevin.dp import dplvn # type: ignore
+from langevin.dp.vizdp import VizDP
+from langevin.base.file import export_images
+from matplotlib.image import imread
+
+parameters: dict = dict(
+    linear=1.1895, quadratic=1.0, diffusion=0.04, noise=1.0, 
+    t_final=2, 
+    dx=1, dt=0.1,
+    random_seed=1,
+    grid_dimension=dplvn.D2,
+    grid_size=(40, 30,),
+    grid_topologies=(dplvn.PERIODIC, dplvn.BOUNDED,),
+    boundary_conditions=(dplvn.FLOATING,)*4,
+    bc_values=(0,)*4,
+)
+analysis: dict = dict(a_c=1.18857)
+
+class TestFramesVizDP(unittest.TestCase):
+
+    def test_color_lut(self):
+        viz = VizDP()
+        color_lut: NDArray = viz.make_color_lut("plasma", 1000)
+        self.assertEqual(color_lut.shape, (1000, 3,))
+        self.assertEqual(color_lut.dtype, np.uint8)
+        # Gray absorbing phase, composited over white
+        self.assertTrue(np.all(color_lut[0]==color_lut[0][0]))
+        self.assertTrue(np.all(color_lut[0]>220))
+        indexes: NDArray = viz.map_density_colors(
+            np.array([0, 0.0004, 0.0005, 0.25, 0.5, 7]), 1000, 0.5,
+        )
+        self.assertEqual(indexes.tolist(), [0, 0, 1, 500, 999, 999])
+
+    def test_frames(self):
+        viz = VizDP()
+        render_frame = viz.density_frame_renderer(
+            parameters, analysis, 100, density_max=1, tick_Δρ=0.5,
+        )
+        density: NDArray = np.zeros(parameters["grid_size"])
+        frame0: NDArray = render_frame(0, density)
+        self.assertEqual(frame0.dtype, np.uint8)
+        self.assertEqual(frame0.ndim, 3)
+        self.assertEqual(frame0.shape[2], 3)
+        self.assertEqual(len(viz.fdict), 0)
+        # Uniform density: the image is one solid color in the middle
+        color_lut: NDArray = viz.make_color_lut("plasma", 1000)
+        frame1: NDArray = render_frame(100, density+0.5)
+        self.assertEqual(frame1.shape, frame0.shape)
+        (n_rows, n_columns, _,) = frame1.shape
+        self.assertTrue(np.all(
+            frame1[n_rows//2, n_columns//2-20:n_columns//2]==color_lut[500]
+        ))
+        self.assertTrue(np.all(
+            frame0[n_rows//2, n_columns//2-20:n_columns//2]==color_lut[0]
+        ))
+        # The title differs between time slices
+        self.assertTrue(np.any(frame0[:n_rows//8]!=frame1[:n_rows//8]))
+
+    def test_images(self):
+        viz = VizDP()
+        color_lut: NDArray = viz.make_color_lut(do_alpha=True)
+        self.assertEqual(color_lut.shape, (1000, 4,))
+        self.assertTrue(color_lut[0][3]<255)
+        self.assertTrue(np.all(color_lut[1:,3]==255))
+        density: NDArray = np.zeros(parameters["grid_size"])
+        density[1, 2] = 3
+        image: NDArray = viz.render_density_image(
+            "ρ_t0", parameters, density, color_lut, density_max=1, scale=2,
+        )
+        # Grid (x, y) → image rows from the top (y), columns (x)
+        self.assertEqual(image.shape, (30*2, 40*2, 4,))
+        self.assertTrue(np.all(image[-6:-4, 2:4]==color_lut[-1]))
+        self.assertTrue(np.all(image[:-6]==color_lut[0]))
+        self.assertIs(viz.idict["ρ_t0"], image)
+        # Periodic in x only: extended by max(n_x//5, 10) columns
+        extended: NDArray = viz.render_density_image(
+            "ρ_t1", parameters, density, color_lut, 
+            density_max=1, do_extend_if_periodic=True,
+        )
+        self.assertEqual(extended.shape, (30, 40+10, 4,))
+        with tempfile.TemporaryDirectory() as images_path:
+            export_images(viz.idict, images_path)
+            self.assertTrue(np.array_equal(
+                np.round(imread(os.path.join(images_path, "ρ_t0.png"))*255),
+                image,
+            ))
+
+if __name__ == '__main__':
+    unittest.main()